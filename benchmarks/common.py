@@ -0,0 +1,81 @@
+from collections.abc import Callable
+import random
+import time
+
+from kepler import io
+from kepler.types import *
+
+def generate_problem_json(
+    student_count: int,
+    courses_per_year: int = 10,
+    years: int = 3,
+    seed: int = 0) -> dict[str, object]:
+
+    rng = random.Random(seed)
+    days = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday']
+    shift_counts = {'T': 1, 'TP': 3, 'PL': 6}
+
+    courses_json: list[dict[str, object]] = []
+    for year in range(1, years + 1):
+        for i in range(courses_per_year):
+            shifts_json: list[dict[str, object]] = []
+
+            for shift_type, count in shift_counts.items():
+                for number in range(1, count + 1):
+                    hour = rng.randrange(8, 18)
+                    shifts_json.append({
+                        'type': shift_type,
+                        'number': number,
+                        'capacity': student_count // (courses_per_year * count) + 1,
+                        'timeslots': [{
+                            'day': rng.choice(days),
+                            'start': f'{hour:02}:00',
+                            'end': f'{hour + 2:02}:00'
+                        }]
+                    })
+
+            courses_json.append({'id': f'Y{year}C{i}', 'year': year, 'shifts': shifts_json})
+
+    students_json: list[dict[str, object]] = []
+    for i in range(student_count):
+        year = rng.randrange(1, years + 1)
+        enrollments = rng.sample(range(courses_per_year), courses_per_year // 2)
+        student_json: dict[str, object] = {
+            'number': f'A{i}',
+            'year': year,
+            'enrollments': [f'Y{year}C{course}' for course in enrollments]
+        }
+
+        if rng.random() < 0.2:
+            student_json['schedule'] = [{
+                'course': f'Y{year}C{enrollments[0]}',
+                'shift_type': 'PL',
+                'shift_number': rng.randrange(1, shift_counts['PL'] + 1)
+            }]
+
+        students_json.append(student_json)
+
+    return {'courses': courses_json, 'students': students_json}
+
+def generate_problem(student_count: int) -> SchedulingProblem:
+    return io.import_json_problem_object(generate_problem_json(student_count))
+
+def generate_solution(problem: SchedulingProblem) -> SchedulingProblemSolution:
+    final_schedules: dict[str, Schedule] = {}
+    for student in problem.students.values():
+        chosen_shifts: dict[tuple[str, ShiftType], tuple[Course, Shift]] = {}
+        for course, shift in sorted(student.list_possible_shifts()):
+            chosen_shifts.setdefault((course.id, shift.type), (course, shift))
+
+        final_schedules[student.number] = Schedule.interned(chosen_shifts.values())
+
+    return SchedulingProblemSolution(problem, final_schedules)
+
+def measure(function: Callable[[], object], repetitions: int = 5) -> float:
+    best = float('inf')
+    for _ in range(repetitions):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+
+    return best
@@ -0,0 +1,27 @@
+import io
+import json
+import sys
+
+from kepler.io import export_json_solution_object, export_json_solution_stream
+
+from .common import generate_problem, generate_solution, measure
+
+def main() -> None:
+    student_count = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+
+    problem = generate_problem(student_count)
+    solution = generate_solution(problem)
+    distinct_schedules = len({id(schedule) for schedule in solution.final_schedules.values()})
+
+    def export_stream() -> object:
+        stream = io.StringIO()
+        export_json_solution_stream(stream, solution)
+        return stream
+
+    print(f'{student_count} students ({distinct_schedules} distinct schedules)')
+    object_time = measure(lambda: json.dumps(export_json_solution_object(solution)))
+    print(f'  json.dumps(object): {object_time:.4f} s')
+    print(f'  stream:             {measure(export_stream):.4f} s')
+
+if __name__ == '__main__':
+    main()
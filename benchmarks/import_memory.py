@@ -0,0 +1,78 @@
+from collections.abc import Callable
+import csv
+import json
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+import typing
+
+from kepler import io
+
+from .common import generate_problem_json
+
+def measure_memory(function: Callable[[], object]) -> tuple[float, int, int]:
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = function()
+    elapsed = time.perf_counter() - start
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    del result
+    return elapsed, current, peak
+
+def main() -> None:
+    student_count = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+
+    with tempfile.TemporaryDirectory() as directory:
+        problem_json = typing.cast(dict[str, list[dict[str, typing.Any]]],
+                                   generate_problem_json(student_count))
+
+        path = os.path.join(directory, 'problem.json')
+        with open(path, mode='w', encoding='utf-8') as f:
+            json.dump(problem_json, f)
+
+        catalog_path = os.path.join(directory, 'catalog.json')
+        with open(catalog_path, mode='w', encoding='utf-8') as f:
+            json.dump(problem_json['courses'], f)
+
+        ndjson_path = os.path.join(directory, 'students.ndjson')
+        with open(ndjson_path, mode='w', encoding='utf-8') as f:
+            for student_json in problem_json['students']:
+                f.write(json.dumps(student_json) + '\n')
+
+        csv_path = os.path.join(directory, 'students.csv')
+        with open(csv_path, mode='w', encoding='utf-8', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(['number', 'year', 'enrollments', 'schedule'])
+            for student_json in problem_json['students']:
+                writer.writerow([
+                    student_json['number'],
+                    student_json['year'],
+                    ';'.join(student_json['enrollments']),
+                    ';'.join(
+                        f'{shift["course"]}:{shift["shift_type"]}{shift["shift_number"]}'
+                        for shift in student_json.get('schedule', [])
+                    )
+                ])
+
+        del problem_json
+
+        def load_whole() -> object:
+            with open(path, mode='r', encoding='utf-8') as f:
+                return io.import_json_problem_object(json.load(f))
+
+        print(f'{student_count} students ({os.path.getsize(path)} bytes)')
+        for name, function in [
+            ('json.load', load_whole),
+            ('streaming', lambda: io.import_json_problem_file(path)),
+            ('ndjson', lambda: io.import_ndjson_problem_file(catalog_path, ndjson_path)),
+            ('csv', lambda: io.import_csv_problem_file(catalog_path, csv_path))
+        ]:
+            elapsed, current, peak = measure_memory(function)
+            print(f'  {name:<10} {elapsed:.4f} s, result {current >> 10} KiB, peak {peak >> 10} KiB')
+
+if __name__ == '__main__':
+    main()
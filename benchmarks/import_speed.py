@@ -0,0 +1,31 @@
+import json
+import os
+import sys
+import tempfile
+
+from kepler import io
+
+from .common import generate_problem_json, measure
+
+def main() -> None:
+    student_count = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+
+    with tempfile.TemporaryDirectory() as directory:
+        problem_json = generate_problem_json(student_count)
+        problem_string = json.dumps(problem_json)
+
+        path = os.path.join(directory, 'problem.json')
+        with open(path, mode='w', encoding='utf-8') as f:
+            f.write(problem_string)
+
+        print(f'{student_count} students ({len(problem_string)} bytes)')
+        for name, function in [
+            ('json.loads only', lambda: json.loads(problem_string)),
+            ('object', lambda: io.import_json_problem_object(problem_json)),
+            ('string', lambda: io.import_json_problem_string(problem_string)),
+            ('file', lambda: io.import_json_problem_file(path))
+        ]:
+            print(f'  {name:<16} {measure(function, 20):.4f} s')
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,25 @@
+import json
+import os
+import sys
+
+from kepler import io
+
+from .common import generate_problem_json, measure
+
+def main() -> None:
+    student_count = int(sys.argv[1]) if len(sys.argv) > 1 else 50000
+    processes = int(sys.argv[2]) if len(sys.argv) > 2 else (os.cpu_count() or 1)
+
+    problem_json = generate_problem_json(student_count)
+    problem_string = json.dumps(problem_json)
+
+    print(f'{student_count} students, {processes} processes')
+    serial_time = measure(lambda: io.import_json_problem_object(problem_json), 3)
+    print(f'  serial:   {serial_time:.4f} s')
+    parallel_time = measure(lambda: io.import_json_problem_object(problem_json, processes), 3)
+    print(f'  parallel: {parallel_time:.4f} s')
+    string_time = measure(lambda: io.import_json_problem_string(problem_string, processes), 3)
+    print(f'  parallel (with json.loads): {string_time:.4f} s')
+
+if __name__ == '__main__':
+    main()
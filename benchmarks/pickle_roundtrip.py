@@ -0,0 +1,33 @@
+import json
+import pickle
+import sys
+
+from kepler import io
+
+from .common import generate_problem, generate_problem_json, generate_solution, measure
+
+def main() -> None:
+    student_count = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+
+    problem_json = generate_problem_json(student_count)
+    problem = generate_problem(student_count)
+    solution = generate_solution(problem)
+
+    problem_pickle = pickle.dumps(problem)
+    solution_pickle = pickle.dumps(solution)
+    problem_json_string = json.dumps(problem_json)
+
+    print(f'{student_count} students')
+    print(f'  problem pickle:  {len(problem_pickle):>10} bytes')
+    print(f'  problem JSON:    {len(problem_json_string):>10} bytes')
+    print(f'  solution pickle: {len(solution_pickle):>10} bytes')
+
+    print(f'  problem dumps:   {measure(lambda: pickle.dumps(problem)):.4f} s')
+    print(f'  problem loads:   {measure(lambda: pickle.loads(problem_pickle)):.4f} s')
+    json_time = measure(lambda: io.import_json_problem_string(problem_json_string))
+    print(f'  problem JSON:    {json_time:.4f} s')
+    print(f'  solution dumps:  {measure(lambda: pickle.dumps(solution)):.4f} s')
+    print(f'  solution loads:  {measure(lambda: pickle.loads(solution_pickle)):.4f} s')
+
+if __name__ == '__main__':
+    main()
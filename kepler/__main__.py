@@ -3,21 +3,104 @@ import sys
 from . import api
 from . import io
 from .scheduler import SchedulingProblemModel, SchedulingProblemModelError
+from .types import ColumnarSchedulingProblem, SchedulingProblem
+
+def solve(input_file: str, output_file: str) -> None:
+    problem: SchedulingProblem | ColumnarSchedulingProblem
+    if input_file.endswith('.kbin'):
+        problem = io.import_binary_columnar_problem_file(input_file)
+    else:
+        problem = io.import_json_problem_file(input_file)
+
+    model = SchedulingProblemModel(problem)
+    solution = model.solve()
+
+    if output_file.endswith('.kbin'):
+        io.export_binary_solution_file(output_file, solution)
+    else:
+        io.export_json_solution_file(output_file, solution)
+
+def convert(input_file: str, output_file: str) -> None:
+    if input_file.endswith('.kbin') and not output_file.endswith('.kbin'):
+        with io.BinaryProblemFile(input_file) as f:
+            if f.is_solution:
+                io.export_json_solution_file(output_file, f.to_solution())
+            else:
+                io.export_json_problem_file(output_file, f.to_problem())
+
+    elif output_file.endswith('.kbin') and not input_file.endswith('.kbin'):
+        io.export_binary_problem_file(output_file, io.import_json_problem_file(input_file))
+
+    else:
+        raise io.BinaryFormatError('Conversions must be between JSON and binary (.kbin) files')
+
+API_OPTIONS = (
+    'workers', 'solver_threads', 'job_store', 'job_ttl', 'job_store_size', 'max_queued_jobs'
+)
+
+def parse_api_options(arguments: list[str]) -> dict[str, str]:
+    # Options are given as (--name value) pairs
+    if len(arguments) % 2 != 0:
+        raise ValueError(f'Missing value for option {arguments[-1]}')
+
+    options: dict[str, str] = {}
+    for name, value in zip(arguments[::2], arguments[1::2]):
+        key = name.removeprefix('--').replace('-', '_')
+        if not name.startswith('--') or key not in API_OPTIONS:
+            raise ValueError(f'Unknown option: {name}')
+
+        options[key] = value
+
+    return options
+
+def get_positive_integer_option(options: dict[str, str], key: str) -> None | int:
+    if key not in options:
+        return None
+
+    try:
+        value = int(options[key])
+        if value <= 0:
+            raise ValueError()
+
+        return value
+    except ValueError:
+        option_name = '--' + key.replace('_', '-')
+        raise ValueError(f'Invalid value for option {option_name}: {options[key]}') from None
+
+def create_api(options: dict[str, str]) -> api.API:
+    job_ttl = get_positive_integer_option(options, 'job_ttl') or 24 * 60 * 60
+    job_store_size = get_positive_integer_option(options, 'job_store_size') or 1024
+
+    store = api.SQLiteJobStore(
+        options.get('job_store', ':memory:'), ttl=job_ttl, max_size=job_store_size * 1024 ** 2
+    )
+
+    return api.API(
+        workers=get_positive_integer_option(options, 'workers') or 1,
+        solver_threads=get_positive_integer_option(options, 'solver_threads'),
+        store=store,
+        max_queued_jobs=get_positive_integer_option(options, 'max_queued_jobs') or 100
+    )
 
 def main() -> None:
-    if len(sys.argv) == 4 and sys.argv[1] == 'solve':
+    if len(sys.argv) == 4 and sys.argv[1] in ('solve', 'convert'):
         input_file = sys.argv[2]
         output_file = sys.argv[3]
 
         try:
-            problem = io.import_json_problem_file(input_file)
-            model = SchedulingProblemModel(problem)
-            solution = model.solve()
-            io.export_json_solution_file(output_file, solution)
-        except (io.JsonImporterError, io.JsonExporterError, SchedulingProblemModelError) as e:
+            if sys.argv[1] == 'solve':
+                solve(input_file, output_file)
+            else:
+                convert(input_file, output_file)
+        except (
+            io.BinaryFormatError,
+            io.JsonImporterError,
+            io.JsonExporterError,
+            SchedulingProblemModelError) as e:
+
             print(str(e), file=sys.stderr)
 
-    elif len(sys.argv) == 4 and sys.argv[1] == 'api':
+    elif len(sys.argv) >= 4 and sys.argv[1] == 'api':
         try:
             host = sys.argv[2]
             port = int(sys.argv[3])
@@ -25,15 +108,28 @@ def main() -> None:
                 raise ValueError()
 
         except ValueError:
-            print(f'Invalid port: {port}', file=sys.stderr)
+            print(f'Invalid port: {sys.argv[3]}', file=sys.stderr)
+            sys.exit(1)
+
+        try:
+            api_server = create_api(parse_api_options(sys.argv[4:]))
+        except (ValueError, api.JobStoreError) as e:
+            print(str(e), file=sys.stderr)
             sys.exit(1)
 
-        api.API().run(host, port)
+        api_server.run(host, port)
 
     else:
-        print('Usage:',                                                      file=sys.stderr)
-        print('  kepler solve <problem-input.json> <schedules-output.json>', file=sys.stderr)
-        print('  kepler api   <host> <port>',                                file=sys.stderr)
+        print('Usage:',                                                            file=sys.stderr)
+        print('  kepler solve   <problem-input.json|kbin> <schedules-output.json|kbin>',
+              file=sys.stderr)
+        print('  kepler convert <input.json|kbin> <output.json|kbin>',             file=sys.stderr)
+        print('  kepler api     <host> <port> [--workers <n>] [--solver-threads <n>]',
+              file=sys.stderr)
+        print('                 [--job-store <path.sqlite>] [--job-ttl <seconds>]',
+              file=sys.stderr)
+        print('                 [--job-store-size <MiB>] [--max-queued-jobs <n>]',
+              file=sys.stderr)
         sys.exit(1)
 
 if __name__ == '__main__':
@@ -0,0 +1,9 @@
+from .app import API
+from .store import JobStore, JobStoreError, SQLiteJobStore
+
+__all__ = [
+    'API',
+    'JobStore',
+    'JobStoreError',
+    'SQLiteJobStore'
+]
@@ -0,0 +1,637 @@
+import asyncio
+from collections.abc import AsyncIterator
+from concurrent.futures import Future, ProcessPoolExecutor
+import hashlib
+import json
+import logging
+import math
+import os
+import re
+import threading
+import uuid
+
+from starlette.applications import Starlette
+from starlette.concurrency import run_in_threadpool
+from starlette.exceptions import HTTPException
+from starlette.middleware import Middleware
+from starlette.middleware.gzip import GZipMiddleware
+from starlette.requests import Request
+from starlette.responses import JSONResponse, Response, StreamingResponse
+from starlette.routing import Route
+
+import uvicorn
+
+from .. import io
+from ..io.compression import COMPRESSION_ERRORS
+from ..scheduler.config import SOLVER_TIME_LIMIT
+from ..types import Catalog, SchedulingProblem
+from .jobs import Job, JobCancelledError, JobStatus
+from .pool import WORKER_CONTEXT, WorkerPool
+from .store import (
+    BatchSubmission,
+    CatalogSubmission,
+    JobStore,
+    SQLiteJobStore,
+    StoredJob,
+    Submission
+)
+from .worker import (
+    ParsedSubmission,
+    initialize_parsing_worker,
+    parse_batch,
+    parse_catalog,
+    parse_submission
+)
+
+# Errors caused by invalid submissions, only detected once they are parsed
+PROBLEM_INPUT_ERRORS = (UnicodeDecodeError, io.JsonImporterError, *COMPRESSION_ERRORS)
+
+# Longest time, in seconds, that requests may wait for a job to finish
+MAX_WAIT_TIME = 120
+
+# Seconds clients are asked to wait when the queue is full, before any job has been solved
+DEFAULT_RETRY_AFTER = 30
+
+CATALOG_ID_PATTERN = re.compile(r'[A-Za-z0-9_.-]{1,128}')
+
+logger = logging.getLogger(__name__)
+
+def default_solver_threads(workers: int) -> int:
+    # CBC thread budgets are split so that, together, all workers use every core
+    return max(1, (os.cpu_count() or 1) // workers)
+
+class API:
+    def __init__(
+        self,
+        workers: int = 1,
+        solver_threads: None | int = None,
+        store: None | JobStore = None,
+        max_queued_jobs: int = 100) -> None:
+
+        # Unfinished jobs are kept in memory, and finished ones in the store. Jobs are added and
+        # removed from other threads (parsing, the pool and cancellations), so they're only iterated
+        # over through snapshots.
+        self.__jobs: dict[uuid.UUID, Job] = {}
+        self.__jobs_lock = threading.Lock()
+        self.__store = SQLiteJobStore() if store is None else store
+
+        # Submissions are rejected while this many jobs wait to be parsed or solved
+        self.__max_queued_jobs = max_queued_jobs
+
+        # Submissions are parsed away from the event loop, so that large problems don't block other
+        # requests, and then solved (and their models built) in worker processes
+        if solver_threads is None:
+            solver_threads = default_solver_threads(workers)
+
+        self.__pool = WorkerPool(workers, solver_threads)
+
+        # Catalogs are parsed once, and handed to every parsing process. Processes are replaced
+        # when catalogs change, but only once a submission needs them, so that a burst of changes
+        # replaces them once. Catalogs are parsed again after a restart, before the jobs that may
+        # use them, and dropped if that fails.
+        self.__catalogs: dict[str, Catalog] = {}
+        self.__parsing_executor = self.__create_parsing_executor()
+        self.__stale_parsing_executor = False
+
+        catalog_futures = [
+            (submission.catalog_id, self.__parsing_executor.submit(
+                parse_catalog, submission.payload, submission.content_encoding
+            ))
+            for submission in self.__store.list_catalogs()
+        ]
+        for catalog_id, catalog_future in catalog_futures:
+            try:
+                self.__catalogs[catalog_id] = catalog_future.result()
+                self.__stale_parsing_executor = True
+            except Exception as e:
+                logger.error('Dropped stored catalog %s, which failed to parse: %s', catalog_id, e)
+
+        # Jobs (and batches) interrupted by a restart are started over
+        for submission in self.__store.unfinished():
+            self.__start(submission)
+        for batch_submission in self.__store.unfinished_batches():
+            self.__start_batch(batch_submission)
+
+        self.__starlette = Starlette(routes=[
+            Route('/api/v1/solve', self.__solve, methods=['POST']),
+            Route('/api/v1/solution/{jobid:uuid}', self.__solution, methods=['GET']),
+            Route('/api/v1/solution/{jobid:uuid}', self.__cancel, methods=['DELETE']),
+            Route('/api/v1/solution/{jobid:uuid}/events', self.__events, methods=['GET']),
+            Route('/api/v1/batch', self.__submit_batch, methods=['POST']),
+            Route('/api/v1/batch/{batchid:uuid}', self.__batch, methods=['GET']),
+            Route('/api/v1/catalogs/{catalog_id}', self.__put_catalog, methods=['PUT']),
+            Route('/api/v1/catalogs/{catalog_id}', self.__catalog, methods=['GET']),
+            Route('/api/v1/catalogs/{catalog_id}', self.__delete_catalog, methods=['DELETE']),
+            Route('/api/v1/status', self.__status, methods=['GET'])
+        ], exception_handlers={
+            HTTPException: lambda _, e: JSONResponse(
+                {'error': e.detail}, status_code=e.status_code, headers=e.headers
+            )
+        }, middleware=[
+            # Compresses responses (including solutions) for clients that accept gzip
+            Middleware(GZipMiddleware, minimum_size=1024)
+        ])
+
+    def run(self, host: str, port: int) -> None:
+        uvicorn.run(self.__starlette, host=host, port=port)
+
+    async def __solve(self, request: Request) -> JSONResponse:
+        content_encoding = self.__check_submission(request)
+
+        submission = Submission(uuid.uuid4(), await request.body(), content_encoding)
+        await run_in_threadpool(self.__store.add, submission)
+        self.__start(submission)
+
+        return JSONResponse({'jobid': str(submission.jobid)})
+
+    async def __solution(self, request: Request) -> Response:
+        jobid = request.path_params['jobid']
+        job = self.__jobs.get(jobid)
+
+        # Long polling: ?wait=<seconds> waits for unfinished jobs, without blocking any thread
+        wait_time = API.__get_wait_time(request)
+        if job is not None and wait_time > 0:
+            await API.__wait_for_result(job, wait_time)
+
+        if job is not None and not job.result.done():
+            return JSONResponse({'status': job.status.value})
+        elif job is not None:
+            # NOTE: the job may have finished before being written to the store
+            status, result, error = API.__get_outcome(job.result)
+        else:
+            stored_job = await run_in_threadpool(self.__store.get, jobid)
+            if stored_job is None:
+                raise HTTPException(404, detail='Job not found or removed from cache')
+
+            status, result, error = stored_job.status, stored_job.result, stored_job.error
+
+        if status == JobStatus.DONE:
+            return Response(result, media_type='application/json')
+        elif status == JobStatus.INVALID:
+            raise HTTPException(400, detail=error)
+        elif status == JobStatus.FAILED:
+            raise HTTPException(500, detail=error)
+        elif status == JobStatus.CANCELLED:
+            raise HTTPException(410, detail=error)
+        else:
+            return JSONResponse({'status': status.value})
+
+    async def __cancel(self, request: Request) -> JSONResponse:
+        jobid = request.path_params['jobid']
+        job = self.__jobs.get(jobid)
+
+        if job is not None:
+            if await run_in_threadpool(self.__cancel_job, job):
+                return JSONResponse({'status': JobStatus.CANCELLED.value})
+
+            status, _, _ = API.__get_outcome(job.result)
+        else:
+            stored_job = await run_in_threadpool(self.__store.get, jobid)
+            if stored_job is None:
+                raise HTTPException(404, detail='Job not found or removed from cache')
+
+            status = stored_job.status
+
+        raise HTTPException(409, detail=f'Job already finished: {status.value}')
+
+    async def __events(self, request: Request) -> StreamingResponse:
+        # Server-sent events with the job's status and solver progress, as they change, ending with
+        # its result (a solution or an error)
+        jobid = request.path_params['jobid']
+        job = self.__jobs.get(jobid)
+
+        stored_job = None
+        if job is None:
+            stored_job = await run_in_threadpool(self.__store.get, jobid)
+            if stored_job is None:
+                raise HTTPException(404, detail='Job not found or removed from cache')
+
+        return StreamingResponse(
+            API.__stream_events(job, stored_job),
+            media_type='text/event-stream',
+            headers={'Cache-Control': 'no-cache'}
+        )
+
+    async def __submit_batch(self, request: Request) -> JSONResponse:
+        # Many variants of the same problem, sharing one catalog, solved as separate jobs
+        content_encoding = self.__check_submission(request)
+
+        submission = BatchSubmission(uuid.uuid4(), await request.body(), content_encoding)
+        await run_in_threadpool(self.__store.add_batch, submission)
+        self.__start_batch(submission)
+
+        return JSONResponse({'batchid': str(submission.batchid)})
+
+    async def __batch(self, request: Request) -> Response:
+        batchid = request.path_params['batchid']
+        wait_time = API.__get_wait_time(request)
+
+        stored_batch = await run_in_threadpool(self.__store.get_batch, batchid)
+        if stored_batch is None:
+            raise HTTPException(404, detail='Batch not found or removed from cache')
+        elif stored_batch.status == JobStatus.INVALID:
+            raise HTTPException(400, detail=stored_batch.error)
+        elif stored_batch.status == JobStatus.FAILED:
+            raise HTTPException(500, detail=stored_batch.error)
+        elif stored_batch.jobids is None:
+            return JSONResponse({'status': stored_batch.status.value})
+
+        jobids = stored_batch.jobids
+        jobs = [job for job in map(self.__jobs.get, jobids) if job is not None]
+        if wait_time > 0 and jobs:
+            # Waits for all of the batch's jobs, for up to the wait time altogether
+            await asyncio.wait(
+                [asyncio.create_task(API.__wait_for_result(job, wait_time)) for job in jobs]
+            )
+
+        outcomes = await run_in_threadpool(self.__get_batch_outcomes, jobids)
+
+        # Batches are done once all of their variants finished, whether solved or not. Otherwise,
+        # they're running if any of their variants is.
+        statuses = [status for status, _, _ in outcomes]
+        if all(status is None or status.finished for status in statuses):
+            batch_status = JobStatus.DONE
+        elif any(status in (JobStatus.BUILDING, JobStatus.RUNNING) for status in statuses):
+            batch_status = JobStatus.RUNNING
+        else:
+            batch_status = JobStatus.QUEUED
+
+        status_counts: dict[str, int] = {}
+        for status in statuses:
+            if status is not None:
+                status_counts[status.value] = status_counts.get(status.value, 0) + 1
+
+        # NOTE: solutions are spliced into the response, rather than parsed and exported again
+        variants_json = b', '.join(
+            API.__format_variant(jobid, *outcome) for jobid, outcome in zip(jobids, outcomes)
+        )
+        header = json.dumps({'status': batch_status.value, 'variant_statuses': status_counts})
+        return Response(
+            b''.join([header[:-1].encode('utf-8'), b', "variants": [', variants_json, b']}']),
+            media_type='application/json'
+        )
+
+    async def __put_catalog(self, request: Request) -> JSONResponse:
+        # Creates or replaces a catalog, which later submissions may reference by its id. Jobs
+        # submitted before it was replaced keep the previous one.
+        catalog_id = API.__get_catalog_id(request)
+        content_encoding = API.__get_content_encoding(request)
+        submission = CatalogSubmission(catalog_id, await request.body(), content_encoding)
+
+        # NOTE: catalogs are parsed on their own, so the executor may have outdated catalogs
+        try:
+            catalog = await asyncio.wrap_future(self.__parsing_executor.submit(
+                parse_catalog, submission.payload, submission.content_encoding
+            ))
+        except PROBLEM_INPUT_ERRORS as e:
+            raise HTTPException(400, detail=str(e)) from None
+
+        await run_in_threadpool(self.__store.put_catalog, submission)
+        created = catalog_id not in self.__catalogs
+        self.__catalogs[catalog_id] = catalog
+        self.__stale_parsing_executor = True
+
+        return JSONResponse(
+            API.__describe_catalog(catalog_id, catalog), status_code=201 if created else 200
+        )
+
+    async def __catalog(self, request: Request) -> JSONResponse:
+        catalog_id = API.__get_catalog_id(request)
+        catalog = self.__catalogs.get(catalog_id)
+        if catalog is None:
+            raise HTTPException(404, detail='Catalog not found')
+
+        return JSONResponse(API.__describe_catalog(catalog_id, catalog))
+
+    async def __delete_catalog(self, request: Request) -> Response:
+        catalog_id = API.__get_catalog_id(request)
+        if catalog_id not in self.__catalogs:
+            raise HTTPException(404, detail='Catalog not found')
+
+        await run_in_threadpool(self.__store.delete_catalog, catalog_id)
+        del self.__catalogs[catalog_id]
+        self.__stale_parsing_executor = True
+
+        return Response(status_code=204)
+
+    async def __status(self, request: Request) -> JSONResponse:
+        busy_workers = self.__pool.busy_workers
+
+        return JSONResponse({
+            'workers': self.__pool.workers,
+            'solver_threads': self.__pool.solver_threads,
+            'busy_workers': busy_workers,
+            'utilization': busy_workers / self.__pool.workers,
+            'parsing_jobs': sum(job.status == JobStatus.PARSING for job in self.__list_jobs()),
+            'queued_jobs': self.__pool.queued_jobs,
+            'max_queued_jobs': self.__max_queued_jobs,
+            'average_solve_time': self.__pool.average_solve_time,
+            'catalogs': len(self.__catalogs)
+        })
+
+    def __start(self, submission: Submission) -> None:
+        job = self.__add_job(submission.jobid)
+        self.__get_parsing_executor().submit(
+            parse_submission, submission.payload, submission.content_encoding
+        ).add_done_callback(lambda future: self.__parsed(job, future))
+
+    def __add_job(self, jobid: uuid.UUID) -> Job:
+        job = Job()
+        with self.__jobs_lock:
+            self.__jobs[jobid] = job
+
+        job.result.add_done_callback(lambda _: self.__finish(jobid, job))
+        return job
+
+    def __list_jobs(self) -> list[Job]:
+        with self.__jobs_lock:
+            return list(self.__jobs.values())
+
+    def __start_batch(self, submission: BatchSubmission) -> None:
+        self.__get_parsing_executor().submit(
+            parse_batch, submission.payload, submission.content_encoding
+        ).add_done_callback(lambda future: self.__batch_parsed(submission.batchid, future))
+
+    def __create_parsing_executor(self) -> ProcessPoolExecutor:
+        return ProcessPoolExecutor(
+            max_workers=self.__pool.workers,
+            mp_context=WORKER_CONTEXT,
+            initializer=initialize_parsing_worker,
+            initargs=(dict(self.__catalogs),)
+        )
+
+    def __get_parsing_executor(self) -> ProcessPoolExecutor:
+        # The executor for submissions, which must have the current catalogs. Submissions already
+        # handed to the previous executor are still parsed by it.
+        if self.__stale_parsing_executor:
+            previous_executor = self.__parsing_executor
+            self.__parsing_executor = self.__create_parsing_executor()
+            self.__stale_parsing_executor = False
+            previous_executor.shutdown(wait=False)
+
+        return self.__parsing_executor
+
+    def __check_submission(self, request: Request) -> str:
+        # Returns the submission's content encoding
+        content_encoding = API.__get_content_encoding(request)
+
+        if self.__count_queued_jobs() >= self.__max_queued_jobs:
+            raise HTTPException(
+                429,
+                detail='Too many queued jobs',
+                headers={'Retry-After': str(self.__estimate_retry_after())}
+            )
+
+        return content_encoding
+
+    def __count_queued_jobs(self) -> int:
+        return sum(
+            job.status in (JobStatus.PARSING, JobStatus.QUEUED) for job in self.__list_jobs()
+        )
+
+    def __estimate_retry_after(self) -> int:
+        # A queued job starts, on average, whenever any of the workers finishes its task
+        average_solve_time = self.__pool.average_solve_time
+        if average_solve_time is None:
+            return DEFAULT_RETRY_AFTER
+
+        return max(1, math.ceil(average_solve_time / self.__pool.workers))
+
+    def __parsed(self, job: Job, future: Future[ParsedSubmission]) -> None:
+        # NOTE: called from one of the executor's threads
+        if job.result.done():
+            return   # Cancelled while being parsed
+
+        try:
+            submission = future.result()
+        except Exception as e:
+            job.finish(e)
+            return
+
+        self.__submit(job, submission)
+
+    def __batch_parsed(self, batchid: uuid.UUID, future: Future[list[ParsedSubmission]]) -> None:
+        # NOTE: called from one of the executor's threads
+        try:
+            submissions = future.result()
+        except Exception as e:
+            status = JobStatus.INVALID if isinstance(e, PROBLEM_INPUT_ERRORS) else JobStatus.FAILED
+            self.__store.fail_batch(batchid, status, str(e))
+            return
+
+        stored_batch = self.__store.get_batch(batchid)
+        if stored_batch is not None and stored_batch.jobids is not None:
+            # Restarted: only the variants that hadn't finished are solved again
+            jobids = stored_batch.jobids
+            stored_jobs = [self.__store.get(jobid) for jobid in jobids]
+            jobs = {
+                jobid: self.__add_job(jobid)
+                for jobid, stored_job in zip(jobids, stored_jobs)
+                if stored_job is not None and not stored_job.status.finished
+            }
+        else:
+            # The batch's jobs are kept in memory before being added to the store, so that they're
+            # never read from it while unfinished
+            jobids = [uuid.uuid4() for _ in submissions]
+            jobs = {jobid: self.__add_job(jobid) for jobid in jobids}
+            self.__store.start_batch(batchid, jobids)
+
+        for jobid, submission in zip(jobids, submissions):
+            if jobid in jobs:
+                self.__submit(jobs[jobid], submission)
+
+    def __submit(self, job: Job, submission: ParsedSubmission) -> None:
+        # Identical submissions share their work: they reuse the result of a solved job, or are
+        # attached to the one still solving
+        job.fingerprint = self.__get_fingerprint(submission.problem)
+
+        result = self.__store.find_result(job.fingerprint)
+        if result is not None:
+            job.finish(result)
+        else:
+            self.__pool.submit(
+                job, submission.problem, job.fingerprint, submission.priority, submission.cost
+            )
+
+    def __get_fingerprint(self, problem: SchedulingProblem) -> str:
+        solver_options = {
+            'solver': 'COIN_CMD',
+            'time_limit': SOLVER_TIME_LIMIT,
+            'threads': self.__pool.solver_threads
+        }
+
+        fingerprint = hashlib.sha256(problem.digest)
+        fingerprint.update(json.dumps(solver_options, sort_keys=True).encode('utf-8'))
+        return fingerprint.hexdigest()
+
+    def __cancel_job(self, job: Job) -> bool:
+        if not job.cancel():
+            return False   # Already finished
+
+        self.__pool.cancel(job)
+        return True
+
+    def __finish(self, jobid: uuid.UUID, job: Job) -> None:
+        status, result, error = API.__get_outcome(job.result)
+        job.status = status
+
+        self.__store.finish(jobid, status, result, error, job.fingerprint)
+        self.__store.evict()
+        with self.__jobs_lock:
+            del self.__jobs[jobid]
+
+    def __get_batch_outcomes(
+        self,
+        jobids: list[uuid.UUID]) -> list[tuple[None | JobStatus, None | bytes, None | str]]:
+
+        # The status of each job, along with its result or error once finished. Jobs removed from
+        # the store have no status.
+        outcomes: list[tuple[None | JobStatus, None | bytes, None | str]] = []
+        for jobid in jobids:
+            job = self.__jobs.get(jobid)
+
+            if job is not None and not job.result.done():
+                outcomes.append((job.status, None, None))
+            elif job is not None:
+                outcomes.append(API.__get_outcome(job.result))
+            elif (stored_job := self.__store.get(jobid)) is not None:
+                outcomes.append((stored_job.status, stored_job.result, stored_job.error))
+            else:
+                outcomes.append((None, None, 'Job not found or removed from cache'))
+
+        return outcomes
+
+    @staticmethod
+    def __format_variant(
+        jobid: uuid.UUID,
+        status: None | JobStatus,
+        result: None | bytes,
+        error: None | str) -> bytes:
+
+        variant_json: dict[str, object] = {
+            'jobid': str(jobid), 'status': None if status is None else status.value
+        }
+        if error is not None:
+            variant_json['error'] = error
+
+        variant = json.dumps(variant_json).encode('utf-8')
+        if status == JobStatus.DONE and result is not None:
+            # Solutions are objects with their schedules, whose keys are added to the variant's
+            return b''.join([variant[:-1], b', ', result.lstrip()[1:]])
+        else:
+            return variant
+
+    @staticmethod
+    def __get_content_encoding(request: Request) -> str:
+        content_encoding = request.headers.get('content-encoding', 'identity').strip().lower()
+        if content_encoding not in ('identity', 'gzip'):
+            raise HTTPException(415, detail=f'Unsupported content encoding: {content_encoding}')
+
+        return content_encoding
+
+    @staticmethod
+    def __get_catalog_id(request: Request) -> str:
+        catalog_id: str = request.path_params['catalog_id']
+        if not CATALOG_ID_PATTERN.fullmatch(catalog_id):
+            raise HTTPException(
+                400, detail='Catalog ids must have 1 to 128 letters, digits, "_", "." or "-"'
+            )
+
+        return catalog_id
+
+    @staticmethod
+    def __describe_catalog(catalog_id: str, catalog: Catalog) -> dict[str, object]:
+        return {
+            'catalog_id': catalog_id,
+            'courses': len(catalog.courses),
+            'shifts': len(catalog.list_shifts())
+        }
+
+    @staticmethod
+    def __get_wait_time(request: Request) -> float:
+        wait = request.query_params.get('wait', '0')
+
+        try:
+            wait_time = float(wait)
+            if not 0 <= wait_time <= MAX_WAIT_TIME:
+                raise ValueError()
+        except ValueError:
+            raise HTTPException(
+                400, detail=f'Invalid wait time (expected 0 to {MAX_WAIT_TIME} seconds): {wait}'
+            ) from None
+
+        return wait_time
+
+    @staticmethod
+    async def __wait_for_result(job: Job, timeout: float) -> None:
+        loop = asyncio.get_running_loop()
+        finished = asyncio.Event()
+
+        def listener() -> None:
+            if job.result.done():
+                loop.call_soon_threadsafe(finished.set)
+
+        job.add_listener(listener)
+        try:
+            if not job.result.done():
+                await asyncio.wait_for(finished.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+        finally:
+            job.remove_listener(listener)
+
+    @staticmethod
+    async def __stream_events(job: None | Job, stored_job: None | StoredJob) -> AsyncIterator[str]:
+        if job is not None:
+            loop = asyncio.get_running_loop()
+            changed = asyncio.Event()
+
+            def listener() -> None:
+                loop.call_soon_threadsafe(changed.set)
+
+            job.add_listener(listener)
+            try:
+                status, progress = None, None
+                while True:
+                    changed.clear()
+                    if job.result.done():
+                        break
+
+                    if job.status != status:
+                        status = job.status
+                        yield API.__format_event('status', json.dumps({'status': status.value}))
+                    if job.progress is not progress:
+                        progress = job.progress
+                        yield API.__format_event('progress', json.dumps(progress))
+
+                    await changed.wait()
+            finally:
+                job.remove_listener(listener)
+
+            final_status, result, error = API.__get_outcome(job.result)
+        elif stored_job is not None:
+            final_status, result, error = stored_job.status, stored_job.result, stored_job.error
+        else:
+            return
+
+        yield API.__format_event('status', json.dumps({'status': final_status.value}))
+        if result is not None:
+            yield API.__format_event('result', result.decode('utf-8'))
+        else:
+            yield API.__format_event('error', json.dumps({'error': error}))
+
+    @staticmethod
+    def __format_event(event: str, data: str) -> str:
+        data_lines = ''.join(f'data: {line}\n' for line in data.split('\n'))
+        return f'event: {event}\n{data_lines}\n'
+
+    @staticmethod
+    def __get_outcome(result: Future[bytes]) -> tuple[JobStatus, None | bytes, None | str]:
+        try:
+            return JobStatus.DONE, result.result(), None
+        except PROBLEM_INPUT_ERRORS as e:
+            return JobStatus.INVALID, None, str(e)
+        except JobCancelledError as e:
+            return JobStatus.CANCELLED, None, str(e)
+        except Exception as e:
+            return JobStatus.FAILED, None, str(e)
@@ -0,0 +1,99 @@
+from collections.abc import Callable
+from concurrent.futures import Future, InvalidStateError
+import enum
+import threading
+
+from ..types import SortedEnum
+
+class JobCancelledError(Exception):
+    pass
+
+@enum.unique
+class JobPriority(SortedEnum):
+    # Queued jobs run in this order
+    INTERACTIVE = 'interactive'
+    NORMAL = 'normal'
+    BATCH = 'batch'
+
+@enum.unique
+class JobStatus(enum.Enum):
+    PARSING = 'Parsing'
+    QUEUED = 'Queued'
+    BUILDING = 'Building'
+    RUNNING = 'Running'
+    DONE = 'Done'
+    INVALID = 'Invalid'    # The submitted problem could not be parsed
+    FAILED = 'Failed'
+    CANCELLED = 'Cancelled'
+
+    @property
+    def finished(self) -> bool:
+        return self in (JobStatus.DONE, JobStatus.INVALID, JobStatus.FAILED, JobStatus.CANCELLED)
+
+# The latest progress of a job's solver: incumbent_objective, best_bound, gap and elapsed_time
+JobProgress = dict[str, None | float]
+
+class Job:
+    def __init__(self) -> None:
+        self.__status = JobStatus.PARSING
+        self.__progress: None | JobProgress = None
+
+        # Identifies the problem and solver options, once parsed
+        self.fingerprint: None | str = None
+
+        # The JSON response with the job's solution
+        self.result: Future[bytes] = Future()
+        self.result.add_done_callback(lambda _: self.__notify())
+
+        # Called (from any thread) whenever the job's status, progress or result change
+        self.__listeners_lock = threading.Lock()
+        self.__listeners: list[Callable[[], None]] = []
+
+    @property
+    def status(self) -> JobStatus:
+        return self.__status
+
+    @status.setter
+    def status(self, status: JobStatus) -> None:
+        self.__status = status
+        self.__notify()
+
+    @property
+    def progress(self) -> None | JobProgress:
+        return self.__progress
+
+    @progress.setter
+    def progress(self, progress: JobProgress) -> None:
+        self.__progress = progress
+        self.__notify()
+
+    def add_listener(self, listener: Callable[[], None]) -> None:
+        with self.__listeners_lock:
+            self.__listeners.append(listener)
+
+    def remove_listener(self, listener: Callable[[], None]) -> None:
+        with self.__listeners_lock:
+            self.__listeners.remove(listener)
+
+    def finish(self, result: bytes | BaseException) -> bool:
+        # Jobs may be finished concurrently (e.g., cancelled while a worker sends its solution), in
+        # which case only the first outcome is kept. Returns whether this was the one.
+        try:
+            if isinstance(result, BaseException):
+                self.result.set_exception(result)
+            else:
+                self.result.set_result(result)
+
+            return True
+        except InvalidStateError:
+            return False
+
+    def cancel(self) -> bool:
+        return self.finish(JobCancelledError('Job was cancelled'))
+
+    def __notify(self) -> None:
+        with self.__listeners_lock:
+            listeners = list(self.__listeners)
+
+        for listener in listeners:
+            listener()
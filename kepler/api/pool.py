@@ -0,0 +1,308 @@
+from __future__ import annotations
+import heapq
+import itertools
+import multiprocessing
+import os
+from multiprocessing.connection import Connection, wait
+from multiprocessing.process import BaseProcess
+import signal
+import threading
+import time
+import typing
+
+from ..types import SchedulingProblem
+from .jobs import Job, JobPriority, JobProgress, JobStatus
+from .worker import solve_problem
+
+if typing.TYPE_CHECKING: # pragma: no coverage
+    # NOTE: not defined on Windows
+    from multiprocessing.context import ForkServerContext, SpawnContext
+
+class WorkerPoolError(Exception):
+    pass
+
+# Workers are started by a server process, or spawned, rather than forked from the API's process,
+# whose other threads (the event loop's, the parsing executors', ...) may be holding locks that
+# would never be released in the workers. The server imports the workers' modules only once.
+WORKER_CONTEXT: ForkServerContext | SpawnContext
+if 'forkserver' in multiprocessing.get_all_start_methods():
+    WORKER_CONTEXT = multiprocessing.get_context('forkserver')
+    WORKER_CONTEXT.set_forkserver_preload([solve_problem.__module__])
+else:
+    WORKER_CONTEXT = multiprocessing.get_context('spawn')
+
+# Weight of the latest solve in the average solve time
+SOLVE_TIME_SMOOTHING = 0.2
+
+class PoolTask:
+    # A problem to solve, and the jobs waiting for its solution. Tasks are ordered by priority, and
+    # then by their (predicted) cost, so that short jobs aren't stuck behind long ones.
+
+    def __init__(
+        self,
+        fingerprint: str,
+        problem: SchedulingProblem,
+        priority: JobPriority,
+        cost: int,
+        sequence: int) -> None:
+
+        self.fingerprint = fingerprint
+        self.problem: None | SchedulingProblem = problem
+        self.process: None | BaseProcess = None
+        self.start_time = 0.0
+
+        self.priority = priority
+        self.cost = cost
+        self.sequence = sequence
+
+        self.jobs: list[Job] = []
+        self.status = JobStatus.QUEUED
+        self.progress: None | JobProgress = None
+
+    def __lt__(self, other: PoolTask) -> bool:
+        return (self.priority, self.cost, self.sequence) < \
+            (other.priority, other.cost, other.sequence)
+
+class WorkerPool:
+    # Each problem is solved in its own worker process, so that models are built in parallel and a
+    # crashing solve can't take the API down with it. At most `workers` processes run at once,
+    # each allowed `solver_threads` CBC threads.
+    #
+    # Jobs for identical problems (with the same fingerprint) share a single task, which is only
+    # dropped once all of its jobs are cancelled.
+
+    def __init__(self, workers: int, solver_threads: int) -> None:
+        if workers <= 0:
+            raise WorkerPoolError(f'Non-positive number of workers: {workers}')
+        elif solver_threads <= 0:
+            raise WorkerPoolError(f'Non-positive number of solver threads: {solver_threads}')
+
+        self.__workers = workers
+        self.__solver_threads = solver_threads
+
+        self.__lock = threading.Lock()
+        self.__queue: list[PoolTask] = []   # A heap
+        self.__running: dict[Connection, PoolTask] = {}
+        self.__tasks: dict[str, PoolTask] = {}
+        self.__sequence = itertools.count()
+        self.__average_solve_time: None | float = None
+
+        # Wakes the dispatcher up when jobs are submitted
+        self.__wakeup_reader, self.__wakeup_writer = WORKER_CONTEXT.Pipe(duplex=False)
+
+        self.__dispatcher = threading.Thread(target=self.__dispatch, daemon=True)
+        self.__dispatcher.start()
+
+    @property
+    def workers(self) -> int:
+        return self.__workers
+
+    @property
+    def solver_threads(self) -> int:
+        return self.__solver_threads
+
+    @property
+    def busy_workers(self) -> int:
+        with self.__lock:
+            return len(self.__running)
+
+    @property
+    def queued_jobs(self) -> int:
+        with self.__lock:
+            return len(self.__queue)
+
+    @property
+    def average_solve_time(self) -> None | float:
+        # Exponential moving average of how long tasks take to run, or None before the first one
+        with self.__lock:
+            return self.__average_solve_time
+
+    def submit(
+        self,
+        job: Job,
+        problem: SchedulingProblem,
+        fingerprint: str,
+        priority: JobPriority = JobPriority.NORMAL,
+        cost: int = 0) -> bool:
+
+        # Returns whether the job was attached to the task of an identical problem
+        with self.__lock:
+            task = self.__tasks.get(fingerprint)
+            attached = task is not None
+
+            if task is None:
+                task = PoolTask(fingerprint, problem, priority, cost, next(self.__sequence))
+                self.__tasks[fingerprint] = task
+                heapq.heappush(self.__queue, task)
+
+            elif task.process is None and priority < task.priority:
+                # Queued tasks take the highest priority of their jobs
+                task.priority = priority
+                heapq.heapify(self.__queue)
+
+            # NOTE: the job's status is set before the dispatcher can update it, which it only does
+            # for the task's jobs after taking the lock
+            job.status = task.status
+            if task.progress is not None:
+                job.progress = task.progress
+
+            task.jobs.append(job)
+
+        # NOTE: the dispatcher is woken up outside the lock, as it may be waiting for the lock
+        # before draining the pipe, and a full pipe would then block both threads
+        if not attached:
+            self.__wakeup_writer.send(None)
+
+        return attached
+
+    def cancel(self, job: Job) -> None:
+        # Tasks left without jobs are removed from the queue, or have their worker (and, with it,
+        # the CBC process) killed, which frees it for the next task
+        with self.__lock:
+            task = next((task for task in self.__tasks.values() if job in task.jobs), None)
+            if task is None:
+                return
+
+            task.jobs.remove(job)
+            if task.jobs:
+                return
+
+            del self.__tasks[task.fingerprint]
+            if task.process is None:
+                self.__queue.remove(task)
+                heapq.heapify(self.__queue)
+            else:
+                WorkerPool.__kill(task)
+
+    def __dispatch(self) -> None:
+        while True:
+            with self.__lock:
+                starting_tasks = self.__pop_queued_tasks()
+
+            # NOTE: workers are started outside the lock, as their problems are pickled to be sent
+            # to them, which would otherwise keep submissions and cancellations waiting
+            for task, reader, writer in starting_tasks:
+                self.__start(task, reader, writer)
+
+            with self.__lock:
+                connections = [self.__wakeup_reader, *self.__running]
+
+            for connection in wait(connections):
+                if connection is self.__wakeup_reader:
+                    self.__wakeup_reader.recv()
+                else:
+                    self.__receive(typing.cast(Connection, connection))
+
+    def __pop_queued_tasks(self) -> list[tuple[PoolTask, Connection, Connection]]:
+        # The tasks to start, with their workers' (unstarted) processes and pipes. They already take
+        # up their workers, so that no more tasks are started than there are workers.
+        starting_tasks: list[tuple[PoolTask, Connection, Connection]] = []
+
+        while self.__queue and len(self.__running) < self.__workers:
+            task = heapq.heappop(self.__queue)
+            if all(job.result.done() for job in task.jobs):
+                # All jobs were cancelled before reaching the pool
+                del self.__tasks[task.fingerprint]
+                continue
+
+            reader, writer = WORKER_CONTEXT.Pipe(duplex=False)
+            task.process = WORKER_CONTEXT.Process(
+                target=solve_problem,
+                args=(writer, task.problem, self.__solver_threads),
+                daemon=True
+            )
+
+            self.__running[reader] = task
+            starting_tasks.append((task, reader, writer))
+
+        return starting_tasks
+
+    def __start(self, task: PoolTask, reader: Connection, writer: Connection) -> None:
+        process = typing.cast(BaseProcess, task.process)
+
+        try:
+            process.start()
+        except Exception as e:
+            # Such as problems that can't be pickled
+            with self.__lock:
+                del self.__running[reader]
+                if self.__tasks.get(task.fingerprint) is task:
+                    del self.__tasks[task.fingerprint]
+
+                jobs = list(task.jobs)
+
+            reader.close()
+            writer.close()
+            for job in jobs:
+                job.finish(e)
+            return
+
+        writer.close()
+
+        with self.__lock:
+            task.start_time = time.monotonic()
+
+            # The problem is no longer needed once it has been handed to the worker
+            task.problem = None
+
+            if self.__tasks.get(task.fingerprint) is not task:
+                # All of its jobs were cancelled while the worker was starting
+                WorkerPool.__kill(task)
+
+    def __receive(self, connection: Connection) -> None:
+        task = self.__running[connection]
+
+        try:
+            kind, value = connection.recv()
+        except EOFError:
+            kind, value = 'error', WorkerPoolError('Worker process exited unexpectedly')
+
+        with self.__lock:
+            if kind == 'status':
+                task.status = value
+            elif kind == 'progress':
+                task.progress = value
+            else:
+                del self.__running[connection]
+                if self.__tasks.get(task.fingerprint) is task:
+                    del self.__tasks[task.fingerprint]
+
+                solve_time = time.monotonic() - task.start_time
+                if not task.jobs:
+                    pass   # Killed, as all of its jobs were cancelled
+                elif self.__average_solve_time is None:
+                    self.__average_solve_time = solve_time
+                else:
+                    self.__average_solve_time += \
+                        SOLVE_TIME_SMOOTHING * (solve_time - self.__average_solve_time)
+
+            jobs = list(task.jobs)
+
+        if kind == 'status' or kind == 'progress':
+            for job in jobs:
+                if job.result.done():
+                    pass   # Cancelled
+                elif kind == 'status':
+                    job.status = value
+                else:
+                    job.progress = value
+            return
+
+        connection.close()
+        if task.process is not None:
+            task.process.join()
+
+        for job in jobs:
+            job.finish(value)
+
+    @staticmethod
+    def __kill(task: PoolTask) -> None:
+        if task.process is None or task.process.pid is None:
+            return
+
+        # Workers lead their own process groups, which include the CBC processes they start
+        try:
+            os.killpg(task.process.pid, signal.SIGKILL)
+        except (AttributeError, ProcessLookupError, PermissionError):
+            # Not POSIX, or the worker hasn't created its process group yet
+            task.process.kill()
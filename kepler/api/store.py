@@ -0,0 +1,419 @@
+import abc
+from collections.abc import Callable
+import json
+import sqlite3
+import threading
+import time
+import typing
+import uuid
+
+from .jobs import JobStatus
+
+class JobStoreError(Exception):
+    pass
+
+class StoredJob:
+    def __init__(
+        self,
+        status: JobStatus,
+        result: None | bytes = None,
+        error: None | str = None) -> None:
+
+        self.status = status
+        self.result = result   # The JSON response of solved jobs
+        self.error = error     # The error message of failed jobs
+
+class Submission:
+    def __init__(self, jobid: uuid.UUID, payload: bytes, content_encoding: str) -> None:
+        self.jobid = jobid
+        self.payload = payload
+        self.content_encoding = content_encoding
+
+class StoredBatch:
+    def __init__(
+        self,
+        status: JobStatus,
+        jobids: None | list[uuid.UUID] = None,
+        error: None | str = None) -> None:
+
+        self.status = status
+        self.jobids = jobids   # The jobs of each variant, once the batch has been parsed
+        self.error = error     # The error message of batches that couldn't be parsed
+
+class BatchSubmission:
+    def __init__(self, batchid: uuid.UUID, payload: bytes, content_encoding: str) -> None:
+        self.batchid = batchid
+        self.payload = payload
+        self.content_encoding = content_encoding
+
+class CatalogSubmission:
+    def __init__(self, catalog_id: str, payload: bytes, content_encoding: str) -> None:
+        self.catalog_id = catalog_id
+        self.payload = payload
+        self.content_encoding = content_encoding
+
+class JobStore(abc.ABC):
+    # Keeps the results of finished jobs. Submissions are kept until their jobs finish, so that jobs
+    # interrupted by a restart can be submitted again. The status of unfinished jobs is only kept
+    # in memory, by the API.
+    #
+    # Batches are kept along with the jobs of their variants, which are added once they are parsed.
+    # Their submissions are kept until all of these jobs finish.
+    #
+    # Catalogs are kept until they are deleted, so that they can be parsed again after a restart.
+
+    @abc.abstractmethod
+    def add(self, submission: Submission) -> None:
+        ...
+
+    @abc.abstractmethod
+    def finish(
+        self,
+        jobid: uuid.UUID,
+        status: JobStatus,
+        result: None | bytes = None,
+        error: None | str = None,
+        fingerprint: None | str = None) -> None:
+
+        ...
+
+    @abc.abstractmethod
+    def get(self, jobid: uuid.UUID) -> None | StoredJob:
+        ...
+
+    @abc.abstractmethod
+    def find_result(self, fingerprint: str) -> None | bytes:
+        # The result of a solved job with the given fingerprint, if any
+        ...
+
+    @abc.abstractmethod
+    def unfinished(self) -> list[Submission]:
+        ...
+
+    @abc.abstractmethod
+    def add_batch(self, submission: BatchSubmission) -> None:
+        ...
+
+    @abc.abstractmethod
+    def start_batch(self, batchid: uuid.UUID, jobids: list[uuid.UUID]) -> None:
+        # Adds the (unfinished) jobs of a parsed batch's variants
+        ...
+
+    @abc.abstractmethod
+    def fail_batch(self, batchid: uuid.UUID, status: JobStatus, error: str) -> None:
+        ...
+
+    @abc.abstractmethod
+    def get_batch(self, batchid: uuid.UUID) -> None | StoredBatch:
+        ...
+
+    @abc.abstractmethod
+    def unfinished_batches(self) -> list[BatchSubmission]:
+        ...
+
+    @abc.abstractmethod
+    def put_catalog(self, submission: CatalogSubmission) -> None:
+        ...
+
+    @abc.abstractmethod
+    def delete_catalog(self, catalog_id: str) -> None:
+        ...
+
+    @abc.abstractmethod
+    def list_catalogs(self) -> list[CatalogSubmission]:
+        ...
+
+    @abc.abstractmethod
+    def evict(self) -> None:
+        ...
+
+    @abc.abstractmethod
+    def close(self) -> None:
+        ...
+
+class SQLiteJobStore(JobStore):
+    # Finished jobs are evicted once they are older than `ttl` seconds, and the oldest ones when
+    # their results and errors take more than `max_size` bytes altogether
+
+    def __init__(
+        self,
+        path: str = ':memory:',
+        ttl: float = 24 * 60 * 60,
+        max_size: int = 1024 ** 3,
+        clock: Callable[[], float] = time.time) -> None:
+
+        if ttl <= 0:
+            raise JobStoreError(f'Non-positive job TTL: {ttl}')
+        elif max_size <= 0:
+            raise JobStoreError(f'Non-positive job store size: {max_size}')
+
+        self.__ttl = ttl
+        self.__max_size = max_size
+        self.__clock = clock
+
+        # NOTE: jobs are updated both from the event loop and the worker pool's threads
+        self.__lock = threading.Lock()
+
+        try:
+            self.__connection = sqlite3.connect(path, check_same_thread=False)
+            self.__connection.execute('PRAGMA journal_mode = WAL')
+            self.__connection.execute('PRAGMA synchronous = NORMAL')
+            self.__connection.execute('''
+                CREATE TABLE IF NOT EXISTS jobs (
+                    id TEXT PRIMARY KEY,
+                    status TEXT NOT NULL,
+                    payload BLOB,
+                    content_encoding TEXT NOT NULL,
+                    result BLOB,
+                    error TEXT,
+                    fingerprint TEXT,
+                    batch TEXT,
+                    size INTEGER NOT NULL DEFAULT 0,
+                    created REAL NOT NULL,
+                    finished REAL
+                )
+            ''')
+            self.__connection.execute('''
+                CREATE TABLE IF NOT EXISTS batches (
+                    id TEXT PRIMARY KEY,
+                    status TEXT NOT NULL,
+                    payload BLOB,
+                    content_encoding TEXT NOT NULL,
+                    jobids TEXT,
+                    error TEXT,
+                    created REAL NOT NULL,
+                    finished REAL
+                )
+            ''')
+            self.__connection.execute('''
+                CREATE TABLE IF NOT EXISTS catalogs (
+                    id TEXT PRIMARY KEY,
+                    payload BLOB NOT NULL,
+                    content_encoding TEXT NOT NULL,
+                    updated REAL NOT NULL
+                )
+            ''')
+
+            # Stores created before jobs were fingerprinted, or batched
+            columns = {row[1] for row in self.__connection.execute('PRAGMA table_info(jobs)')}
+            for column in ('fingerprint', 'batch'):
+                if column not in columns:
+                    self.__connection.execute(f'ALTER TABLE jobs ADD COLUMN {column} TEXT')
+
+            self.__connection.execute(
+                'CREATE INDEX IF NOT EXISTS jobs_finished ON jobs (finished)'
+            )
+            self.__connection.execute(
+                'CREATE INDEX IF NOT EXISTS jobs_fingerprint ON jobs (fingerprint)'
+            )
+            self.__connection.execute('CREATE INDEX IF NOT EXISTS jobs_batch ON jobs (batch)')
+            self.__connection.execute(
+                'CREATE INDEX IF NOT EXISTS batches_finished ON batches (finished)'
+            )
+            self.__connection.commit()
+        except sqlite3.Error as e:
+            raise JobStoreError(f'Failed to open job store {path}: {e}') from e
+
+    def add(self, submission: Submission) -> None:
+        with self.__lock, self.__connection:
+            self.__connection.execute(
+                'INSERT INTO jobs (id, status, payload, content_encoding, created) '
+                'VALUES (?, ?, ?, ?, ?)',
+                (
+                    str(submission.jobid),
+                    JobStatus.PARSING.value,
+                    submission.payload,
+                    submission.content_encoding,
+                    self.__clock()
+                )
+            )
+
+    def finish(
+        self,
+        jobid: uuid.UUID,
+        status: JobStatus,
+        result: None | bytes = None,
+        error: None | str = None,
+        fingerprint: None | str = None) -> None:
+
+        if not status.finished:
+            raise JobStoreError(f'Job {jobid} can\'t finish with status {status.value}')
+
+        size = len(result or b'') + len((error or '').encode('utf-8'))
+        now = self.__clock()
+        with self.__lock, self.__connection:
+            self.__connection.execute(
+                'UPDATE jobs SET status = ?, payload = NULL, result = ?, error = ?, '
+                'fingerprint = ?, size = ?, finished = ? WHERE id = ?',
+                (status.value, result, error, fingerprint, size, now, str(jobid))
+            )
+
+            # Batches finish with the last of their jobs
+            self.__connection.execute('''
+                UPDATE batches SET status = ?, payload = NULL, finished = ?
+                WHERE id = (SELECT batch FROM jobs WHERE id = ?) AND NOT EXISTS (
+                    SELECT 1 FROM jobs WHERE batch = batches.id AND finished IS NULL
+                )
+            ''', (JobStatus.DONE.value, now, str(jobid)))
+
+    def get(self, jobid: uuid.UUID) -> None | StoredJob:
+        with self.__lock:
+            row = self.__connection.execute(
+                'SELECT status, result, error FROM jobs '
+                'WHERE id = ? AND (finished IS NULL OR finished > ?)',
+                (str(jobid), self.__clock() - self.__ttl)
+            ).fetchone()
+
+        if row is None:
+            return None
+
+        status, result, error = row
+        return StoredJob(JobStatus(status), result, error)
+
+    def find_result(self, fingerprint: str) -> None | bytes:
+        with self.__lock:
+            row = self.__connection.execute(
+                'SELECT result FROM jobs WHERE fingerprint = ? AND status = ? AND finished > ? '
+                'ORDER BY finished DESC LIMIT 1',
+                (fingerprint, JobStatus.DONE.value, self.__clock() - self.__ttl)
+            ).fetchone()
+
+        return None if row is None else typing.cast(bytes, row[0])
+
+    def unfinished(self) -> list[Submission]:
+        with self.__lock:
+            rows = self.__connection.execute(
+                'SELECT id, payload, content_encoding FROM jobs '
+                'WHERE finished IS NULL AND batch IS NULL ORDER BY created'
+            ).fetchall()
+
+        return [
+            Submission(uuid.UUID(jobid), payload, content_encoding)
+            for jobid, payload, content_encoding in rows
+        ]
+
+    def add_batch(self, submission: BatchSubmission) -> None:
+        with self.__lock, self.__connection:
+            self.__connection.execute(
+                'INSERT INTO batches (id, status, payload, content_encoding, created) '
+                'VALUES (?, ?, ?, ?, ?)',
+                (
+                    str(submission.batchid),
+                    JobStatus.PARSING.value,
+                    submission.payload,
+                    submission.content_encoding,
+                    self.__clock()
+                )
+            )
+
+    def start_batch(self, batchid: uuid.UUID, jobids: list[uuid.UUID]) -> None:
+        now = self.__clock()
+        with self.__lock, self.__connection:
+            self.__connection.execute(
+                'UPDATE batches SET status = ?, jobids = ? WHERE id = ?',
+                (
+                    JobStatus.QUEUED.value,
+                    json.dumps([str(jobid) for jobid in jobids]),
+                    str(batchid)
+                )
+            )
+            self.__connection.executemany(
+                'INSERT INTO jobs (id, status, content_encoding, batch, created) '
+                'VALUES (?, ?, ?, ?, ?)',
+                [
+                    (str(jobid), JobStatus.QUEUED.value, 'identity', str(batchid), now)
+                    for jobid in jobids
+                ]
+            )
+
+    def fail_batch(self, batchid: uuid.UUID, status: JobStatus, error: str) -> None:
+        if not status.finished:
+            raise JobStoreError(f'Batch {batchid} can\'t fail with status {status.value}')
+
+        with self.__lock, self.__connection:
+            self.__connection.execute(
+                'UPDATE batches SET status = ?, payload = NULL, error = ?, finished = ? '
+                'WHERE id = ?',
+                (status.value, error, self.__clock(), str(batchid))
+            )
+
+    def get_batch(self, batchid: uuid.UUID) -> None | StoredBatch:
+        with self.__lock:
+            row = self.__connection.execute(
+                'SELECT status, jobids, error FROM batches '
+                'WHERE id = ? AND (finished IS NULL OR finished > ?)',
+                (str(batchid), self.__clock() - self.__ttl)
+            ).fetchone()
+
+        if row is None:
+            return None
+
+        status, jobids, error = row
+        return StoredBatch(
+            JobStatus(status),
+            None if jobids is None else [uuid.UUID(jobid) for jobid in json.loads(jobids)],
+            error
+        )
+
+    def unfinished_batches(self) -> list[BatchSubmission]:
+        with self.__lock:
+            rows = self.__connection.execute(
+                'SELECT id, payload, content_encoding FROM batches WHERE finished IS NULL '
+                'ORDER BY created'
+            ).fetchall()
+
+        return [
+            BatchSubmission(uuid.UUID(batchid), payload, content_encoding)
+            for batchid, payload, content_encoding in rows
+        ]
+
+    def put_catalog(self, submission: CatalogSubmission) -> None:
+        with self.__lock, self.__connection:
+            self.__connection.execute(
+                'INSERT OR REPLACE INTO catalogs (id, payload, content_encoding, updated) '
+                'VALUES (?, ?, ?, ?)',
+                (
+                    submission.catalog_id,
+                    submission.payload,
+                    submission.content_encoding,
+                    self.__clock()
+                )
+            )
+
+    def delete_catalog(self, catalog_id: str) -> None:
+        with self.__lock, self.__connection:
+            self.__connection.execute('DELETE FROM catalogs WHERE id = ?', (catalog_id,))
+
+    def list_catalogs(self) -> list[CatalogSubmission]:
+        with self.__lock:
+            rows = self.__connection.execute(
+                'SELECT id, payload, content_encoding FROM catalogs ORDER BY updated'
+            ).fetchall()
+
+        return [
+            CatalogSubmission(catalog_id, payload, content_encoding)
+            for catalog_id, payload, content_encoding in rows
+        ]
+
+    def evict(self) -> None:
+        with self.__lock, self.__connection:
+            self.__connection.execute(
+                'DELETE FROM jobs WHERE finished <= ?', (self.__clock() - self.__ttl,)
+            )
+            self.__connection.execute(
+                'DELETE FROM batches WHERE finished <= ?', (self.__clock() - self.__ttl,)
+            )
+
+            # Keep the most recent jobs that fit in the maximum size
+            self.__connection.execute('''
+                DELETE FROM jobs WHERE id IN (
+                    SELECT id FROM (
+                        SELECT id, SUM(size) OVER (ORDER BY finished DESC, id) AS total_size
+                        FROM jobs WHERE finished IS NOT NULL
+                    ) WHERE total_size > ?
+                )
+            ''', (self.__max_size,))
+
+    def close(self) -> None:
+        with self.__lock:
+            self.__connection.close()
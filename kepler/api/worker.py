@@ -0,0 +1,299 @@
+# Functions run by worker processes, away from the API's event loop
+
+from collections.abc import Iterator
+from io import BytesIO, TextIOWrapper
+import json
+import os
+from multiprocessing.connection import Connection
+import tempfile
+import threading
+import time
+import typing
+
+from .. import io
+from ..io.compression import open_gzip_text_stream
+from ..scheduler import SchedulingProblemModel
+from ..scheduler.config import create_solver
+from ..scheduler.progress import SolverProgress
+from ..io.stream import JsonStreamReader
+from ..types import (
+    Catalog,
+    CatalogError,
+    Course,
+    SchedulingProblem,
+    SchedulingProblemError,
+    Student
+)
+from .jobs import JobPriority, JobStatus
+
+SOLVER_LOG_POLLING_INTERVAL = 0.25
+
+T = typing.TypeVar('T')
+
+# The courses of a submission, either its own or those of the catalog it references
+PayloadCourses: typing.TypeAlias = list[Course] | Catalog
+
+# The catalogs submissions may reference, by id, in each parsing process
+__catalogs: dict[str, Catalog] = {}
+
+class ParsedSubmission:
+    def __init__(self, problem: SchedulingProblem, priority: JobPriority, cost: int) -> None:
+        self.problem = problem
+        self.priority = priority
+        self.cost = cost
+
+def initialize_parsing_worker(catalogs: dict[str, Catalog]) -> None:
+    __catalogs.clear()
+    __catalogs.update(catalogs)
+
+def parse_catalog(payload: bytes, content_encoding: str) -> Catalog:
+    # NOTE: the catalog's conflict graph is built here, once, and pickled along with it
+    return __build_catalog(io.import_json_catalog_object(__load_payload(payload, content_encoding)))
+
+def parse_submission(payload: bytes, content_encoding: str) -> ParsedSubmission:
+    # Submissions are problems whose root may also have the job's options (its priority), and which
+    # may reference a catalog (by "catalog_id") instead of having their own courses
+    root, students = __read_payload(payload, content_encoding, 'students', __import_students)
+
+    courses = root.catalog if root.catalog is not None else root.courses
+    if courses is None or students is None:
+        necessary_keys = {'students'} if root.catalog is not None else {'courses', 'students'}
+        missing_keys = ', '.join(sorted(necessary_keys - root.keys))
+        raise io.JsonImporterError(
+            f'Missing the following necessary keys for the JSON\'s root: {missing_keys}'
+        )
+
+    try:
+        problem = SchedulingProblem(courses, students)
+    except SchedulingProblemError as e:
+        raise io.JsonImporterError(f'Invalid scheduling problem: {e}') from e
+
+    # NOTE: the digest is cached, and pickled along with the problem
+    problem.digest
+    return ParsedSubmission(problem, root.priority, estimate_problem_cost(problem))
+
+def parse_batch(payload: bytes, content_encoding: str) -> list[ParsedSubmission]:
+    # Batches have a single catalog, under "courses" (or referenced by "catalog_id"), and its
+    # variants, each with its own "students". The catalog is only parsed once, and shared by every
+    # variant, along with its conflict graph.
+    root, problems = __read_payload(payload, content_encoding, 'variants', __import_variants)
+
+    if problems is None:
+        necessary_keys = {'variants'} if root.catalog is not None else {'courses', 'variants'}
+        raise io.JsonImporterError(
+            f'Batches must be objects with the following keys: {", ".join(sorted(necessary_keys))}'
+        )
+
+    return [
+        ParsedSubmission(problem, root.priority, estimate_problem_cost(problem))
+        for problem in problems
+    ]
+
+class PayloadRoot:
+    # The keys of a submission's root object, along with its options and courses
+    def __init__(self) -> None:
+        self.keys: set[str] = set()
+        self.priority = JobPriority.NORMAL
+        self.catalog: None | Catalog = None
+        self.courses: None | list[Course] = None
+
+def __read_payload(
+    payload: bytes,
+    content_encoding: str,
+    content_key: str,
+    read_content: typing.Callable[[PayloadCourses, object], T]) -> tuple[PayloadRoot, None | T]:
+
+    # Reads a submission's root object without loading the whole document: once its courses are
+    # known, its content (the value of content_key) is read by read_content, as an iterator over
+    # its items if it's an array. The content is only kept in memory if it comes before the courses.
+    reader = JsonStreamReader(__open_payload(payload, content_encoding))
+    root = PayloadRoot()
+    content: None | T = None
+    content_json: object = None
+
+    try:
+        for key in reader.read_object():
+            root.keys.add(key)
+            courses = root.catalog if root.catalog is not None else root.courses
+
+            if key == 'priority':
+                root.priority = __parse_priority(reader.read_value())
+            elif key == 'catalog_id':
+                root.catalog = __get_catalog(reader.read_value())
+            elif key == 'courses':
+                root.courses = io.import_json_catalog_object(reader.read_value())
+            elif key == content_key and courses is not None and reader.peek() == '[':
+                content = read_content(courses, reader.read_array())
+            elif key == content_key:
+                content_json = reader.read_value()
+            else:
+                reader.read_value()
+
+        reader.expect_end()
+    except json.JSONDecodeError as e:
+        raise io.JsonImporterError(f'Failed to parse JSON string: {e}') from e
+
+    if root.catalog is not None and 'courses' in root.keys:
+        raise io.JsonImporterError('Problems with a catalog_id can\'t have their own courses')
+
+    courses = root.catalog if root.catalog is not None else root.courses
+    if content is None and content_key in root.keys and courses is not None:
+        content = read_content(courses, content_json)
+
+    return root, content
+
+def __open_payload(payload: bytes, content_encoding: str) -> typing.TextIO:
+    # NOTE: the payload is decoded (and decompressed) while it is parsed
+    if content_encoding == 'gzip':
+        return open_gzip_text_stream(BytesIO(payload))
+    else:
+        return TextIOWrapper(BytesIO(payload), encoding='utf-8')
+
+def __load_payload(payload: bytes, content_encoding: str) -> object:
+    try:
+        return json.load(__open_payload(payload, content_encoding))
+    except json.JSONDecodeError as e:
+        raise io.JsonImporterError(f'Failed to parse JSON string: {e}') from e
+
+def __build_catalog(courses: list[Course]) -> Catalog:
+    try:
+        catalog = Catalog(courses)
+    except CatalogError as e:
+        raise io.JsonImporterError(f'Invalid catalog: {e}') from e
+
+    catalog.list_conflicting_shifts()
+    return catalog
+
+def __get_catalog(catalog_id: object) -> Catalog:
+    catalog = __catalogs.get(catalog_id) if isinstance(catalog_id, str) else None
+    if catalog is None:
+        raise io.JsonImporterError(f'Unknown catalog {json.dumps(catalog_id)}')
+
+    return catalog
+
+def __import_students(courses: PayloadCourses, students_json: object) -> list[Student]:
+    courses_dict = dict(courses.courses) if isinstance(courses, Catalog) else \
+        {course.id: course for course in courses}
+
+    return io.import_json_students_object(students_json, courses_dict)
+
+def __import_variants(courses: PayloadCourses, variants_json: object) -> list[SchedulingProblem]:
+
+    if not isinstance(variants_json, (list, Iterator)):
+        raise io.JsonImporterError('Batch variants must be a non-empty array')
+
+    catalog = courses if isinstance(courses, Catalog) else __build_catalog(courses)
+    problems: list[SchedulingProblem] = []
+    for i, variant_json in enumerate(variants_json):
+        try:
+            if not isinstance(variant_json, dict) or 'students' not in variant_json:
+                raise io.JsonImporterError('Variants must be objects with students')
+
+            problem = __import_catalog_problem(catalog, variant_json)
+        except io.JsonImporterError as e:
+            raise io.JsonImporterError(f'Invalid batch variant {i}: {e}') from e
+
+        problem.digest
+        problems.append(problem)
+
+    if not problems:
+        raise io.JsonImporterError('Batch variants must be a non-empty array')
+
+    return problems
+
+def __import_catalog_problem(catalog: Catalog, root_json: dict[str, object]) -> SchedulingProblem:
+    students = io.import_json_students_object(root_json['students'], dict(catalog.courses))
+
+    try:
+        return SchedulingProblem(catalog, students)
+    except SchedulingProblemError as e:
+        raise io.JsonImporterError(f'Invalid scheduling problem: {e}') from e
+
+def __parse_priority(priority_json: object) -> JobPriority:
+    try:
+        return JobPriority(priority_json)
+    except ValueError:
+        expected = ', '.join(priority.value for priority in JobPriority)
+        raise io.JsonImporterError(
+            f'Unknown priority {json.dumps(priority_json)}. Expected one of: {expected}'
+        ) from None
+
+def estimate_problem_cost(problem: SchedulingProblem) -> int:
+    # The size of the problem's model: the number of (student, shift) assignment variables
+    shift_counts = {
+        course.id: sum(len(shifts) for shifts in course.shifts.values())
+        for course in problem.courses.values()
+    }
+
+    return sum(
+        shift_counts[course_id]
+        for student in problem.students.values()
+        for course_id in student.enrollments
+    )
+
+def solve_problem(connection: Connection, problem: SchedulingProblem, solver_threads: int) -> None:
+    # Status updates and the outcome of the job are sent as (kind, value) messages. The solution is
+    # exported here, so that the API process only has to forward it.
+    if hasattr(os, 'setsid'):
+        # So that cancelling the job kills the CBC process too
+        os.setsid()
+
+    try:
+        connection.send(('status', JobStatus.BUILDING))
+        model = SchedulingProblemModel(problem)
+
+        connection.send(('status', JobStatus.RUNNING))
+        with tempfile.TemporaryDirectory() as directory:
+            log_path = os.path.join(directory, 'cbc.log')
+
+            finished = threading.Event()
+            follower = threading.Thread(
+                target=__follow_solver_log, args=(connection, log_path, finished)
+            )
+            follower.start()
+
+            try:
+                solution = model.solve(create_solver(threads=solver_threads, log_path=log_path))
+            finally:
+                finished.set()
+                follower.join()
+
+        response = ''.join(['{"schedules": ', *io.export_json_solution_chunks(solution), '}'])
+        connection.send(('result', response.encode('utf-8')))
+    except Exception as e:
+        connection.send(('error', e))
+    finally:
+        connection.close()
+
+def __follow_solver_log(connection: Connection, log_path: str, finished: threading.Event) -> None:
+    # Reads CBC's log while it's written, and sends the solver's progress whenever it changes (at
+    # most once per polling interval)
+    start_time = time.monotonic()
+    progress = SolverProgress()
+
+    while not os.path.exists(log_path):
+        if finished.wait(SOLVER_LOG_POLLING_INTERVAL):
+            return
+
+    with open(log_path, encoding='utf-8', errors='replace') as log:
+        partial_line = ''
+        done = False
+
+        while not done:
+            done = finished.wait(SOLVER_LOG_POLLING_INTERVAL)
+
+            changed = False
+            for line in (partial_line + log.read()).splitlines(keepends=True):
+                if line.endswith('\n'):
+                    changed |= progress.update(line.strip())
+                    partial_line = ''
+                else:
+                    partial_line = line
+
+            if changed:
+                connection.send(('progress', {
+                    'incumbent_objective': progress.incumbent_objective,
+                    'best_bound': progress.best_bound,
+                    'gap': progress.gap,
+                    'elapsed_time': round(time.monotonic() - start_time, 3)
+                }))
@@ -1,24 +1,77 @@
+from .binary import (
+    BinaryFormatError,
+    BinaryProblemFile,
+    export_binary_problem_file,
+    export_binary_solution_file,
+    import_binary_columnar_problem_file,
+    import_binary_problem_file,
+    import_binary_solution_file
+)
+
 from .exporter import (
     JsonExporterError,
+    export_json_problem_file,
+    export_json_problem_object,
+    export_json_problem_string,
+    export_json_solution_chunks,
     export_json_solution_file,
     export_json_solution_object,
+    export_json_solution_stream,
     export_json_solution_string
 )
 
 from .importer import (
     JsonImporterError,
+    import_catalog_file,
+    import_csv_catalog_stream,
+    import_csv_problem_file,
+    import_csv_students_stream,
+    import_json_catalog_object,
+    import_json_catalog_stream,
+    import_json_columnar_problem_file,
+    import_json_columnar_problem_object,
+    import_json_columnar_problem_string,
     import_json_problem_file,
     import_json_problem_object,
-    import_json_problem_string
+    import_json_problem_stream,
+    import_json_problem_string,
+    import_json_students_object,
+    import_ndjson_problem_file,
+    import_ndjson_students_stream
 )
 
 __all__ = [
+    'BinaryFormatError',
+    'BinaryProblemFile',
     'JsonExporterError',
     'JsonImporterError',
+    'export_binary_problem_file',
+    'export_binary_solution_file',
+    'export_json_problem_file',
+    'export_json_problem_object',
+    'export_json_problem_string',
+    'export_json_solution_chunks',
     'export_json_solution_file',
     'export_json_solution_object',
+    'export_json_solution_stream',
     'export_json_solution_string',
+    'import_binary_columnar_problem_file',
+    'import_binary_problem_file',
+    'import_binary_solution_file',
+    'import_catalog_file',
+    'import_csv_catalog_stream',
+    'import_csv_problem_file',
+    'import_csv_students_stream',
+    'import_json_catalog_object',
+    'import_json_catalog_stream',
+    'import_json_columnar_problem_file',
+    'import_json_columnar_problem_object',
+    'import_json_columnar_problem_string',
     'import_json_problem_file',
     'import_json_problem_object',
-    'import_json_problem_string'
+    'import_json_problem_stream',
+    'import_json_problem_string',
+    'import_json_students_object',
+    'import_ndjson_problem_file',
+    'import_ndjson_students_stream'
 ]
@@ -0,0 +1,495 @@
+from __future__ import annotations
+from array import array
+from collections.abc import Sequence
+import mmap
+import struct
+import sys
+import types
+import typing
+
+from ..types import *
+
+class BinaryFormatError(Exception):
+    pass
+
+# Layout of a .kbin file (little-endian):
+#
+#   header     magic, version, kind, number of sections
+#   directory  (offset, length in bytes) of each section, in the order of the tables below
+#   sections   each padded to 8 bytes
+#
+# Strings (course ids and student numbers) are interned in a single table, and every other table
+# holds integers that index other tables. Variable-length lists use CSR-style offsets, as in
+# ColumnarSchedulingProblem, whose shift order (course, shift type, shift number) is also the
+# order of the shift table. Solutions store their problem followed by the final schedules.
+BINARY_MAGIC = b'KBIN'
+BINARY_VERSION = 1
+BINARY_PROBLEM_KIND = 1
+BINARY_SOLUTION_KIND = 2
+
+BINARY_PROBLEM_TABLES: list[tuple[str, str]] = [
+    ('string_offsets', 'q'),
+    ('string_data', 'B'),
+    ('course_ids', 'i'),
+    ('course_years', 'i'),
+    ('course_shift_offsets', 'q'),
+    ('shift_types', 'b'),
+    ('shift_numbers', 'i'),
+    ('shift_capacities', 'i'),
+    ('shift_timeslot_offsets', 'q'),
+    ('timeslot_days', 'b'),
+    ('timeslot_starts', 'h'),
+    ('timeslot_ends', 'h'),
+    ('student_numbers', 'i'),
+    ('student_years', 'i'),
+    ('enrollment_offsets', 'q'),
+    ('enrollment_courses', 'i'),
+    ('schedule_offsets', 'q'),
+    ('schedule_shifts', 'i')
+]
+
+BINARY_SOLUTION_TABLES: list[tuple[str, str]] = BINARY_PROBLEM_TABLES + [
+    ('solution_students', 'i'),
+    ('solution_offsets', 'q'),
+    ('solution_shifts', 'i')
+]
+
+T = typing.TypeVar('T')
+
+BINARY_HEADER = struct.Struct('<4sHHI')
+BINARY_DIRECTORY_ENTRY = struct.Struct('<QQ')
+BINARY_SHIFT_TYPES = list(ShiftType)
+BINARY_WEEKDAYS = list(Weekday)
+
+def export_binary_problem_file(
+    path: str,
+    problem: SchedulingProblem | ColumnarSchedulingProblem) -> None:
+
+    if isinstance(problem, SchedulingProblem):
+        problem = ColumnarSchedulingProblem.from_problem(problem)
+
+    __write_binary_file(path, BINARY_PROBLEM_KIND, __encode_problem(problem))
+
+def export_binary_solution_file(path: str, solution: SchedulingProblemSolution) -> None:
+    problem = solution.columnar_problem or ColumnarSchedulingProblem.from_problem(solution.problem)
+    tables = __encode_problem(problem)
+
+    student_indices = {number: i for i, number in enumerate(problem.student_numbers)}
+    shift_indices = ColumnarSchedulingProblem.index_shifts(problem.courses)
+
+    solution_students = array('i')
+    solution_offsets = array('q', [0])
+    solution_shifts = array('i')
+    for number, schedule in solution.final_schedules.items():
+        solution_students.append(student_indices[number])
+        solution_shifts.extend(
+            shift_indices[course_id, shift.type, shift.number]
+            for (course_id, _), shift in schedule.shifts.items()
+        )
+        solution_offsets.append(len(solution_shifts))
+
+    tables.extend([solution_students, solution_offsets, solution_shifts])
+    __write_binary_file(path, BINARY_SOLUTION_KIND, tables)
+
+def import_binary_problem_file(path: str) -> SchedulingProblem:
+    with BinaryProblemFile(path) as f:
+        return f.to_problem()
+
+def import_binary_columnar_problem_file(path: str) -> ColumnarSchedulingProblem:
+    with BinaryProblemFile(path) as f:
+        return f.to_columnar_problem()
+
+def import_binary_solution_file(path: str) -> SchedulingProblemSolution:
+    with BinaryProblemFile(path) as f:
+        return f.to_solution()
+
+def __encode_problem(problem: ColumnarSchedulingProblem) -> list[array[typing.Any]]:
+    strings: dict[str, int] = {}
+
+    def intern(string: str) -> int:
+        return strings.setdefault(string, len(strings))
+
+    course_ids = array('i', (intern(course.id) for course in problem.courses))
+    course_years = array('i', (course.year for course in problem.courses))
+    course_shift_offsets = array('q', [0] * (len(problem.courses) + 1))
+    for course_index in problem.shift_courses:
+        course_shift_offsets[course_index + 1] += 1
+    for i in range(len(problem.courses)):
+        course_shift_offsets[i + 1] += course_shift_offsets[i]
+
+    shift_types = array('b')
+    shift_numbers = array('i')
+    shift_capacities = array('i')
+    shift_timeslot_offsets = array('q', [0])
+    timeslot_days = array('b')
+    timeslot_starts = array('h')
+    timeslot_ends = array('h')
+
+    for _, shift in problem.shifts:
+        shift_types.append(BINARY_SHIFT_TYPES.index(shift.type))
+        shift_numbers.append(shift.number)
+        shift_capacities.append(shift.capacity)
+
+        for timeslot in sorted(shift.timeslots):
+            timeslot_days.append(BINARY_WEEKDAYS.index(timeslot.day))
+            timeslot_starts.append(timeslot.start.hour * 60 + timeslot.start.minute)
+            timeslot_ends.append(timeslot.end.hour * 60 + timeslot.end.minute)
+
+        shift_timeslot_offsets.append(len(timeslot_days))
+
+    student_numbers = array('i', (intern(number) for number in problem.student_numbers))
+
+    encoded_strings = [string.encode('utf-8') for string in strings]
+    string_offsets = array('q', [0])
+    for encoded_string in encoded_strings:
+        string_offsets.append(string_offsets[-1] + len(encoded_string))
+
+    return [
+        string_offsets,
+        array('B', b''.join(encoded_strings)),
+        course_ids,
+        course_years,
+        course_shift_offsets,
+        shift_types,
+        shift_numbers,
+        shift_capacities,
+        shift_timeslot_offsets,
+        timeslot_days,
+        timeslot_starts,
+        timeslot_ends,
+        student_numbers,
+        array('i', problem.student_years),
+        array('q', problem.enrollment_offsets),
+        array('i', problem.enrollment_courses),
+        array('q', problem.schedule_offsets),
+        array('i', problem.schedule_shifts)
+    ]
+
+def __write_binary_file(path: str, kind: int, tables: list[array[typing.Any]]) -> None:
+    directory_size = BINARY_HEADER.size + len(tables) * BINARY_DIRECTORY_ENTRY.size
+    offset = directory_size + (-directory_size % 8)
+
+    directory = bytearray(BINARY_HEADER.pack(BINARY_MAGIC, BINARY_VERSION, kind, len(tables)))
+    for table in tables:
+        length = len(table) * table.itemsize
+        directory += BINARY_DIRECTORY_ENTRY.pack(offset, length)
+        offset += length + (-length % 8)
+
+    try:
+        with open(path, mode='wb') as f:
+            f.write(directory)
+            f.write(bytes(-len(directory) % 8))
+
+            for table in tables:
+                if sys.byteorder == 'big':
+                    table.byteswap() # pragma: no cover
+
+                f.write(table.tobytes())
+                f.write(bytes(-len(table) * table.itemsize % 8))
+    except OSError as e:
+        raise BinaryFormatError(f'Failed to write to binary file {path}: {e}') from e
+
+# NOTE: the file is memory-mapped and nothing is decoded until it is requested. The catalog is
+# decoded as a whole on first access, as it is small, while students can be materialized one at a
+# time, or copied in bulk into a ColumnarSchedulingProblem.
+class BinaryProblemFile:
+    def __init__(self, path: str) -> None:
+        self.__path = path
+        try:
+            with open(path, mode='rb') as f:
+                self.__mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError) as e:
+            raise BinaryFormatError(f'Failed to read binary file {path}: {e}') from e
+
+        try:
+            self.__sections = self.__read_directory()
+        except BaseException:
+            self.__mmap.close()
+            raise
+
+        self.__courses: None | list[Course] = None
+        self.__shifts: list[tuple[Course, Shift]] = []
+
+    @property
+    def is_solution(self) -> bool:
+        return len(self.__sections) == len(BINARY_SOLUTION_TABLES)
+
+    @property
+    def courses(self) -> Sequence[Course]:
+        if self.__courses is None:
+            self.__courses = self.__read_catalog()
+
+        return self.__courses
+
+    @property
+    def student_count(self) -> int:
+        return self.__count('student_numbers')
+
+    def read_student(self, index: int) -> Student:
+        if not 0 <= index < self.student_count:
+            raise IndexError(f'Student index {index} out of range')
+
+        courses = self.courses
+        try:
+            enrollments = [
+                BinaryProblemFile.__get(courses, course_index, 'course')
+                for course_index in self.__read_range(
+                    'enrollment_courses', 'enrollment_offsets', index
+                )
+            ]
+            schedule = Schedule.interned(
+                BinaryProblemFile.__get(self.__shifts, shift_index, 'shift')
+                for shift_index in self.__read_range('schedule_shifts', 'schedule_offsets', index)
+            )
+
+            return Student(
+                self.__read_string(self.__read_item('student_numbers', index)),
+                self.__read_item('student_years', index),
+                enrollments,
+                schedule
+            )
+        except (IndexError, ScheduleError, StudentError) as e:
+            raise BinaryFormatError(f'Invalid student in binary file {self.__path}: {e}') from e
+
+    def to_columnar_problem(self) -> ColumnarSchedulingProblem:
+        strings = self.__read_strings()
+
+        try:
+            return ColumnarSchedulingProblem(
+                self.courses,
+                (
+                    BinaryProblemFile.__get(strings, i, 'string')
+                    for i in self.__read_table('student_numbers')
+                ),
+                self.__read_table('student_years'),
+                self.__read_table('enrollment_offsets'),
+                self.__read_table('enrollment_courses'),
+                self.__read_table('schedule_offsets'),
+                self.__read_table('schedule_shifts')
+            )
+        except (IndexError, ColumnarSchedulingProblemError) as e:
+            raise BinaryFormatError(f'Invalid problem in binary file {self.__path}: {e}') from e
+
+    def to_problem(self) -> SchedulingProblem:
+        try:
+            return self.to_columnar_problem().to_problem()
+        except (ScheduleError, StudentError, SchedulingProblemError) as e:
+            raise BinaryFormatError(f'Invalid problem in binary file {self.__path}: {e}') from e
+
+    def to_solution(self) -> SchedulingProblemSolution:
+        if not self.is_solution:
+            raise BinaryFormatError(f'Binary file {self.__path} does not contain a solution')
+
+        problem = self.to_problem()
+        student_numbers = list(problem.students)
+        solution_students = self.__read_table('solution_students')
+        solution_offsets = self.__read_table('solution_offsets')
+        solution_shifts = self.__read_table('solution_shifts')
+
+        try:
+            if len(solution_offsets) != len(solution_students) + 1:
+                raise IndexError('solution columns with different lengths')
+
+            BinaryProblemFile.__check_offsets(solution_offsets, len(solution_shifts), 'solution')
+            final_schedules: dict[str, Schedule] = {}
+            for i, student_index in enumerate(solution_students):
+                number = BinaryProblemFile.__get(student_numbers, student_index, 'student')
+                final_schedules[number] = Schedule.interned(
+                    BinaryProblemFile.__get(self.__shifts, shift_index, 'shift')
+                    for shift_index in solution_shifts[
+                        solution_offsets[i]:solution_offsets[i + 1]
+                    ]
+                )
+
+            return SchedulingProblemSolution(problem, final_schedules)
+        except (IndexError, ScheduleError, SchedulingProblemSolutionError) as e:
+            raise BinaryFormatError(f'Invalid solution in binary file {self.__path}: {e}') from e
+
+    def close(self) -> None:
+        self.__mmap.close()
+
+    def __enter__(self) -> BinaryProblemFile:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: None | type[BaseException],
+        exc_value: None | BaseException,
+        traceback: None | types.TracebackType) -> None:
+
+        self.close()
+
+    def __repr__(self) -> str:
+        return f'BinaryProblemFile(path={self.__path!r})'
+
+    def __read_directory(self) -> dict[str, tuple[int, int, str]]:
+        header_size = BINARY_HEADER.size
+        entry_size = BINARY_DIRECTORY_ENTRY.size
+        if len(self.__mmap) < header_size:
+            raise BinaryFormatError(f'Binary file {self.__path} is truncated')
+
+        magic, version, kind, section_count = \
+            BINARY_HEADER.unpack_from(self.__mmap, 0)
+
+        if magic != BINARY_MAGIC:
+            raise BinaryFormatError(f'File {self.__path} is not a kepler binary file')
+        elif version != BINARY_VERSION:
+            raise BinaryFormatError(
+                f'Unsupported version {version} of binary file {self.__path}'
+            )
+
+        if kind == BINARY_PROBLEM_KIND:
+            tables = BINARY_PROBLEM_TABLES
+        elif kind == BINARY_SOLUTION_KIND:
+            tables = BINARY_SOLUTION_TABLES
+        else:
+            raise BinaryFormatError(f'Unknown kind {kind} of binary file {self.__path}')
+
+        if section_count != len(tables) or \
+            len(self.__mmap) < header_size + section_count * entry_size:
+
+            raise BinaryFormatError(f'Invalid section directory in binary file {self.__path}')
+
+        sections: dict[str, tuple[int, int, str]] = {}
+        for i, (name, typecode) in enumerate(tables):
+            offset, length = BINARY_DIRECTORY_ENTRY.unpack_from(
+                self.__mmap, header_size + i * entry_size
+            )
+
+            item_size = array(typecode).itemsize
+            if offset + length > len(self.__mmap) or length % item_size != 0:
+                raise BinaryFormatError(f'Invalid section {name} in binary file {self.__path}')
+
+            sections[name] = (offset, length // item_size, typecode)
+
+        return sections
+
+    def __count(self, name: str) -> int:
+        return self.__sections[name][1]
+
+    def __read_table(self, name: str, start: int = 0, stop: None | int = None) -> array[int]:
+        offset, count, typecode = self.__sections[name]
+        stop = count if stop is None else stop
+        if not 0 <= start <= stop <= count:
+            raise IndexError(f'{name}[{start}:{stop}] out of range')
+
+        table = array(typecode)
+        table.frombytes(self.__mmap[offset + start * table.itemsize:offset + stop * table.itemsize])
+        if sys.byteorder == 'big':
+            table.byteswap() # pragma: no cover
+
+        return table
+
+    def __read_item(self, name: str, index: int) -> int:
+        return self.__read_table(name, index, index + 1)[0]
+
+    def __read_range(self, name: str, offsets_name: str, index: int) -> array[int]:
+        start, stop = self.__read_table(offsets_name, index, index + 2)
+        return self.__read_table(name, start, stop)
+
+    def __read_string(self, index: int) -> str:
+        start, stop = self.__read_table('string_offsets', index, index + 2)
+        offset = self.__sections['string_data'][0]
+        if not 0 <= start <= stop <= self.__count('string_data'):
+            raise IndexError(f'string {index} out of range')
+
+        return self.__mmap[offset + start:offset + stop].decode('utf-8')
+
+    def __read_strings(self) -> list[str]:
+        offsets = self.__read_table('string_offsets')
+        data = self.__read_table('string_data').tobytes()
+
+        try:
+            BinaryProblemFile.__check_offsets(offsets, len(data), 'string')
+            return [
+                data[offsets[i]:offsets[i + 1]].decode('utf-8') for i in range(len(offsets) - 1)
+            ]
+        except (IndexError, UnicodeDecodeError) as e:
+            raise BinaryFormatError(f'Invalid string in binary file {self.__path}: {e}') from e
+
+    @staticmethod
+    def __get(items: Sequence[T], index: int, name: str) -> T:
+        # NOTE: negative indices are invalid, rather than counted from the end
+        if not 0 <= index < len(items):
+            raise IndexError(f'{name} index {index} out of range')
+
+        return items[index]
+
+    @staticmethod
+    def __check_offsets(offsets: Sequence[int], count: int, name: str) -> None:
+        if len(offsets) == 0 or offsets[0] != 0 or offsets[-1] != count or \
+            any(offsets[i] > offsets[i + 1] for i in range(len(offsets) - 1)):
+
+            raise IndexError(f'invalid {name} offsets')
+
+    def __read_catalog(self) -> list[Course]:
+        strings = self.__read_strings()
+        course_ids = self.__read_table('course_ids')
+        course_years = self.__read_table('course_years')
+        course_shift_offsets = self.__read_table('course_shift_offsets')
+        shift_types = self.__read_table('shift_types')
+        shift_numbers = self.__read_table('shift_numbers')
+        shift_capacities = self.__read_table('shift_capacities')
+        shift_timeslot_offsets = self.__read_table('shift_timeslot_offsets')
+        timeslot_days = self.__read_table('timeslot_days')
+        timeslot_starts = self.__read_table('timeslot_starts')
+        timeslot_ends = self.__read_table('timeslot_ends')
+
+        try:
+            if len(course_shift_offsets) != len(course_ids) + 1 or \
+                len(shift_timeslot_offsets) != len(shift_types) + 1:
+
+                raise IndexError('catalog columns with different lengths')
+
+            BinaryProblemFile.__check_offsets(course_shift_offsets, len(shift_types), 'shift')
+            BinaryProblemFile.__check_offsets(
+                shift_timeslot_offsets, len(timeslot_days), 'timeslot'
+            )
+
+            courses: list[Course] = []
+            for i, course_id in enumerate(course_ids):
+                shifts: list[Shift] = []
+                for j in range(course_shift_offsets[i], course_shift_offsets[i + 1]):
+                    timeslots = [
+                        Timeslot.interned(
+                            BinaryProblemFile.__get(BINARY_WEEKDAYS, timeslot_days[k], 'weekday'),
+                            ScheduleTime.interned(*divmod(timeslot_starts[k], 60)),
+                            ScheduleTime.interned(*divmod(timeslot_ends[k], 60))
+                        )
+                        for k in range(shift_timeslot_offsets[j], shift_timeslot_offsets[j + 1])
+                    ]
+
+                    shifts.append(Shift(
+                        BinaryProblemFile.__get(BINARY_SHIFT_TYPES, shift_types[j], 'shift type'),
+                        shift_numbers[j],
+                        shift_capacities[j],
+                        timeslots
+                    ))
+
+                courses.append(Course(
+                    BinaryProblemFile.__get(strings, course_id, 'string'), course_years[i], shifts
+                ))
+        except (IndexError, ScheduleTimeError, TimeslotError, ShiftError, CourseError) as e:
+            raise BinaryFormatError(f'Invalid catalog in binary file {self.__path}: {e}') from e
+
+        shift_index = 0
+        for course in courses:
+            for shift_type in sorted(course.shifts):
+                for shift_number in sorted(course.shifts[shift_type]):
+                    shift = course.shifts[shift_type][shift_number]
+                    # NOTE: shift types are known to be valid, as they were decoded above
+                    if shift_index >= len(shift_types) or \
+                        BINARY_SHIFT_TYPES[shift_types[shift_index]] != shift.type or \
+                        shift_numbers[shift_index] != shift.number:
+
+                        raise BinaryFormatError(
+                            f'Shifts out of order in binary file {self.__path}'
+                        )
+
+                    self.__shifts.append((course, shift))
+                    shift_index += 1
+
+        if shift_index != len(shift_types):
+            raise BinaryFormatError(f'Shifts out of order in binary file {self.__path}')
+
+        return courses
@@ -0,0 +1,30 @@
+import gzip
+import io
+import typing
+import zlib
+
+GZIP_MAGIC = b'\x1f\x8b'
+GZIP_EXTENSION = '.gz'
+
+# Errors that may be raised while reading a damaged or truncated compressed stream
+COMPRESSION_ERRORS = (OSError, EOFError, zlib.error)
+
+def open_text_file(path: str, mode: typing.Literal['r', 'w']) -> typing.TextIO:
+    # Files are compressed when written with a .gz extension. When reading, they are detected by
+    # their magic bytes, regardless of their name. Either way, (de)compression is streamed.
+    if mode == 'r':
+        with open(path, mode='rb') as f:
+            is_gzip = f.read(len(GZIP_MAGIC)) == GZIP_MAGIC
+
+        if is_gzip:
+            return typing.cast(typing.TextIO, gzip.open(path, mode='rt', encoding='utf-8'))
+        else:
+            return open(path, mode='r', encoding='utf-8')
+    elif path.endswith(GZIP_EXTENSION):
+        return typing.cast(typing.TextIO, gzip.open(path, mode='wt', encoding='utf-8'))
+    else:
+        return open(path, mode='w', encoding='utf-8')
+
+def open_gzip_text_stream(stream: typing.BinaryIO) -> typing.TextIO:
+    gzip_stream = gzip.GzipFile(fileobj=stream, mode='rb')
+    return io.TextIOWrapper(typing.cast(typing.BinaryIO, gzip_stream), encoding='utf-8')
@@ -1,6 +1,18 @@
+from collections.abc import Iterator
 import json
+import typing
 
-from ..types import Schedule, SchedulingProblemSolution, Shift
+from ..types import (
+    Course,
+    Schedule,
+    SchedulingProblem,
+    SchedulingProblemSolution,
+    Shift,
+    ShiftType,
+    Student,
+    Timeslot
+)
+from .compression import open_text_file
 
 class JsonExporterError(Exception):
     pass
@@ -10,25 +22,132 @@ def export_json_solution_file(
     solution: SchedulingProblemSolution) -> None: # pragma: no coverage
 
     try:
-        with open(path, mode='w', encoding='utf-8') as f:
-            json.dump(export_json_solution_object(solution), f)
+        with open_text_file(path, 'w') as f:
+            export_json_solution_stream(f, solution)
     except IOError as e:
         raise JsonExporterError(f'Failed to write to JSON file {path}: {e}') from e
 
+def export_json_solution_stream(stream: typing.TextIO, solution: SchedulingProblemSolution) -> None:
+    for chunk in export_json_solution_chunks(solution):
+        stream.write(chunk)
+
+def export_json_solution_chunks(solution: SchedulingProblemSolution) -> Iterator[str]:
+    # Serializes one student at a time, producing the same text as
+    # json.dumps(export_json_solution_object(solution))
+    #
+    # NOTE: there are few distinct shifts, and many students share the same (interned) schedule,
+    # so each shift and each schedule object is only serialized once
+    shift_fragments: dict[tuple[str, ShiftType, int], str] = {}
+    schedule_fragments: dict[int, str] = {}
+
+    yield '{'
+    for i, number in enumerate(sorted(solution.final_schedules)):
+        schedule = solution.final_schedules[number]
+        schedule_fragment = schedule_fragments.get(id(schedule))
+        if schedule_fragment is None:
+            schedule_fragment = __encode_json_schedule(schedule, shift_fragments)
+            schedule_fragments[id(schedule)] = schedule_fragment
+
+        yield f'{", " if i > 0 else ""}{json.dumps(number)}: {schedule_fragment}'
+    yield '}'
+
 def export_json_solution_string(solution: SchedulingProblemSolution) -> str:
-    return json.dumps(export_json_solution_object(solution))
+    return ''.join(export_json_solution_chunks(solution))
 
 def export_json_solution_object(solution: SchedulingProblemSolution) -> object:
+    # NOTE: students and shifts are sorted, so that the output doesn't depend on the solver.
+    # Each schedule object is only sorted once, but every student gets their own list, so that
+    # the result can be safely modified.
+    sorted_schedules: dict[int, list[tuple[str, Shift]]] = {}
+    solution_json: dict[str, object] = {}
+
+    for number in sorted(solution.final_schedules):
+        schedule = solution.final_schedules[number]
+        if id(schedule) not in sorted_schedules:
+            sorted_schedules[id(schedule)] = __sort_schedule(schedule)
+
+        solution_json[number] = [
+            __export_json_shift(course_id, shift)
+            for course_id, shift in sorted_schedules[id(schedule)]
+        ]
+
+    return solution_json
+
+def export_json_problem_file(path: str, problem: SchedulingProblem) -> None: # pragma: no coverage
+    try:
+        with open_text_file(path, 'w') as f:
+            json.dump(export_json_problem_object(problem), f)
+    except IOError as e:
+        raise JsonExporterError(f'Failed to write to JSON file {path}: {e}') from e
+
+def export_json_problem_string(problem: SchedulingProblem) -> str:
+    return json.dumps(export_json_problem_object(problem))
+
+def export_json_problem_object(problem: SchedulingProblem) -> object:
     return {
-        number: __export_json_schedule(schedule)
-        for number, schedule in solution.final_schedules.items()
+        'courses': [__export_json_course(course) for course in problem.courses.values()],
+        'students': [__export_json_student(student) for student in problem.students.values()]
+    }
+
+def __export_json_course(course: Course) -> dict[str, object]:
+    return {
+        'id': course.id,
+        'year': course.year,
+        'shifts': [
+            {
+                'type': shift.type.value,
+                'number': shift.number,
+                'capacity': shift.capacity,
+                'timeslots': [
+                    __export_json_timeslot(timeslot) for timeslot in sorted(shift.timeslots)
+                ]
+            }
+            for shift_type in sorted(course.shifts)
+            for shift in sorted(course.shifts[shift_type].values())
+        ]
+    }
+
+def __export_json_timeslot(timeslot: Timeslot) -> dict[str, object]:
+    return {
+        'day': timeslot.day.value.lower(),
+        'start': str(timeslot.start),
+        'end': str(timeslot.end)
+    }
+
+def __export_json_student(student: Student) -> dict[str, object]:
+    return {
+        'number': student.number,
+        'year': student.year,
+        'enrollments': list(student.enrollments),
+        'schedule': __export_json_schedule(student.previous_schedule)
     }
 
 def __export_json_schedule(schedule: Schedule) -> list[dict[str, object]]:
     return [
-        __export_json_shift(course_id, shift) for (course_id, _), shift in schedule.shifts.items()
+        __export_json_shift(course_id, shift) for course_id, shift in __sort_schedule(schedule)
     ]
 
+def __encode_json_schedule(
+    schedule: Schedule,
+    shift_fragments: dict[tuple[str, ShiftType, int], str]) -> str:
+
+    encoded_shifts: list[str] = []
+    for course_id, shift in __sort_schedule(schedule):
+        shift_fragment = shift_fragments.get((course_id, shift.type, shift.number))
+        if shift_fragment is None:
+            shift_fragment = json.dumps(__export_json_shift(course_id, shift))
+            shift_fragments[course_id, shift.type, shift.number] = shift_fragment
+
+        encoded_shifts.append(shift_fragment)
+
+    return f'[{", ".join(encoded_shifts)}]'
+
+def __sort_schedule(schedule: Schedule) -> list[tuple[str, Shift]]:
+    return sorted(
+        ((course_id, shift) for (course_id, _), shift in schedule.shifts.items()),
+        key=lambda item: (item[0], item[1].type, item[1].number)
+    )
+
 def __export_json_shift(course_id: str, shift: Shift) -> dict[str, object]:
     return {
         'course': course_id,
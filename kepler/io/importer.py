@@ -1,43 +1,398 @@
+from array import array
+from collections.abc import Iterable, Iterator, Sequence
+from concurrent.futures import Future, ProcessPoolExecutor
+import csv
+import itertools
 import json
+import re
 import typing
 
 from ..types import *
+from .compression import COMPRESSION_ERRORS, GZIP_EXTENSION, open_text_file
+from .schema import compile_bulk_validator
+from .stream import JsonStreamReader
 
 class JsonImporterError(Exception):
     pass
 
-def import_json_problem_file(path: str) -> SchedulingProblem: # pragma: no coverage
+# Students converted by a worker process, sent back as integer columns that index the catalog's
+# courses and shifts: (numbers, years, enrollment offsets, enrollment courses, schedule offsets,
+# schedule shifts)
+StudentChunk: typing.TypeAlias = tuple[
+    list[str], 'array[int]', 'array[int]', 'array[int]', 'array[int]', 'array[int]'
+]
+
+STUDENT_CHUNK_SIZE = 1024
+
+# NOTE: processes > 1 parses the students in parallel, after the catalog. Chunks of students are
+# converted and validated in worker processes by the same code as the serial importer, so the
+# same errors are reported.
+def import_json_problem_file(
+    path: str,
+    processes: int = 1) -> SchedulingProblem: # pragma: no coverage
+
     try:
-        with open(path, mode='r', encoding='utf-8') as f:
-            root_json = json.load(f)
-    except IOError as e:
+        with open_text_file(path, 'r') as f:
+            return __import_json_problem_stream(f, f'file {path}', processes)
+    except COMPRESSION_ERRORS as e:
         raise JsonImporterError(f'Failed to read JSON file {path}: {e}') from e
-    except json.JSONDecodeError as e:
-        raise JsonImporterError(f'Failed to parse JSON file {path}: {e}') from e
 
-    return import_json_problem_object(root_json)
+def import_json_problem_stream(stream: typing.TextIO, processes: int = 1) -> SchedulingProblem:
+    return __import_json_problem_stream(stream, 'stream', processes)
+
+def import_json_problem_string(json_string: str, processes: int = 1) -> SchedulingProblem:
+    return import_json_problem_object(__load_json_string(json_string), processes)
+
+def import_json_problem_object(root_json: object, processes: int = 1) -> SchedulingProblem:
+    __assert_dict_with_keys(root_json, {'students', 'courses'}, 'the JSON\'s root')
+    root_json = typing.cast(dict[str, object], root_json)
+
+    courses = __parse_courses(root_json['courses'])
+    courses_dict = {course.id: course for course in courses}
+    students = __parse_students(root_json['students'], courses_dict, processes)
 
-def import_json_problem_string(json_string: str) -> SchedulingProblem:
     try:
-        root_json = json.loads(json_string)
+        return SchedulingProblem(courses, students)
+    except SchedulingProblemError as e:
+        raise JsonImporterError(f'Invalid scheduling problem: {e}') from e
+
+def __import_json_problem_stream(
+    stream: typing.TextIO,
+    source_name: str,
+    processes: int) -> SchedulingProblem:
+
+    # NOTE: students are converted as soon as they are read, unless they come before the courses
+    reader = JsonStreamReader(stream)
+    courses: None | list[Course] = None
+    courses_dict: dict[str, Course] = {}
+    students: list[Student] = []
+    students_json: list[object] = []
+    root_keys: set[str] = set()
+
+    try:
+        if reader.peek() != '{':
+            root_json = reader.read_value()
+            reader.expect_end()
+            return import_json_problem_object(root_json, processes)
+
+        for key in reader.read_object():
+            root_keys.add(key)
+
+            if key == 'courses':
+                courses = __parse_courses(reader.read_value())
+                courses_dict = {course.id: course for course in courses}
+                students.extend(__parse_students(students_json, courses_dict, processes))
+                students_json.clear()
+            elif key == 'students' and reader.peek() == '[' and courses is not None:
+                students.extend(__parse_students_stream(reader.read_array(), courses_dict, processes))
+            elif key == 'students' and reader.peek() == '[':
+                students_json.extend(reader.read_array())
+            elif key == 'students':
+                __assert_type(reader.read_value(), list, 'students')
+            else:
+                reader.read_value()
+
+        reader.expect_end()
     except json.JSONDecodeError as e:
-        raise JsonImporterError(f'Failed to parse JSON string: {e}') from e
+        raise JsonImporterError(f'Failed to parse JSON {source_name}: {e}') from e
+
+    __assert_dict_with_keys(dict.fromkeys(root_keys), {'students', 'courses'}, 'the JSON\'s root')
+
+    try:
+        return SchedulingProblem(typing.cast(list[Course], courses), students)
+    except SchedulingProblemError as e:
+        raise JsonImporterError(f'Invalid scheduling problem: {e}') from e
+
+def import_json_columnar_problem_file(
+    path: str) -> ColumnarSchedulingProblem: # pragma: no coverage
+
+    return import_json_columnar_problem_object(__load_json_file(path))
 
-    return import_json_problem_object(root_json)
+def import_json_columnar_problem_string(json_string: str) -> ColumnarSchedulingProblem:
+    return import_json_columnar_problem_object(__load_json_string(json_string))
 
-def import_json_problem_object(root_json: object) -> SchedulingProblem:
+def import_json_columnar_problem_object(root_json: object) -> ColumnarSchedulingProblem:
     __assert_dict_with_keys(root_json, {'students', 'courses'}, 'the JSON\'s root')
     root_json = typing.cast(dict[str, object], root_json)
 
     courses = __parse_courses(root_json['courses'])
     courses_dict = {course.id: course for course in courses}
-    students = __parse_students(root_json['students'], courses_dict)
+    course_indices = {course.id: i for i, course in enumerate(courses)}
+    shift_indices = ColumnarSchedulingProblem.index_shifts(courses)
+
+    students_json = root_json['students']
+    __assert_type(students_json, list, 'students')
+    students_json = typing.cast(list[object], students_json)
+
+    student_numbers: list[str] = []
+    student_years: list[int] = []
+    enrollment_offsets = [0]
+    enrollment_courses: list[int] = []
+    schedule_offsets = [0]
+    schedule_shifts: list[int] = []
+
+    # NOTE: students are converted straight into columns, without Student objects
+    for student_json in students_json:
+        __assert_dict_with_keys(student_json, {'number', 'year', 'enrollments'}, 'student')
+        student_json = typing.cast(dict[str, object], student_json)
+
+        student_numbers.append(__parse_string(student_json['number'], 'student number'))
+        student_years.append(__parse_integer(student_json['year'], 'student year'))
+
+        enrollment_courses.extend(
+            course_indices[course.id]
+            for course in __parse_enrollements(student_json['enrollments'], courses_dict)
+        )
+        enrollment_offsets.append(len(enrollment_courses))
+
+        schedule_json = student_json.get('schedule')
+        if schedule_json is not None:
+            __assert_type(schedule_json, list, 'student schedule')
+            schedule_json = typing.cast(list[object], schedule_json)
+
+            for shift_json in schedule_json:
+                course, shift = __parse_schedule_shift(shift_json, courses_dict)
+                schedule_shifts.append(shift_indices[course.id, shift.type, shift.number])
+
+        schedule_offsets.append(len(schedule_shifts))
+
+    try:
+        return ColumnarSchedulingProblem(
+            courses,
+            student_numbers,
+            student_years,
+            enrollment_offsets,
+            enrollment_courses,
+            schedule_offsets,
+            schedule_shifts
+        )
+    except ColumnarSchedulingProblemError as e:
+        raise JsonImporterError(f'Invalid scheduling problem: {e}') from e
+
+def import_ndjson_problem_file(
+    catalog_path: str,
+    students_path: str) -> SchedulingProblem: # pragma: no coverage
+
+    courses = import_catalog_file(catalog_path)
+    courses_dict = {course.id: course for course in courses}
 
+    try:
+        with open_text_file(students_path, 'r') as f:
+            return __build_problem(
+                courses, import_ndjson_students_stream(f, courses_dict, f'file {students_path}')
+            )
+    except COMPRESSION_ERRORS as e:
+        raise JsonImporterError(f'Failed to read NDJSON file {students_path}: {e}') from e
+
+def import_csv_problem_file(
+    catalog_path: str,
+    enrollments_path: str) -> SchedulingProblem: # pragma: no coverage
+
+    courses = import_catalog_file(catalog_path)
+    courses_dict = {course.id: course for course in courses}
+
+    try:
+        with open_text_file(enrollments_path, 'r') as f:
+            return __build_problem(
+                courses, import_csv_students_stream(f, courses_dict, f'file {enrollments_path}')
+            )
+    except COMPRESSION_ERRORS as e:
+        raise JsonImporterError(f'Failed to read CSV file {enrollments_path}: {e}') from e
+
+def import_catalog_file(path: str) -> list[Course]: # pragma: no coverage
+    # CSV catalogs are recognized by their extension (optionally compressed)
+    try:
+        with open_text_file(path, 'r') as f:
+            if path.removesuffix(GZIP_EXTENSION).endswith('.csv'):
+                return import_csv_catalog_stream(f, f'file {path}')
+            else:
+                return import_json_catalog_stream(f, f'file {path}')
+    except COMPRESSION_ERRORS as e:
+        raise JsonImporterError(f'Failed to read catalog file {path}: {e}') from e
+
+def import_json_catalog_stream(stream: typing.TextIO, source_name: str = 'stream') -> list[Course]:
+    # The catalog is either an array of courses or an object with a "courses" array
+    try:
+        catalog_json = json.load(stream)
+    except json.JSONDecodeError as e:
+        raise JsonImporterError(f'Failed to parse JSON {source_name}: {e}') from e
+
+    return import_json_catalog_object(catalog_json)
+
+def import_json_catalog_object(catalog_json: object) -> list[Course]:
+    if type(catalog_json) == dict:
+        __assert_dict_with_keys(catalog_json, {'courses'}, 'the JSON\'s root')
+        catalog_json = catalog_json['courses']
+
+    return __parse_courses(catalog_json)
+
+def import_csv_catalog_stream(stream: typing.TextIO, source_name: str = 'stream') -> list[Course]:
+    # One row per shift, with the columns course, year, shift_type, shift_number, capacity and
+    # timeslots (e.g. "monday 09:00-11:00; friday 14:00-15:00"). Courses without shifts have a
+    # single row with empty shift columns.
+    courses_json: dict[str, dict[str, typing.Any]] = {}
+
+    try:
+        reader = csv.DictReader(stream)
+        __assert_csv_columns(
+            reader.fieldnames,
+            ['course', 'year', 'shift_type', 'shift_number', 'capacity', 'timeslots'],
+            source_name
+        )
+
+        for row in reader:
+            line = reader.line_num
+            course_id = row['course'].strip()
+            year = __parse_csv_integer(row['year'], 'course year', line)
+
+            course_json = courses_json.setdefault(
+                course_id, {'id': course_id, 'year': year, 'shifts': []}
+            )
+            if course_json['year'] != year:
+                raise JsonImporterError(f'Different years for course {course_id} in line {line}')
+
+            if row['shift_type'].strip():
+                course_json['shifts'].append({
+                    'type': row['shift_type'].strip(),
+                    'number': __parse_csv_integer(row['shift_number'], 'shift number', line),
+                    'capacity': __parse_csv_integer(row['capacity'], 'shift capacity', line),
+                    'timeslots': __parse_csv_timeslots(row['timeslots'] or '', line)
+                })
+    except csv.Error as e:
+        raise JsonImporterError(f'Failed to parse CSV {source_name}: {e}') from e
+
+    return __parse_courses(list(courses_json.values()))
+
+def import_json_students_object(
+    students_json: object,
+    courses: dict[str, Course],
+    processes: int = 1) -> list[Student]:
+
+    # Students of an already imported catalog, so that it can be shared by several problems. They
+    # may also be given as an iterator (e.g. JsonStreamReader.read_array()), whose students are
+    # converted as they are read.
+    if isinstance(students_json, Iterator):
+        return __parse_students_stream(students_json, courses, processes)
+    else:
+        return __parse_students(students_json, courses, processes)
+
+def import_ndjson_students_stream(
+    stream: typing.TextIO,
+    courses: dict[str, Course],
+    source_name: str = 'stream') -> Iterator[Student]:
+
+    # One student object per line, converted as soon as it is read
+    for line, student_text in enumerate(stream, 1):
+        if student_text.strip():
+            try:
+                student_json = json.loads(student_text)
+            except json.JSONDecodeError as e:
+                raise JsonImporterError(
+                    f'Failed to parse JSON in line {line} of {source_name}: {e}'
+                ) from e
+
+            yield __parse_student(student_json, courses)
+
+def import_csv_students_stream(
+    stream: typing.TextIO,
+    courses: dict[str, Course],
+    source_name: str = 'stream') -> Iterator[Student]:
+
+    # One row per student, with the columns number, year, enrollments (e.g. "J301N1; J301N2") and,
+    # optionally, schedule (e.g. "J301N1:PL2; J301N2:T1")
+    try:
+        reader = csv.DictReader(stream)
+        __assert_csv_columns(reader.fieldnames, ['number', 'year', 'enrollments'], source_name)
+
+        for row in reader:
+            line = reader.line_num
+            number = row['number'].strip()
+            year = __parse_csv_integer(row['year'], 'student year', line)
+
+            enrollments = [
+                __parse_enrollment(course_id, courses)
+                for course_id in __split_csv_list(row['enrollments'])
+            ]
+            schedule = __parse_schedule(
+                [
+                    __parse_csv_schedule_shift(shift_text, line)
+                    for shift_text in __split_csv_list(row.get('schedule'))
+                ],
+                number,
+                courses
+            )
+
+            try:
+                yield Student(number, year, enrollments, schedule)
+            except StudentError as e:
+                raise JsonImporterError(f'Invalid student {number}: {e}') from e
+    except csv.Error as e:
+        raise JsonImporterError(f'Failed to parse CSV {source_name}: {e}') from e
+
+def __build_problem(courses: list[Course], students: Iterator[Student]) -> SchedulingProblem:
     try:
         return SchedulingProblem(courses, students)
     except SchedulingProblemError as e:
         raise JsonImporterError(f'Invalid scheduling problem: {e}') from e
 
+def __assert_csv_columns(
+    columns: None | Sequence[str],
+    necessary_columns: list[str],
+    source_name: str) -> None:
+
+    missing_columns = [column for column in necessary_columns if column not in (columns or [])]
+    if missing_columns:
+        raise JsonImporterError(
+            f'Missing the following necessary columns in CSV {source_name}: '
+            f'{", ".join(missing_columns)}'
+        )
+
+def __split_csv_list(list_text: None | str) -> list[str]:
+    return [item.strip() for item in (list_text or '').split(';') if item.strip()]
+
+def __parse_csv_integer(integer_text: None | str, property_name: str, line: int) -> int:
+    try:
+        return int(integer_text or '')
+    except ValueError as e:
+        raise JsonImporterError(
+            f'Expected number (integer) for {property_name} in line {line}, got '
+            f'"{integer_text}" instead'
+        ) from e
+
+def __parse_csv_timeslots(timeslots_text: str, line: int) -> list[object]:
+    timeslots_json: list[object] = []
+    for timeslot_text in __split_csv_list(timeslots_text):
+        match = re.fullmatch(r'(\w+)\s+(\S+)\s*-\s*(\S+)', timeslot_text)
+        if match is None:
+            raise JsonImporterError(f'Invalid timeslot "{timeslot_text}" in line {line}')
+
+        timeslots_json.append({'day': match[1], 'start': match[2], 'end': match[3]})
+
+    return timeslots_json
+
+def __parse_csv_schedule_shift(shift_text: str, line: int) -> object:
+    course_id, _, shift_name = shift_text.rpartition(':')
+    match = re.fullmatch(r'([A-Za-z]+)(\d+)', shift_name.strip())
+    if not course_id or match is None:
+        raise JsonImporterError(f'Invalid schedule shift "{shift_text}" in line {line}')
+
+    return {'course': course_id.strip(), 'shift_type': match[1], 'shift_number': int(match[2])}
+
+def __load_json_file(path: str) -> object: # pragma: no coverage
+    try:
+        with open_text_file(path, 'r') as f:
+            return json.load(f)
+    except COMPRESSION_ERRORS as e:
+        raise JsonImporterError(f'Failed to read JSON file {path}: {e}') from e
+    except json.JSONDecodeError as e:
+        raise JsonImporterError(f'Failed to parse JSON file {path}: {e}') from e
+
+def __load_json_string(json_string: str) -> object:
+    try:
+        return json.loads(json_string)
+    except json.JSONDecodeError as e:
+        raise JsonImporterError(f'Failed to parse JSON string: {e}') from e
+
 def __parse_courses(courses_json: object) -> list[Course]:
     __assert_type(courses_json, list, 'courses')
     courses_json = typing.cast(list[object], courses_json)
@@ -101,7 +456,7 @@ def __parse_timeslot(timeslot_json: object) -> Timeslot:
     end = __parse_time(timeslot_json['end'], 'timeslot end')
 
     try:
-        return Timeslot(day, start, end)
+        return Timeslot.interned(day, start, end)
     except TimeslotError as e:
         raise JsonImporterError(f'Invalid timeslot {json.dumps(timeslot_json)}: {e}') from e
 
@@ -123,11 +478,200 @@ def __parse_time(time_json: object, property_name: str) -> ScheduleTime:
     except ScheduleTimeError as e:
         raise JsonImporterError(f'Failed to parse time "{time_json}"') from e
 
-def __parse_students(students_json: object, courses: dict[str, Course]) -> list[Student]:
+def __parse_students(
+    students_json: object,
+    courses: dict[str, Course],
+    processes: int = 1) -> list[Student]:
+
     __assert_type(students_json, list, 'students')
     students_json = typing.cast(list[object], students_json)
 
-    return [__parse_student(student_json, courses) for student_json in students_json]
+    if processes > 1 and len(students_json) > STUDENT_CHUNK_SIZE:
+        return __parse_students_parallel(students_json, list(courses.values()), processes)
+    else:
+        return __convert_students(students_json, courses)
+
+def __parse_students_stream(
+    students_json: Iterator[object],
+    courses: dict[str, Course],
+    processes: int = 1) -> list[Student]:
+
+    if processes > 1:
+        return __parse_students_parallel(students_json, list(courses.values()), processes)
+    else:
+        return list(__convert_students_stream(students_json, courses))
+
+def __convert_students_stream(
+    students_json: Iterator[object],
+    courses: dict[str, Course]) -> Iterator[Student]:
+
+    # Students are converted in chunks, as they are read
+    chunk: list[object] = []
+    try:
+        for student_json in students_json:
+            chunk.append(student_json)
+            if len(chunk) == STUDENT_CHUNK_SIZE:
+                yield from __convert_students(chunk, courses)
+                chunk.clear()
+    except (json.JSONDecodeError, JsonImporterError):
+        # Invalid students before the point of failure are reported first, as when converting one
+        # student at a time
+        __convert_students(chunk, courses)
+        raise
+
+    yield from __convert_students(chunk, courses)
+
+def __parse_students_parallel(
+    students_json: Iterable[object],
+    courses: list[Course],
+    processes: int) -> list[Student]:
+
+    # NOTE: chunks are submitted while students_json is consumed, which may be a stream. Each worker
+    # receives the catalog once, through the pool's initializer.
+    courses_dict = {course.id: course for course in courses}
+    students_iterator = iter(students_json)
+    chunks = [list(itertools.islice(students_iterator, STUDENT_CHUNK_SIZE))]
+    try:
+        chunks.append(list(itertools.islice(students_iterator, STUDENT_CHUNK_SIZE)))
+    except (json.JSONDecodeError, JsonImporterError):
+        __convert_students(chunks[0], courses_dict)
+        raise
+
+    # Worker processes are only worth starting for more than one chunk of students
+    if not chunks[-1]:
+        return __convert_students(chunks[0], courses_dict)
+
+    executor = ProcessPoolExecutor(
+        processes, initializer=__initialize_student_worker, initargs=(courses,)
+    )
+    futures: list[Future[StudentChunk]] = []
+
+    try:
+        try:
+            futures.extend(executor.submit(__parse_student_chunk, chunk) for chunk in chunks)
+            while chunk := list(itertools.islice(students_iterator, STUDENT_CHUNK_SIZE)):
+                futures.append(executor.submit(__parse_student_chunk, chunk))
+        except (json.JSONDecodeError, JsonImporterError):
+            # Invalid students before the point of failure are reported first, as when parsing
+            # serially
+            for future in futures:
+                future.result()
+            raise
+
+        shift_indices = ColumnarSchedulingProblem.index_shifts(courses)
+        shifts = [
+            (courses_dict[course_id], courses_dict[course_id].shifts[shift_type][shift_number])
+            for course_id, shift_type, shift_number in shift_indices
+        ]
+
+        students: list[Student] = []
+        for future in futures:
+            students.extend(__decode_student_chunk(future.result(), courses, shifts))
+
+        return students
+    finally:
+        executor.shutdown(cancel_futures=True)
+
+__student_worker_state: dict[str, typing.Any] = {}
+
+def __initialize_student_worker(courses: list[Course]) -> None:
+    __student_worker_state['courses'] = {course.id: course for course in courses}
+    __student_worker_state['course_indices'] = {course.id: i for i, course in enumerate(courses)}
+    __student_worker_state['shift_indices'] = ColumnarSchedulingProblem.index_shifts(courses)
+
+def __parse_student_chunk(students_json: list[object]) -> StudentChunk:
+    courses = __student_worker_state['courses']
+    course_indices = __student_worker_state['course_indices']
+    shift_indices = __student_worker_state['shift_indices']
+
+    numbers: list[str] = []
+    years = array('i')
+    enrollment_offsets = array('q', [0])
+    enrollment_courses = array('i')
+    schedule_offsets = array('q', [0])
+    schedule_shifts = array('i')
+
+    for student in __convert_students(students_json, courses):
+        numbers.append(student.number)
+        years.append(student.year)
+        enrollment_courses.extend(course_indices[course_id] for course_id in student.enrollments)
+        enrollment_offsets.append(len(enrollment_courses))
+        schedule_shifts.extend(
+            shift_indices[course_id, shift.type, shift.number]
+            for (course_id, _), shift in student.previous_schedule.shifts.items()
+        )
+        schedule_offsets.append(len(schedule_shifts))
+
+    return numbers, years, enrollment_offsets, enrollment_courses, schedule_offsets, schedule_shifts
+
+def __decode_student_chunk(
+    chunk: StudentChunk,
+    courses: list[Course],
+    shifts: list[tuple[Course, Shift]]) -> Iterator[Student]:
+
+    # NOTE: students were already validated by the worker
+    numbers, years, enrollment_offsets, enrollment_courses, schedule_offsets, schedule_shifts = \
+        chunk
+    for i, number in enumerate(numbers):
+        enrollments = [
+            courses[course_index]
+            for course_index in enrollment_courses[enrollment_offsets[i]:enrollment_offsets[i + 1]]
+        ]
+        schedule = Schedule.interned(
+            (
+                shifts[shift_index]
+                for shift_index in schedule_shifts[schedule_offsets[i]:schedule_offsets[i + 1]]
+            ),
+            validate=False
+        )
+
+        yield Student(number, years[i], enrollments, schedule, validate=False)
+
+__are_valid_students_json = compile_bulk_validator([{
+    'number': str,
+    'year': int,
+    'enrollments': [str],
+    'schedule?': (type(None), [{'course': str, 'shift_type': str, 'shift_number': int}])
+}])
+
+def __convert_students(students_json: list[object], courses: dict[str, Course]) -> list[Student]:
+    # NOTE: when all students match the schema, which is checked in bulk, they are converted
+    # without checking each node. Otherwise, __parse_student reports the first error.
+    if __are_valid_students_json([students_json]):
+        return [__convert_student(student_json, courses) for student_json in students_json]
+    else:
+        return [__parse_student(student_json, courses) for student_json in students_json]
+
+def __convert_student(student_json: object, courses: dict[str, Course]) -> Student:
+    # Converts a student that matches the schema. When conversion fails, __parse_student reports
+    # the error.
+    student_json = typing.cast(dict[str, typing.Any], student_json)
+    year: int = student_json['year']
+    enrollment_ids: list[str] = student_json['enrollments']
+    enrollment_ids_set = set(enrollment_ids)
+
+    # Student's own checks are done on the JSON values, so that it is constructed without validation
+    if year <= 0 or len(enrollment_ids_set) != len(enrollment_ids):
+        return __parse_student(student_json, courses)
+
+    try:
+        enrollments = [courses[course_id] for course_id in enrollment_ids]
+
+        schedule_shifts: list[tuple[Course, Shift]] = []
+        for shift_json in student_json.get('schedule') or ():
+            course_id = shift_json['course']
+            if course_id not in enrollment_ids_set:
+                return __parse_student(student_json, courses)
+
+            course = courses[course_id]
+            shift_type = ShiftType(shift_json['shift_type'].upper())
+            schedule_shifts.append((course, course.shifts[shift_type][shift_json['shift_number']]))
+
+        schedule = Schedule.interned(schedule_shifts)
+    except (KeyError, ValueError, ScheduleError):
+        return __parse_student(student_json, courses)
+
+    return Student(student_json['number'], year, enrollments, schedule, validate=False)
 
 def __parse_student(student_json: object, courses: dict[str, Course]) -> Student:
     __assert_dict_with_keys(student_json, {'number', 'year', 'enrollments'}, 'student')
@@ -165,7 +709,7 @@ def __parse_schedule(
     courses: dict[str, Course]) -> Schedule:
 
     if schedule_json is None:
-        return Schedule([])
+        return Schedule.interned([])
 
     __assert_type(schedule_json, list, 'student schedule')
     schedule_json = typing.cast(list[object], schedule_json)
@@ -173,7 +717,7 @@ def __parse_schedule(
     shifts = [__parse_schedule_shift(shift_json, courses) for shift_json in schedule_json]
 
     try:
-        return Schedule(shifts)
+        return Schedule.interned(shifts)
     except ScheduleError as e:
         raise JsonImporterError(f'{student_number}\'s schedule is invalid: {e}') from e
 
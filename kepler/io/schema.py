@@ -0,0 +1,92 @@
+from collections.abc import Callable, Sequence
+import itertools
+import operator
+import typing
+
+# A schema is either:
+#
+#   - a type, matched exactly (so that bool is not accepted as int, as in the importer)
+#   - a tuple of types and at most one other schema, any of which may match
+#   - a list with a single schema, which all items of an array must match
+#   - a dict from keys to schemas, for objects. Keys ending in '?' are optional.
+Schema: typing.TypeAlias = typing.Union[
+    type, tuple['Schema', ...], list['Schema'], dict[str, 'Schema']
+]
+
+# Tells whether all values in a sequence match a schema
+BulkValidator: typing.TypeAlias = Callable[[Sequence[object]], bool]
+
+def compile_bulk_validator(schema: Schema) -> BulkValidator:
+    # Values are validated a whole column at a time: the same property of every object in an array
+    # is gathered with itemgetter, and the types of a column are collected in a single pass with
+    # map(type, ...). Validators only tell whether the values match, which is enough to skip the
+    # node-by-node checks (and their error messages) for the common case of valid input.
+    if isinstance(schema, type):
+        return __compile_types_validator(frozenset([schema]))
+    elif isinstance(schema, tuple):
+        return __compile_union_validator(schema)
+    elif isinstance(schema, list):
+        return __compile_array_validator(schema[0])
+    else:
+        return __compile_object_validator(schema)
+
+def __compile_types_validator(expected_types: frozenset[type]) -> BulkValidator:
+    return lambda values: set(map(type, values)) <= expected_types
+
+def __compile_union_validator(schemas: tuple[Schema, ...]) -> BulkValidator:
+    scalar_types = frozenset(schema for schema in schemas if isinstance(schema, type))
+    other_schemas = [schema for schema in schemas if not isinstance(schema, type)]
+    if not other_schemas:
+        return __compile_types_validator(scalar_types)
+    elif len(other_schemas) > 1:
+        raise ValueError('Unions may only have one schema that is not a type')
+
+    other_validator = compile_bulk_validator(other_schemas[0])
+    return lambda values: \
+        other_validator([value for value in values if type(value) not in scalar_types])
+
+def __compile_array_validator(item_schema: Schema) -> BulkValidator:
+    # The items of all arrays are validated together
+    item_validator = compile_bulk_validator(item_schema)
+    array_types = frozenset([list])
+
+    def validate(values: Sequence[object]) -> bool:
+        if not set(map(type, values)) <= array_types:
+            return False
+
+        arrays = typing.cast(Sequence[list[object]], values)
+        return item_validator(list(itertools.chain.from_iterable(arrays)))
+
+    return validate
+
+def __compile_object_validator(field_schemas: dict[str, Schema]) -> BulkValidator:
+    required_keys = frozenset(key for key in field_schemas if not key.endswith('?'))
+    required_fields = [
+        (operator.itemgetter(key), compile_bulk_validator(schema))
+        for key, schema in field_schemas.items() if key in required_keys
+    ]
+    optional_fields = [
+        (key.removesuffix('?'), compile_bulk_validator(schema))
+        for key, schema in field_schemas.items() if key not in required_keys
+    ]
+    object_types = frozenset([dict])
+
+    def validate(values: Sequence[object]) -> bool:
+        if not set(map(type, values)) <= object_types:
+            return False
+
+        objects = typing.cast(Sequence[dict[str, object]], values)
+        if not all(map(operator.le, itertools.repeat(required_keys), map(dict.keys, objects))):
+            return False
+
+        for get_field, validator in required_fields:
+            if not validator(list(map(get_field, objects))):
+                return False
+
+        for key, validator in optional_fields:
+            if not validator([value[key] for value in objects if key in value]):
+                return False
+
+        return True
+
+    return validate
@@ -0,0 +1,130 @@
+import json
+import typing
+
+NUMBER_CHARACTERS = frozenset('0123456789+-.eE')
+JSON_LITERALS = ('true', 'false', 'null', 'NaN', 'Infinity', '-Infinity')
+
+# Incremental reader of a JSON document, that decodes one value at a time from a text stream
+# without loading the whole document. Values are decoded with the standard library's decoder,
+# and the buffer grows geometrically while a value is incomplete, so that decoding is linear.
+class JsonStreamReader:
+    def __init__(self, stream: typing.TextIO, chunk_size: int = 1 << 16) -> None:
+        self.__stream = stream
+        self.__chunk_size = chunk_size
+        self.__decoder = json.JSONDecoder()
+
+        self.__buffer = ''
+        self.__position = 0
+        self.__eof = False
+
+    def peek(self) -> str:
+        while True:
+            length = len(self.__buffer)
+            while self.__position < length and self.__buffer[self.__position] in ' \t\n\r':
+                self.__position += 1
+
+            if self.__position < length:
+                return self.__buffer[self.__position]
+            elif not self.__read(self.__chunk_size):
+                return ''
+
+    def expect(self, token: str) -> None:
+        if self.peek() != token:
+            raise json.JSONDecodeError(f'Expecting {token!r}', self.__buffer, self.__position)
+
+        self.__position += 1
+
+    def expect_end(self) -> None:
+        if self.peek() != '':
+            raise json.JSONDecodeError('Extra data', self.__buffer, self.__position)
+
+    def read_value(self) -> object:
+        self.peek()
+
+        while True:
+            try:
+                value, end = self.__decoder.raw_decode(self.__buffer, self.__position)
+
+                # Numbers and literals may continue in the next chunk
+                if self.__eof or not self.__is_truncated_number(value, end):
+                    self.__position = end
+                    return value
+            except json.JSONDecodeError as e:
+                # Only errors caused by the end of the buffer may be fixed by reading more
+                if self.__eof or not self.__is_truncated(e):
+                    raise
+
+            self.__read(max(self.__chunk_size, len(self.__buffer) - self.__position))
+
+    def read_array(self) -> typing.Iterator[object]:
+        self.expect('[')
+        if self.peek() == ']':
+            self.__position += 1
+            return
+
+        while True:
+            yield self.read_value()
+
+            if self.peek() == ']':
+                self.__position += 1
+                return
+
+            self.expect(',')
+
+    def read_object(self) -> typing.Iterator[str]:
+        # Yields the keys of an object, after which the caller must read the values
+        self.expect('{')
+        if self.peek() == '}':
+            self.__position += 1
+            return
+
+        while True:
+            key = self.read_value()
+            if not isinstance(key, str):
+                raise json.JSONDecodeError(
+                    'Expecting property name enclosed in double quotes',
+                    self.__buffer,
+                    self.__position
+                )
+
+            self.expect(':')
+            yield key
+
+            if self.peek() == '}':
+                self.__position += 1
+                return
+
+            self.expect(',')
+
+    def __is_truncated_number(self, value: object, end: int) -> bool:
+        # A number is cut short if it's followed only by characters that could continue it (e.g.
+        # "1." or "1e" at the end of the buffer)
+        return isinstance(value, (int, float)) and not isinstance(value, bool) and \
+            all(c in NUMBER_CHARACTERS for c in self.__buffer[end:])
+
+    def __is_truncated(self, error: json.JSONDecodeError) -> bool:
+        rest = self.__buffer[error.pos:]
+
+        if error.msg.startswith('Unterminated string'):
+            return True
+        elif error.msg == 'Invalid \\uXXXX escape':
+            return len(rest) < 5
+        elif error.msg == 'Expecting value':
+            return any(literal.startswith(rest) for literal in JSON_LITERALS)
+        else:
+            # Such as a missing delimiter after a number that continues in the next chunk
+            return all(c in NUMBER_CHARACTERS for c in rest)
+
+    def __read(self, size: int) -> bool:
+        if self.__eof:
+            return False
+
+        chunk = self.__stream.read(size)
+        if not chunk:
+            self.__eof = True
+            return False
+
+        # Discard the consumed part of the buffer
+        self.__buffer = self.__buffer[self.__position:] + chunk
+        self.__position = 0
+        return True
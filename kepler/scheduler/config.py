@@ -1,18 +1,30 @@
 import pulp
 
-from ..types import Course, Shift, ShiftType, Student
+from ..types import Course, Shift, ShiftType
 
-SOLVER = pulp.getSolver('COIN_CMD', timeLimit=300)
+SOLVER_TIME_LIMIT = 300
+
+def create_solver(threads: None | int = None, log_path: None | str = None) -> pulp.LpSolver:
+    # CBC's output goes to the log file, when there is one, or to stdout otherwise
+    return pulp.getSolver(
+        'COIN_CMD',
+        timeLimit=SOLVER_TIME_LIMIT,
+        threads=threads,
+        logPath=log_path,
+        msg=log_path is None
+    )
+
+SOLVER = create_solver()
 
 def calculate_schedule_overlap_weight(
-    student: Student,
+    student_year: int,
     course1: Course,
     shift1: Shift,
     course2: Course,
     shift2: Shift) -> float:
 
-    delta1 = student.year - course1.year
-    delta2 = student.year - course2.year
+    delta1 = student_year - course1.year
+    delta2 = student_year - course2.year
     delta_sum = delta1 + delta2
 
     if delta1 < 0 or delta2 < 0:
@@ -1,5 +1,4 @@
-from collections.abc import Set
-import itertools
+from collections.abc import Iterable, Mapping
 import typing
 
 import pulp
@@ -11,28 +10,24 @@ class SchedulingProblemModelError(Exception):
     pass
 
 class SchedulingProblemModel:
-    def __init__(self, problem: SchedulingProblem) -> None:
+    def __init__(self, problem: SchedulingProblem | ColumnarSchedulingProblem) -> None:
         self.__model = pulp.LpProblem(sense=pulp.LpMinimize)
         self.__model.objective = pulp.LpAffineExpression()
 
-        self.__problem = problem
+        self.__problem: None | SchedulingProblem = None
+        self.__columnar_problem: None | ColumnarSchedulingProblem = None
         self.__solution: dict[tuple[str, str, ShiftType, int], pulp.LpVariable | bool] = {}
 
-        for student in problem.students.values():
-            self.__prepare_solution_for_student(student)
-            self.__add_student_enrollments(student)
-            self.__add_student_overlaps(student)
-
-        shift_students = problem.list_possible_students_by_shift()
-        for (course_id, shift_type, shift_number), students in shift_students.items():
-            course = problem.courses[course_id]
-            shift = course.shifts[shift_type][shift_number]
-
-            self.__add_shift_capacity(course, shift, students)
+        if isinstance(problem, ColumnarSchedulingProblem):
+            self.__columnar_problem = problem
+            self.__build_columnar(problem)
+        else:
+            self.__problem = problem
+            self.__build(problem)
 
-    def solve(self) -> SchedulingProblemSolution:
+    def solve(self, solver: None | pulp.LpSolver = None) -> SchedulingProblemSolution:
         try:
-            status = self.__model.solve(config.SOLVER)
+            status = self.__model.solve(config.SOLVER if solver is None else solver)
         except pulp.PulpSolverError as e:
             raise SchedulingProblemModelError(f'Solver error: {e}') from e
 
@@ -41,44 +36,140 @@ class SchedulingProblemModel:
                 f'Failed to solve scheduling problem. Status: {pulp.constants.LpSolution[status]}'
             )
 
+        # NOTE: schedules only need the catalog, so the object model of a columnar problem isn't
+        # materialized
+        problem: SchedulingProblem | ColumnarSchedulingProblem
+        courses: Mapping[str, Course]
+        student_numbers: Iterable[str]
+        if self.__columnar_problem is not None:
+            problem = self.__columnar_problem
+            courses = {course.id: course for course in problem.courses}
+            student_numbers = problem.student_numbers
+        else:
+            problem = typing.cast(SchedulingProblem, self.__problem)
+            courses = problem.courses
+            student_numbers = problem.students
+
         student_shifts: dict[str, list[tuple[Course, Shift]]] = {}
         for variable_id, variable in self.__solution.items():
             if SchedulingProblemModel.__get_solution_variable_value(variable):
                 student_number, course_id, shift_type, shift_number = variable_id
 
-                course = self.__problem.courses[course_id]
+                course = courses[course_id]
                 shift = course.shifts[shift_type][shift_number]
 
                 student_shifts.setdefault(student_number, [])
                 student_shifts[student_number].append((course, shift))
 
-        for student_number in self.__problem.students:
+        for student_number in student_numbers:
             student_shifts.setdefault(student_number, [])
 
         try:
             final_schedules = {
-                number: Schedule(shifts) for number, shifts in student_shifts.items()
+                number: Schedule.interned(shifts) for number, shifts in student_shifts.items()
             }
 
-            return SchedulingProblemSolution(self.__problem, final_schedules)
+            # NOTE: the model's constraints guarantee valid and complete schedules
+            return SchedulingProblemSolution(problem, final_schedules, validate=False)
         except (ScheduleError, SchedulingProblemSolutionError) as e: # pragma: no cover
             raise SchedulingProblemModelError(f'Invalid problem solution: {e}') from e
 
-    def __prepare_solution_for_student(self, student: Student) -> None:
-        for course, shift in student.list_assigned_shifts():
-            variable_id = student.number, course.id, shift.type, shift.number
-            self.__solution[variable_id] = True
-        for course, shift in student.list_unassignable_shifts_in_enrolled_courses():
-            variable_id = student.number, course.id, shift.type, shift.number
-            self.__solution[variable_id] = False
+    def __build(self, problem: SchedulingProblem) -> None:
+        self.__prepare_solution(problem)
+
+        for student in problem.students.values():
+            self.__add_student_enrollments(student)
+            self.__add_student_overlaps(
+                problem.catalog, student.number, student.year, student.list_possible_shifts()
+            )
+
+        shift_students = problem.list_possible_students_by_shift()
+        assigned_shift_students = problem.list_assigned_students_by_shift()
+        for shift_id, students in shift_students.items():
+            course_id, shift_type, shift_number = shift_id
+            course = problem.courses[course_id]
+            shift = course.shifts[shift_type][shift_number]
+
+            # Possible students only: variables of assigned students are True
+            restriction_variables: list[pulp.LpVariable] = []
+            for student in students - assigned_shift_students[shift_id]:
+                variable = self.__solution[student.number, course_id, shift_type, shift_number]
+                restriction_variables.append(typing.cast(pulp.LpVariable, variable))
+
+            inevitable_students = len(assigned_shift_students[shift_id])
+            self.__add_shift_capacity(course, shift, restriction_variables, inevitable_students)
+
+    def __build_columnar(self, problem: ColumnarSchedulingProblem) -> None:
+        possible_offsets, possible_shifts, possible_assigned = \
+            problem.list_possible_shifts_adjacency()
+
+        catalog = Catalog(problem.courses, validate=False)
+        shift_restriction_variables: list[list[pulp.LpVariable]] = [[] for _ in problem.shifts]
+        shift_inevitable_students = [0] * len(problem.shifts)
+
+        for i, number in enumerate(problem.student_numbers):
+            student_possible_indices = range(possible_offsets[i], possible_offsets[i + 1])
+            group_variables: dict[int, list[pulp.LpVariable]] = {}
+
+            for j in student_possible_indices:
+                shift_index = possible_shifts[j]
+                course, shift = problem.shifts[shift_index]
+                variable_id = number, course.id, shift.type, shift.number
+
+                if possible_assigned[j]:
+                    self.__solution[variable_id] = True
+                    shift_inevitable_students[shift_index] += 1
+                else:
+                    variable_name = f'{number}_{course.id}_{shift.name}'
+                    variable = pulp.LpVariable(variable_name, cat=pulp.LpBinary)
+                    self.__solution[variable_id] = variable
+
+                    shift_restriction_variables[shift_index].append(variable)
+                    group_variables.setdefault(problem.shift_groups[shift_index], [])
+                    group_variables[problem.shift_groups[shift_index]].append(variable)
+
+            for restriction_variables in group_variables.values():
+                self.__model += sum(restriction_variables) == 1
+
+            self.__add_student_overlaps(
+                catalog,
+                number,
+                problem.student_years[i],
+                (problem.shifts[possible_shifts[j]] for j in student_possible_indices)
+            )
 
-        for course, shift in student.list_possible_shifts():
-            variable_id = student.number, course.id, shift.type, shift.number
+        for shift_index, (course, shift) in enumerate(problem.shifts):
+            self.__add_shift_capacity(
+                course,
+                shift,
+                shift_restriction_variables[shift_index],
+                shift_inevitable_students[shift_index]
+            )
 
-            if variable_id not in self.__solution:
-                variable_name = f'{student.number}_{course.id}_{shift.name}'
-                variable = pulp.LpVariable(variable_name, cat=pulp.LpBinary)
-                self.__solution[variable_id] = variable
+    def __prepare_solution(self, problem: SchedulingProblem) -> None:
+        assigned_shift_students = problem.list_assigned_students_by_shift()
+        unassignable_shift_students = problem.list_unassignable_students_by_shift()
+        possible_shift_students = problem.list_possible_students_by_shift()
+
+        for (course_id, shift_type, shift_number), students in assigned_shift_students.items():
+            for student in students:
+                variable_id = student.number, course_id, shift_type, shift_number
+                self.__solution[variable_id] = True
+        for (course_id, shift_type, shift_number), students in unassignable_shift_students.items():
+            for student in students:
+                variable_id = student.number, course_id, shift_type, shift_number
+                self.__solution[variable_id] = False
+
+        for (course_id, shift_type, shift_number), students in possible_shift_students.items():
+            shift_name = problem.courses[course_id].shifts[shift_type][shift_number].name
+
+            for student in students:
+                variable_id = student.number, course_id, shift_type, shift_number
+
+                if variable_id not in self.__solution:
+                    variable_name = f'{student.number}_{course_id}_{shift_name}'
+                    variable = pulp.LpVariable(variable_name, cat=pulp.LpBinary)
+                    self.__solution[variable_id] = variable
 
     def __add_student_enrollments(self, student: Student) -> None:
         for course in student.enrollments.values():
@@ -91,14 +182,29 @@ class SchedulingProblemModel:
 
                 self.__model += sum(restriction_variables) == 1
 
-    def __add_student_overlaps(self, student: Student) -> None:
-        possible_shifts = sorted(student.list_possible_shifts())
-
-        for (course1, shift1), (course2, shift2) in itertools.combinations(possible_shifts, 2):
-            if not (course1 is course2 and shift1.type == shift2.type) and shift1.overlaps(shift2):
+    def __add_student_overlaps(
+        self,
+        catalog: Catalog,
+        student_number: str,
+        student_year: int,
+        possible_shifts: Iterable[tuple[Course, Shift]]) -> None:
+
+        # Overlapping pairs are found in the catalog's conflict graph, by shift index, instead of
+        # comparing the timeslots of every pair of the student's shifts
+        possible_shifts = sorted(possible_shifts)
+        shift_indices = catalog.index_shifts()
+        conflicting_shifts = catalog.list_conflicting_shifts()
+        positions = {shift_indices[shift]: i for i, shift in enumerate(possible_shifts)}
+
+        for i, (course1, shift1) in enumerate(possible_shifts):
+            conflicting_positions = sorted(
+                positions[j] for j in conflicting_shifts[shift_indices[course1, shift1]]
+                if positions.get(j, -1) > i
+            )
 
-                shift1_variable_id = student.number, course1.id, shift1.type, shift1.number
-                shift2_variable_id = student.number, course2.id, shift2.type, shift2.number
+            for course2, shift2 in (possible_shifts[j] for j in conflicting_positions):
+                shift1_variable_id = student_number, course1.id, shift1.type, shift1.number
+                shift2_variable_id = student_number, course2.id, shift2.type, shift2.number
                 shift1_variable = self.__solution[shift1_variable_id]
                 shift2_variable = self.__solution[shift2_variable_id]
 
@@ -108,7 +214,7 @@ class SchedulingProblemModel:
                 )
 
                 overlap_weight = config.calculate_schedule_overlap_weight(
-                    student, course1, shift1, course2, shift2
+                    student_year, course1, shift1, course2, shift2
                 )
 
                 if variable_count == 1:
@@ -118,7 +224,7 @@ class SchedulingProblemModel:
                         self.__model.objective += overlap_weight * shift1_variable
                 elif variable_count == 2:
                     overlap_variable_name = \
-                        f'{student.number}_{course1.id}_{shift1.name}_{course2.id}_{shift2.name}'
+                        f'{student_number}_{course1.id}_{shift1.name}_{course2.id}_{shift2.name}'
                     overlap_variable = pulp.LpVariable(overlap_variable_name, cat=pulp.LpBinary)
 
                     self.__model += overlap_variable >= shift1_variable + shift2_variable - 1
@@ -128,19 +234,8 @@ class SchedulingProblemModel:
         self,
         course: Course,
         shift: Shift,
-        students: Set[Student]) -> None:
-
-        inevitable_students = 0
-        restriction_variables: list[pulp.LpVariable] = []
-        for student in students:
-            variable_id = student.number, course.id, shift.type, shift.number
-            variable = self.__solution[variable_id]
-
-            if isinstance(variable, pulp.LpVariable):
-                restriction_variables.append(variable)
-            else:
-                # Possible students only: variable is True
-                inevitable_students += 1
+        restriction_variables: list[pulp.LpVariable],
+        inevitable_students: int) -> None:
 
         if restriction_variables:
             overcrowd_variable_name = f'{course.id}_{shift.name}_OVERCROWD'
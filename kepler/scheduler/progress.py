@@ -0,0 +1,72 @@
+import re
+
+# Values CBC uses when there is no solution or bound yet
+CBC_INFINITY = 1e50
+
+CBC_INTEGER_SOLUTION = re.compile(r'Integer solution of (\S+) found')
+CBC_NODE_PROGRESS = re.compile(
+    r'After \d+ nodes, \d+ on tree, (\S+) best solution, best possible (\S+)'
+)
+CBC_CONTINUOUS_OBJECTIVE = re.compile(r'Continuous objective value is (\S+)')
+CBC_ROOT_NODE = re.compile(r'At root node, .* objective from \S+ to (\S+)')
+CBC_SEARCH_COMPLETED = re.compile(r'Search completed - best objective (\S+)')
+CBC_PARTIAL_SEARCH = re.compile(r'Partial search - best objective (\S+) \(best possible (\S+)\)')
+CBC_OBJECTIVE_VALUE = re.compile(r'^Objective value:\s+(\S+)')
+
+class SolverProgress:
+    # Follows a (minimizing) CBC run through the lines of its log
+
+    def __init__(self) -> None:
+        self.incumbent_objective: None | float = None
+        self.best_bound: None | float = None
+
+    @property
+    def gap(self) -> None | float:
+        if self.incumbent_objective is None or self.best_bound is None:
+            return None
+
+        difference = abs(self.incumbent_objective - self.best_bound)
+        return difference / max(abs(self.incumbent_objective), 1e-10)
+
+    def update(self, line: str) -> bool:
+        # Returns whether the line changed the progress
+        previous = (self.incumbent_objective, self.best_bound)
+
+        if match := CBC_INTEGER_SOLUTION.search(line):
+            self.__update_incumbent(match[1])
+        elif match := CBC_NODE_PROGRESS.search(line):
+            self.__update_incumbent(match[1])
+            self.__update_bound(match[2])
+        elif match := CBC_CONTINUOUS_OBJECTIVE.search(line):
+            self.__update_bound(match[1])
+        elif match := CBC_ROOT_NODE.search(line):
+            self.__update_bound(match[1])
+        elif match := CBC_SEARCH_COMPLETED.search(line):
+            self.__update_incumbent(match[1])
+            self.__update_bound(match[1])
+        elif match := CBC_PARTIAL_SEARCH.search(line):
+            self.__update_incumbent(match[1])
+            self.__update_bound(match[2])
+        elif match := CBC_OBJECTIVE_VALUE.search(line):
+            self.__update_incumbent(match[1])
+
+        return (self.incumbent_objective, self.best_bound) != previous
+
+    def __update_incumbent(self, value: str) -> None:
+        incumbent_objective = SolverProgress.__parse_value(value)
+        if incumbent_objective is not None:
+            self.incumbent_objective = incumbent_objective
+
+    def __update_bound(self, value: str) -> None:
+        best_bound = SolverProgress.__parse_value(value)
+        if best_bound is not None:
+            self.best_bound = best_bound
+
+    @staticmethod
+    def __parse_value(value: str) -> None | float:
+        try:
+            number = float(value.rstrip(','))
+        except ValueError:
+            return None
+
+        return number if abs(number) < CBC_INFINITY else None
@@ -1,3 +1,6 @@
+from .builder import ProblemBuilder, ProblemBuilderError
+from .catalog import Catalog, CatalogError
+from .columnar import ColumnarSchedulingProblem, ColumnarSchedulingProblemError
 from .course import Course, CourseError
 from .enum import SortedEnum
 from .problem import SchedulingProblemError, SchedulingProblem
@@ -10,8 +13,14 @@ from .timeslot import Timeslot, TimeslotError
 from .weekday import Weekday
 
 __all__ = [
+    'Catalog',
+    'CatalogError',
+    'ColumnarSchedulingProblem',
+    'ColumnarSchedulingProblemError',
     'Course',
     'CourseError',
+    'ProblemBuilder',
+    'ProblemBuilderError',
     'Schedule',
     'ScheduleError',
     'SchedulingProblem',
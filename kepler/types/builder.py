@@ -0,0 +1,177 @@
+from __future__ import annotations
+from collections.abc import Hashable, Iterable
+import itertools
+import typing
+
+from .course import Course
+from .problem import SchedulingProblem
+from .schedule import Schedule
+from .shift import Shift, ShiftType
+from .student import Student
+from .timeslot import Timeslot
+
+class ProblemBuilderError(Exception):
+    pass
+
+# NOTE: validates the whole problem at once, with set operations over its tables, and then
+# constructs the immutable types without validating each object again
+class ProblemBuilder:
+    def __init__(self) -> None:
+        self.__courses: list[tuple[str, int]] = []
+        self.__shifts: list[tuple[str, ShiftType, int, int, list[Timeslot]]] = []
+        self.__students: list[tuple[str, int, list[str], list[tuple[str, ShiftType, int]]]] = []
+
+    def add_course(self, id_: str, year: int) -> None:
+        self.__courses.append((id_, year))
+
+    def add_shift(
+        self,
+        course_id: str,
+        type_: ShiftType,
+        number: int,
+        capacity: int,
+        timeslots: Iterable[Timeslot]) -> None:
+
+        self.__shifts.append((course_id, type_, number, capacity, list(timeslots)))
+
+    def add_student(
+        self,
+        number: str,
+        year: int,
+        enrollments: Iterable[str],
+        schedule: Iterable[tuple[str, ShiftType, int]] = ()) -> None:
+
+        self.__students.append((number, year, list(enrollments), list(schedule)))
+
+    def build(self) -> SchedulingProblem:
+        self.__validate()
+
+        course_shifts: dict[str, list[Shift]] = {id_: [] for id_, _ in self.__courses}
+        shifts: dict[tuple[str, ShiftType, int], Shift] = {}
+        for course_id, type_, number, capacity, timeslots in self.__shifts:
+            shift = Shift(type_, number, capacity, timeslots, validate=False)
+            course_shifts[course_id].append(shift)
+            shifts[course_id, type_, number] = shift
+
+        courses = {
+            id_: Course(id_, year, course_shifts[id_], validate=False)
+            for id_, year in self.__courses
+        }
+
+        students = [
+            Student(
+                number,
+                year,
+                (courses[course_id] for course_id in enrollments),
+                Schedule.interned(
+                    (
+                        (courses[course_id], shifts[course_id, type_, shift_number])
+                        for course_id, type_, shift_number in schedule
+                    ),
+                    validate=False
+                ),
+                validate=False
+            )
+            for number, year, enrollments, schedule in self.__students
+        ]
+
+        return SchedulingProblem(courses.values(), students, validate=False)
+
+    def __validate(self) -> None:
+        course_ids = {id_ for id_, _ in self.__courses}
+        if len(course_ids) != len(self.__courses):
+            duplicate_id = ProblemBuilder.__find_duplicate(id_ for id_, _ in self.__courses)
+            raise ProblemBuilderError(f'Courses with the same id: {duplicate_id}')
+
+        for id_, year in self.__courses:
+            if year <= 0:
+                raise ProblemBuilderError(f'Non-positive year {year} in course {id_}')
+
+        self.__validate_shifts(course_ids)
+        self.__validate_students(course_ids)
+
+    def __validate_shifts(self, course_ids: set[str]) -> None:
+        shift_ids = {shift[:3] for shift in self.__shifts}
+        if len(shift_ids) != len(self.__shifts):
+            course_id, type_, number = typing.cast(
+                tuple[str, ShiftType, int],
+                ProblemBuilder.__find_duplicate(shift[:3] for shift in self.__shifts)
+            )
+            raise ProblemBuilderError(
+                f'Shifts with the same name ({type_}{number}) in course {course_id}'
+            )
+
+        unknown_course_ids = {shift[0] for shift in self.__shifts} - course_ids
+        if unknown_course_ids:
+            raise ProblemBuilderError(f'Shift in unknown course {min(unknown_course_ids)}')
+
+        for course_id, type_, number, capacity, timeslots in self.__shifts:
+            if number <= 0:
+                raise ProblemBuilderError(
+                    f'Non-positive number {number} in shift {type_}{number} of course {course_id}'
+                )
+            if capacity <= 0:
+                raise ProblemBuilderError(
+                    f'Non-positive capacity {capacity} in shift {type_}{number} of course '
+                    f'{course_id}'
+                )
+
+            # Sorted timeslots only need to be compared with their successor
+            sorted_timeslots = sorted(timeslots)
+            for timeslot1, timeslot2 in itertools.pairwise(sorted_timeslots):
+                if timeslot1.overlaps(timeslot2):
+                    raise ProblemBuilderError(
+                        f'Overlapping timeslots in shift {type_}{number} of course {course_id}'
+                    )
+
+    def __validate_students(self, course_ids: set[str]) -> None:
+        numbers = {student[0] for student in self.__students}
+        if len(numbers) != len(self.__students):
+            duplicate_number = ProblemBuilder.__find_duplicate(
+                student[0] for student in self.__students
+            )
+            raise ProblemBuilderError(f'Students with the same number: {duplicate_number}')
+
+        enrolled_course_ids = set(itertools.chain(*(student[2] for student in self.__students)))
+        shift_ids = {shift[:3] for shift in self.__shifts}
+        scheduled_shift_ids = set(itertools.chain(*(student[3] for student in self.__students)))
+
+        if not enrolled_course_ids <= course_ids:
+            raise ProblemBuilderError(
+                f'Enrollment in unknown course {min(enrolled_course_ids - course_ids)}'
+            )
+        if not scheduled_shift_ids <= shift_ids:
+            course_id, type_, shift_number = min(
+                scheduled_shift_ids - shift_ids, key=lambda shift_id: (shift_id[0], shift_id[2])
+            )
+            raise ProblemBuilderError(
+                f'Shift {type_}{shift_number} of course {course_id} in schedule was not found'
+            )
+
+        for number, year, enrollments, schedule in self.__students:
+            enrollments_set = set(enrollments)
+
+            if year <= 0:
+                raise ProblemBuilderError(f'Non-positive year {year} in student {number}')
+            elif len(enrollments_set) != len(enrollments):
+                duplicate_id = ProblemBuilder.__find_duplicate(enrollments)
+                raise ProblemBuilderError(
+                    f'Courses with the same id ({duplicate_id}) in student {number}'
+                )
+            elif len({shift_id[:2] for shift_id in schedule}) != len(schedule):
+                raise ProblemBuilderError(
+                    f'Shift type multiple times in student {number}\'s schedule'
+                )
+            elif not {shift_id[0] for shift_id in schedule} <= enrollments_set:
+                raise ProblemBuilderError(f'Student {number}\'s schedule is not valid for them')
+
+    @staticmethod
+    def __find_duplicate(values: Iterable[Hashable]) -> Hashable:
+        seen: set[Hashable] = set()
+        for value in values:
+            if value in seen:
+                return value
+
+            seen.add(value)
+
+        raise ValueError('No duplicate found') # pragma: no cover
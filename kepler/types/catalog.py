@@ -0,0 +1,125 @@
+from __future__ import annotations
+from array import array
+from collections.abc import Iterable, Mapping, Sequence, Set
+import typing
+
+from .course import Course
+from .shift import Shift
+from .time import ScheduleTime
+from .weekday import Weekday
+
+CatalogState: typing.TypeAlias = tuple[list[Course], None | tuple['array[int]', 'array[int]']]
+
+class CatalogError(Exception):
+    pass
+
+class Catalog:
+    # The courses of one or more problems, along with the indexes that only depend on them, which
+    # are built once and shared by all of those problems
+
+    def __init__(self, courses: Iterable[Course], validate: bool = True) -> None:
+        self.__courses: dict[str, Course] = {}
+        self.__shifts: None | list[tuple[Course, Shift]] = None
+        self.__shift_indices: None | dict[tuple[Course, Shift], int] = None
+
+        # The conflict graph, as CSR arrays (which are pickled) and sets of shift indices
+        self.__conflict_adjacency: None | tuple[array[int], array[int]] = None
+        self.__conflicting_shifts: None | list[frozenset[int]] = None
+
+        for course in courses:
+            if validate and course.id in self.__courses:
+                raise CatalogError(f'Courses with the same id: {course.id}')
+
+            self.__courses[course.id] = course
+
+    @property
+    def courses(self) -> Mapping[str, Course]:
+        return self.__courses
+
+    def list_shifts(self) -> Sequence[tuple[Course, Shift]]:
+        if self.__shifts is None:
+            self.__shifts = [
+                (course, shift)
+                for course in self.__courses.values()
+                for type_shifts in course.shifts.values()
+                for shift in type_shifts.values()
+            ]
+
+        return self.__shifts
+
+    def index_shifts(self) -> Mapping[tuple[Course, Shift], int]:
+        # Each shift's index in list_shifts
+        if self.__shift_indices is None:
+            self.__shift_indices = {shift: i for i, shift in enumerate(self.list_shifts())}
+
+        return self.__shift_indices
+
+    def list_conflicting_shifts(self) -> Sequence[Set[int]]:
+        # The shifts that can't be attended along with each shift (by index): those whose timeslots
+        # overlap its own, unless they are alternatives (of the same course and type)
+        if self.__conflicting_shifts is None:
+            offsets, neighbors = self.__get_conflict_adjacency()
+            self.__conflicting_shifts = [
+                frozenset(neighbors[offsets[i]:offsets[i + 1]]) for i in range(len(offsets) - 1)
+            ]
+
+        return self.__conflicting_shifts
+
+    def __get_conflict_adjacency(self) -> tuple[array[int], array[int]]:
+        if self.__conflict_adjacency is not None:
+            return self.__conflict_adjacency
+
+        shifts = self.list_shifts()
+        conflicts: list[set[int]] = [set() for _ in shifts]
+
+        # Timeslots are swept by day and start, keeping those that haven't ended yet
+        day_timeslots: dict[Weekday, list[tuple[ScheduleTime, ScheduleTime, int]]] = {}
+        for i, (_, shift) in enumerate(shifts):
+            for timeslot in shift.timeslots:
+                day_timeslots.setdefault(timeslot.day, []).append(
+                    (timeslot.start, timeslot.end, i)
+                )
+
+        for timeslots in day_timeslots.values():
+            timeslots.sort()
+            ongoing: list[tuple[ScheduleTime, int]] = []
+
+            for start, end, i in timeslots:
+                ongoing = [(ongoing_end, j) for ongoing_end, j in ongoing if start < ongoing_end]
+                course1, shift1 = shifts[i]
+
+                for _, j in ongoing:
+                    course2, shift2 = shifts[j]
+                    if course1.id != course2.id or shift1.type != shift2.type:
+                        conflicts[i].add(j)
+                        conflicts[j].add(i)
+
+                ongoing.append((end, i))
+
+        offsets = array('q', [0])
+        neighbors = array('i')
+        for shift_conflicts in conflicts:
+            neighbors.extend(sorted(shift_conflicts))
+            offsets.append(len(neighbors))
+
+        self.__conflict_adjacency = offsets, neighbors
+        return self.__conflict_adjacency
+
+    def __getstate__(self) -> CatalogState:
+        # NOTE: the conflict graph is kept, if already built, so that it's not built again
+        return list(self.__courses.values()), self.__conflict_adjacency
+
+    def __setstate__(self, state: CatalogState) -> None:
+        courses, conflict_adjacency = state
+
+        self.__courses = {course.id: course for course in courses}
+        self.__shifts = None
+        self.__shift_indices = None
+        self.__conflict_adjacency = conflict_adjacency
+        self.__conflicting_shifts = None
+
+    def __copy__(self) -> Catalog:
+        return self # NOTE: Catalog and all its fields are immutable
+
+    def __repr__(self) -> str:
+        return f'Catalog(courses={sorted(self.__courses.values())!r})'
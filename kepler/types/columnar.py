@@ -0,0 +1,342 @@
+from __future__ import annotations
+from array import array
+from collections.abc import Iterable, Iterator, Sequence
+
+from .course import Course
+from .problem import SchedulingProblem
+from .schedule import Schedule
+from .shift import Shift, ShiftType
+from .student import Student
+
+class ColumnarSchedulingProblemError(Exception):
+    pass
+
+# NOTE: catalog entities (courses and shifts) are kept as objects, as there are few of them.
+# Students, enrollments and previous schedules are stored as contiguous integer arrays, with
+# CSR-style offsets: the enrollments of student i are
+# enrollment_courses[enrollment_offsets[i]:enrollment_offsets[i + 1]], and the same goes for
+# their previous schedule.
+class ColumnarSchedulingProblem:
+    def __init__(
+        self,
+        courses: Iterable[Course],
+        student_numbers: Iterable[str],
+        student_years: Iterable[int],
+        enrollment_offsets: Iterable[int],
+        enrollment_courses: Iterable[int],
+        schedule_offsets: Iterable[int],
+        schedule_shifts: Iterable[int]) -> None:
+
+        self.__courses = list(courses)
+        self.__student_numbers = list(student_numbers)
+        self.__student_years = array('i', student_years)
+        self.__enrollment_offsets = array('q', enrollment_offsets)
+        self.__enrollment_courses = array('i', enrollment_courses)
+        self.__schedule_offsets = array('q', schedule_offsets)
+        self.__schedule_shifts = array('i', schedule_shifts)
+
+        # Shifts are grouped by (course, shift type), and groups are contiguous per course
+        self.__shifts: list[tuple[Course, Shift]] = []
+        self.__shift_courses = array('i')
+        self.__shift_groups = array('i')
+        self.__group_offsets = array('q', [0])
+        self.__course_group_offsets = array('q', [0])
+
+        self.__possible_adjacency: None | tuple[array[int], array[int], array[int]] = None
+        self.__digest: None | bytes = None
+
+        self.__build_shift_table()
+        self.__validate()
+
+    def list_possible_shifts_adjacency(self) -> tuple[Sequence[int], Sequence[int], Sequence[int]]:
+        # Returns the possible shifts of student i as
+        # possible_shifts[possible_offsets[i]:possible_offsets[i + 1]], along with a parallel
+        # array of flags, set for the shifts that are already assigned to the student.
+        if self.__possible_adjacency is None:
+            self.__possible_adjacency = self.__build_possible_adjacency()
+
+        return self.__possible_adjacency
+
+    def to_problem(self) -> SchedulingProblem:
+        students: list[Student] = []
+        for i, number in enumerate(self.__student_numbers):
+            enrollments = [
+                self.__courses[course_index]
+                for course_index in self.__enrollment_courses[
+                    self.__enrollment_offsets[i]:self.__enrollment_offsets[i + 1]
+                ]
+            ]
+
+            schedule = Schedule.interned(
+                self.__shifts[shift_index]
+                for shift_index in self.__schedule_shifts[
+                    self.__schedule_offsets[i]:self.__schedule_offsets[i + 1]
+                ]
+            )
+
+            students.append(Student(number, self.__student_years[i], enrollments, schedule))
+
+        return SchedulingProblem(self.__courses, students)
+
+    @staticmethod
+    def from_problem(problem: SchedulingProblem) -> ColumnarSchedulingProblem:
+        courses = list(problem.courses.values())
+        course_indices = {course.id: i for i, course in enumerate(courses)}
+        shift_indices = ColumnarSchedulingProblem.index_shifts(courses)
+
+        enrollment_offsets = [0]
+        enrollment_courses: list[int] = []
+        schedule_offsets = [0]
+        schedule_shifts: list[int] = []
+
+        for student in problem.students.values():
+            enrollment_courses.extend(
+                course_indices[course_id] for course_id in student.enrollments
+            )
+            enrollment_offsets.append(len(enrollment_courses))
+
+            schedule_shifts.extend(
+                shift_indices[course_id, shift.type, shift.number]
+                for (course_id, _), shift in student.previous_schedule.shifts.items()
+            )
+            schedule_offsets.append(len(schedule_shifts))
+
+        return ColumnarSchedulingProblem(
+            courses,
+            (student.number for student in problem.students.values()),
+            (student.year for student in problem.students.values()),
+            enrollment_offsets,
+            enrollment_courses,
+            schedule_offsets,
+            schedule_shifts
+        )
+
+    @staticmethod
+    def index_shifts(courses: Iterable[Course]) -> dict[tuple[str, ShiftType, int], int]:
+        # NOTE: must match the order of the shift table built in __init__
+        shift_indices: dict[tuple[str, ShiftType, int], int] = {}
+        for course in courses:
+            for shift_type in sorted(course.shifts):
+                for shift_number in sorted(course.shifts[shift_type]):
+                    shift_indices[course.id, shift_type, shift_number] = len(shift_indices)
+
+        return shift_indices
+
+    @property
+    def courses(self) -> Sequence[Course]:
+        return self.__courses
+
+    @property
+    def shifts(self) -> Sequence[tuple[Course, Shift]]:
+        return self.__shifts
+
+    @property
+    def shift_courses(self) -> Sequence[int]:
+        return self.__shift_courses
+
+    @property
+    def shift_groups(self) -> Sequence[int]:
+        return self.__shift_groups
+
+    @property
+    def group_offsets(self) -> Sequence[int]:
+        return self.__group_offsets
+
+    @property
+    def course_group_offsets(self) -> Sequence[int]:
+        return self.__course_group_offsets
+
+    @property
+    def student_numbers(self) -> Sequence[str]:
+        return self.__student_numbers
+
+    @property
+    def student_years(self) -> Sequence[int]:
+        return self.__student_years
+
+    @property
+    def enrollment_offsets(self) -> Sequence[int]:
+        return self.__enrollment_offsets
+
+    @property
+    def enrollment_courses(self) -> Sequence[int]:
+        return self.__enrollment_courses
+
+    @property
+    def schedule_offsets(self) -> Sequence[int]:
+        return self.__schedule_offsets
+
+    @property
+    def schedule_shifts(self) -> Sequence[int]:
+        return self.__schedule_shifts
+
+    @property
+    def digest(self) -> bytes:
+        # The same as the digest of the problem's object model
+        if self.__digest is None:
+            self.__digest = self.__calculate_digest()
+
+        return self.__digest
+
+    def __copy__(self) -> ColumnarSchedulingProblem:
+        return self # NOTE: ColumnarSchedulingProblem and all its fields are immutable
+
+    def __repr__(self) -> str:
+        return (
+            'ColumnarSchedulingProblem('
+            f'courses={len(self.__courses)}, '
+            f'shifts={len(self.__shifts)}, '
+            f'students={len(self.__student_numbers)})'
+        )
+
+    def __build_shift_table(self) -> None:
+        for course_index, course in enumerate(self.__courses):
+            for shift_type in sorted(course.shifts):
+                for shift_number in sorted(course.shifts[shift_type]):
+                    self.__shifts.append((course, course.shifts[shift_type][shift_number]))
+                    self.__shift_courses.append(course_index)
+                    self.__shift_groups.append(len(self.__group_offsets) - 1)
+
+                self.__group_offsets.append(len(self.__shifts))
+
+            self.__course_group_offsets.append(len(self.__group_offsets) - 1)
+
+    def __validate(self) -> None:
+        course_ids: set[str] = set()
+        for course in self.__courses:
+            if course.id in course_ids:
+                raise ColumnarSchedulingProblemError(f'Courses with the same id: {course.id}')
+
+            course_ids.add(course.id)
+
+        student_count = len(self.__student_numbers)
+        if len(self.__student_years) != student_count or \
+            len(self.__enrollment_offsets) != student_count + 1 or \
+            len(self.__schedule_offsets) != student_count + 1:
+
+            raise ColumnarSchedulingProblemError('Student columns with different lengths')
+
+        ColumnarSchedulingProblem.__validate_offsets(
+            self.__enrollment_offsets, self.__enrollment_courses, 'enrollment'
+        )
+        ColumnarSchedulingProblem.__validate_offsets(
+            self.__schedule_offsets, self.__schedule_shifts, 'schedule'
+        )
+
+        if any(not 0 <= i < len(self.__courses) for i in self.__enrollment_courses):
+            raise ColumnarSchedulingProblemError('Enrollment references unknown course')
+        if any(not 0 <= i < len(self.__shifts) for i in self.__schedule_shifts):
+            raise ColumnarSchedulingProblemError('Schedule references unknown shift')
+
+        student_numbers: set[str] = set()
+        for i, number in enumerate(self.__student_numbers):
+            if number in student_numbers:
+                raise ColumnarSchedulingProblemError(f'Students with the same number: {number}')
+            student_numbers.add(number)
+
+            if self.__student_years[i] <= 0:
+                raise ColumnarSchedulingProblemError(
+                    f'Non-positive year {self.__student_years[i]} in student {number}'
+                )
+
+            enrollments = self.__enrollment_courses[
+                self.__enrollment_offsets[i]:self.__enrollment_offsets[i + 1]
+            ]
+            enrollments_set = set(enrollments)
+            if len(enrollments_set) != len(enrollments):
+                raise ColumnarSchedulingProblemError(
+                    f'Courses with the same id in student {number}'
+                )
+
+            schedule_groups: set[int] = set()
+            for shift_index in self.__schedule_shifts[
+                self.__schedule_offsets[i]:self.__schedule_offsets[i + 1]
+            ]:
+                course, shift = self.__shifts[shift_index]
+                group = self.__shift_groups[shift_index]
+
+                if group in schedule_groups:
+                    raise ColumnarSchedulingProblemError(
+                        f'Shift {course.id}-{shift.type} multiple times in {number}\'s schedule'
+                    )
+                elif self.__shift_courses[shift_index] not in enrollments_set:
+                    raise ColumnarSchedulingProblemError(
+                        f'Student {number}\'s schedule is not valid for them'
+                    )
+
+                schedule_groups.add(group)
+
+    def __calculate_digest(self) -> bytes:
+        return SchedulingProblem.calculate_digest(self.__courses, self.__list_digest_students())
+
+    def __list_digest_students(self) -> Iterator[tuple[str, int, list[str], list[tuple[str, str]]]]:
+        # In the order expected by SchedulingProblem.calculate_digest
+        for i in sorted(range(len(self.__student_numbers)), key=self.__student_numbers.__getitem__):
+            enrollments = [
+                self.__courses[course_index].id
+                for course_index in self.__enrollment_courses[
+                    self.__enrollment_offsets[i]:self.__enrollment_offsets[i + 1]
+                ]
+            ]
+
+            schedule = sorted(
+                (
+                    self.__shifts[shift_index]
+                    for shift_index in self.__schedule_shifts[
+                        self.__schedule_offsets[i]:self.__schedule_offsets[i + 1]
+                    ]
+                ),
+                key=lambda course_shift: (course_shift[0].id, course_shift[1].type)
+            )
+
+            yield (
+                self.__student_numbers[i],
+                self.__student_years[i],
+                enrollments,
+                [(course.id, shift.name) for course, shift in schedule]
+            )
+
+    def __build_possible_adjacency(self) -> tuple[array[int], array[int], array[int]]:
+        possible_offsets = array('q', [0])
+        possible_shifts = array('i')
+        possible_assigned = array('b')
+
+        for i in range(len(self.__student_numbers)):
+            assigned_shifts = {
+                self.__shift_groups[shift_index]: shift_index
+                for shift_index in self.__schedule_shifts[
+                    self.__schedule_offsets[i]:self.__schedule_offsets[i + 1]
+                ]
+            }
+
+            for course_index in self.__enrollment_courses[
+                self.__enrollment_offsets[i]:self.__enrollment_offsets[i + 1]
+            ]:
+                for group in range(
+                    self.__course_group_offsets[course_index],
+                    self.__course_group_offsets[course_index + 1]
+                ):
+                    group_start = self.__group_offsets[group]
+                    group_end = self.__group_offsets[group + 1]
+
+                    assigned_shift = assigned_shifts.get(group)
+                    if assigned_shift is None and group_end - group_start == 1:
+                        assigned_shift = group_start
+
+                    if assigned_shift is None:
+                        possible_shifts.extend(range(group_start, group_end))
+                        possible_assigned.extend(bytes(group_end - group_start))
+                    else:
+                        possible_shifts.append(assigned_shift)
+                        possible_assigned.append(1)
+
+            possible_offsets.append(len(possible_shifts))
+
+        return possible_offsets, possible_shifts, possible_assigned
+
+    @staticmethod
+    def __validate_offsets(offsets: Sequence[int], values: Sequence[int], name: str) -> None:
+        if offsets[0] != 0 or offsets[-1] != len(values) or \
+            any(offsets[i] > offsets[i + 1] for i in range(len(offsets) - 1)):
+
+            raise ColumnarSchedulingProblemError(f'Invalid {name} offsets')
@@ -10,11 +10,22 @@ class CourseError(Exception):
 
 @functools.total_ordering # NOTE: total order exists if no two courses share the same id
 class Course:
-    def __init__(self, id_: str, year: int, shifts: Iterable[Shift]) -> None:
+    def __init__(
+        self,
+        id_: str,
+        year: int,
+        shifts: Iterable[Shift],
+        validate: bool = True) -> None:
+
         self.__id = id_
         self.__year = year
         self.__shifts: dict[ShiftType, dict[int, Shift]] = {}
 
+        if not validate:
+            for shift in shifts:
+                self.__shifts.setdefault(shift.type, {})[shift.number] = shift
+            return
+
         if year <= 0:
             raise CourseError(f'Non-positive year {year} in course {id_}')
 
@@ -46,6 +57,10 @@ class Course:
     def __lt__(self, other: Course) -> bool:
         return self.__id < other.id
 
+    def __reduce__(self) -> tuple[object, tuple[str, int, list[Shift]]]:
+        shifts = [shift for type_shifts in self.__shifts.values() for shift in type_shifts.values()]
+        return Course, (self.__id, self.__year, shifts)
+
     def __copy__(self) -> Course:
         return self # NOTE: Course and all its fields are immutable
 
@@ -1,18 +1,53 @@
 from __future__ import annotations
-from collections.abc import Iterable, Mapping, Set
+from array import array
+from collections.abc import Iterable, Mapping, Sequence, Set
+import hashlib
+import json
+import typing
 
+from .catalog import Catalog
 from .course import Course
-from .shift import ShiftType
+from .schedule import Schedule
+from .shift import Shift, ShiftType
 from .student import Student
 
+ShiftStudentsIndex: typing.TypeAlias = dict[tuple[str, ShiftType, int], set[Student]]
+ShiftIndexes: typing.TypeAlias = tuple[ShiftStudentsIndex, ShiftStudentsIndex, ShiftStudentsIndex]
+SchedulingProblemState: typing.TypeAlias = tuple[
+    Catalog, list[str], 'array[int]', 'array[int]', 'array[int]', 'array[int]', 'array[int]',
+    None | bytes
+]
+
 class SchedulingProblemError(Exception):
     pass
 
 class SchedulingProblem:
-    def __init__(self, courses: Iterable[Course], students: Iterable[Student]) -> None:
+    def __init__(
+        self,
+        courses: Iterable[Course] | Catalog,
+        students: Iterable[Student],
+        validate: bool = True) -> None:
+
+        # NOTE: problems of the same catalog share it, along with its indexes
+        self.__catalog: None | Catalog = None
         self.__courses: dict[str, Course] = {}
         self.__students: dict[str, Student] = {}
 
+        self.__shift_indexes: None | ShiftIndexes = None
+        self.__students_by_course: None | dict[str, set[Student]] = None
+        self.__mandatory_shift_types: None | dict[str, frozenset[tuple[str, ShiftType]]] = None
+        self.__digest: None | bytes = None
+
+        if isinstance(courses, Catalog):
+            self.__catalog = courses
+            self.__courses.update(courses.courses)
+            courses = ()
+
+        if not validate:
+            self.__courses.update((course.id, course) for course in courses)
+            self.__students.update((student.number, student) for student in students)
+            return
+
         for course in courses:
             if course.id in self.__courses:
                 raise SchedulingProblemError(f'Courses with the same id: {course.id}')
@@ -31,22 +66,112 @@ class SchedulingProblem:
 
             self.__students[student.number] = student
 
+    def list_shifts(self) -> Sequence[tuple[Course, Shift]]:
+        return self.catalog.list_shifts()
+
+    def list_conflicting_shifts(self) -> Sequence[Set[int]]:
+        # By index of the catalog's shifts
+        return self.catalog.list_conflicting_shifts()
+
     def list_possible_students_by_shift(self) -> Mapping[tuple[str, ShiftType, int], Set[Student]]:
-        possible_students_by_shift: dict[tuple[str, ShiftType, int], set[Student]] = {}
+        return self.__get_shift_indexes()[0]
 
-        for student in self.__students.values():
-            for course, shift in student.list_possible_shifts():
-                shift_id = course.id, shift.type, shift.number
-                possible_students_by_shift.setdefault(shift_id, set())
-                possible_students_by_shift[shift_id].add(student)
+    def list_assigned_students_by_shift(self) -> Mapping[tuple[str, ShiftType, int], Set[Student]]:
+        return self.__get_shift_indexes()[1]
+
+    def list_unassignable_students_by_shift(
+        self) -> Mapping[tuple[str, ShiftType, int], Set[Student]]:
+
+        return self.__get_shift_indexes()[2]
+
+    def list_students_by_course(self) -> Mapping[str, Set[Student]]:
+        if self.__students_by_course is None:
+            students_by_course: dict[str, set[Student]] = {
+                course_id: set() for course_id in self.__courses
+            }
+
+            for student in self.__students.values():
+                for course_id in student.enrollments:
+                    students_by_course[course_id].add(student)
+
+            self.__students_by_course = students_by_course
+
+        return self.__students_by_course
+
+    def list_mandatory_shift_types_by_student(
+        self) -> Mapping[str, Set[tuple[str, ShiftType]]]:
+
+        if self.__mandatory_shift_types is None:
+            # NOTE: students with the same enrollments share the same set
+            shift_types_by_enrollments: dict[frozenset[str], frozenset[tuple[str, ShiftType]]] = {}
+            mandatory_shift_types: dict[str, frozenset[tuple[str, ShiftType]]] = {}
+
+            for student in self.__students.values():
+                enrollments = frozenset(student.enrollments)
+                shift_types = shift_types_by_enrollments.get(enrollments)
+
+                if shift_types is None:
+                    shift_types = frozenset(
+                        (course_id, shift_type)
+                        for course_id in enrollments
+                        for shift_type in self.__courses[course_id].shifts
+                    )
+                    shift_types_by_enrollments[enrollments] = shift_types
+
+                mandatory_shift_types[student.number] = shift_types
+
+            self.__mandatory_shift_types = mandatory_shift_types
+
+        return self.__mandatory_shift_types
+
+    def __get_shift_indexes(self) -> ShiftIndexes:
+        if self.__shift_indexes is not None:
+            return self.__shift_indexes
+
+        possible_students_by_shift: ShiftStudentsIndex = {}
+        assigned_students_by_shift: ShiftStudentsIndex = {}
+        unassignable_students_by_shift: ShiftStudentsIndex = {}
 
         for course in self.__courses.values():
             for type_shifts in course.shifts.values():
                 for shift in type_shifts.values():
                     shift_id = course.id, shift.type, shift.number
-                    possible_students_by_shift.setdefault(shift_id, set())
+                    possible_students_by_shift[shift_id] = set()
+                    assigned_students_by_shift[shift_id] = set()
+                    unassignable_students_by_shift[shift_id] = set()
+
+        for student in self.__students.values():
+            assigned_shifts = student.list_assigned_shifts()
+            assigned_shift_types = {(course.id, shift.type) for course, shift in assigned_shifts}
+
+            for course, shift in assigned_shifts:
+                assigned_students_by_shift[course.id, shift.type, shift.number].add(student)
+
+            for course in student.enrollments.values():
+                for type_shifts in course.shifts.values():
+                    for shift in type_shifts.values():
+                        shift_id = course.id, shift.type, shift.number
+
+                        if (course, shift) in assigned_shifts or \
+                            (course.id, shift.type) not in assigned_shift_types:
+                            possible_students_by_shift[shift_id].add(student)
+                        else:
+                            unassignable_students_by_shift[shift_id].add(student)
+
+        self.__shift_indexes = (
+            possible_students_by_shift,
+            assigned_students_by_shift,
+            unassignable_students_by_shift
+        )
 
-        return possible_students_by_shift
+        return self.__shift_indexes
+
+    @property
+    def catalog(self) -> Catalog:
+        if self.__catalog is None:
+            self.__catalog = Catalog(self.__courses.values(), validate=False)
+
+        return self.__catalog
 
     @property
     def courses(self) -> Mapping[str, Course]:
@@ -56,15 +181,100 @@ class SchedulingProblem:
     def students(self) -> Mapping[str, Student]:
         return self.__students
 
+    @property
+    def digest(self) -> bytes:
+        if self.__digest is None:
+            self.__digest = self.__calculate_digest()
+
+        return self.__digest
+
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, SchedulingProblem):
             return False
 
+        return self is other or self.digest == other.digest
+
+    def __hash__(self) -> int:
+        return int.from_bytes(self.digest[:8])
+
+    def __getstate__(self) -> SchedulingProblemState:
+        # NOTE: the catalog is serialized once, and students as CSR integer arrays indexing it
+        courses = list(self.catalog.courses.values())
+        course_indices = {course.id: i for i, course in enumerate(courses)}
+        shift_indices = {
+            (course.id, shift.type, shift.number): i
+            for i, (course, shift) in enumerate(self.list_shifts())
+        }
+
+        years = array('i')
+        enrollment_offsets = array('q', [0])
+        enrollment_courses = array('i')
+        schedule_offsets = array('q', [0])
+        schedule_shifts = array('i')
+
+        for student in self.__students.values():
+            years.append(student.year)
+
+            enrollment_courses.extend(
+                course_indices[course_id] for course_id in student.enrollments
+            )
+            enrollment_offsets.append(len(enrollment_courses))
+
+            schedule_shifts.extend(
+                shift_indices[course_id, shift.type, shift.number]
+                for (course_id, _), shift in student.previous_schedule.shifts.items()
+            )
+            schedule_offsets.append(len(schedule_shifts))
+
         return (
-            set(self.__courses) == set(other.courses) and
-            set(self.__students) == set(other.students)
+            self.catalog,
+            list(self.__students),
+            years,
+            enrollment_offsets,
+            enrollment_courses,
+            schedule_offsets,
+            schedule_shifts,
+            self.__digest
         )
 
+    def __setstate__(self, state: SchedulingProblemState) -> None:
+        (
+            catalog,
+            numbers,
+            years,
+            enrollment_offsets,
+            enrollment_courses,
+            schedule_offsets,
+            schedule_shifts,
+            digest
+        ) = state
+
+        courses = list(catalog.courses.values())
+
+        self.__catalog = catalog
+        self.__courses = dict(catalog.courses)
+        self.__students = {}
+        self.__shift_indexes = None
+        self.__students_by_course = None
+        self.__mandatory_shift_types = None
+        self.__digest = digest
+
+        # NOTE: the state comes from a valid problem, so students are rebuilt without validation
+        shifts = self.list_shifts()
+        for i, number in enumerate(numbers):
+            enrollments = (
+                courses[j]
+                for j in enrollment_courses[enrollment_offsets[i]:enrollment_offsets[i + 1]]
+            )
+            schedule = Schedule.interned(
+                (shifts[j] for j in schedule_shifts[schedule_offsets[i]:schedule_offsets[i + 1]]),
+                validate=False
+            )
+
+            self.__students[number] = Student(
+                number, years[i], enrollments, schedule, validate=False
+            )
+
     def __copy__(self) -> SchedulingProblem:
         return self # NOTE: SchedulingProblem and all its fields are immutable
 
@@ -74,3 +284,48 @@ class SchedulingProblem:
             f'courses={sorted(self.__courses.values())!r}, '
             f'students={sorted(self.__students.values())!r})'
         )
+
+    def __calculate_digest(self) -> bytes:
+        students = (
+            (student.number, student.year, student.enrollments, [
+                (course_id, shift.name)
+                for (course_id, _), shift in sorted(student.previous_schedule.shifts.items())
+            ])
+            for student in sorted(self.__students.values())
+        )
+
+        return SchedulingProblem.calculate_digest(self.__courses.values(), students)
+
+    @staticmethod
+    def calculate_digest(
+        courses: Iterable[Course],
+        students: Iterable[tuple[str, int, Iterable[str], Iterable[tuple[str, str]]]]) -> bytes:
+
+        # The digest of a problem, given its students' numbers, years, enrollments (by course id)
+        # and previous schedules (as pairs of course id and shift name). Students must be sorted by
+        # number, and their schedules by course id and shift type.
+        #
+        # NOTE: each record is encoded as a JSON array, which makes the encoding unambiguous
+        digest = hashlib.blake2b(digest_size=16)
+
+        def update(*record: object) -> None:
+            digest.update(json.dumps(record).encode())
+
+        for course in sorted(courses):
+            update('course', course.id, course.year)
+
+            for shift_type in sorted(course.shifts):
+                for shift in sorted(course.shifts[shift_type].values()):
+                    update('shift', shift.name, shift.capacity)
+
+                    for timeslot in sorted(shift.timeslots):
+                        day, start, end = str(timeslot.day), str(timeslot.start), str(timeslot.end)
+                        update('timeslot', day, start, end)
+
+        for number, year, enrollments, schedule in students:
+            update('student', number, year, sorted(enrollments))
+
+            for course_id, shift_name in schedule:
+                update('schedule', course_id, shift_name)
+
+        return digest.digest()
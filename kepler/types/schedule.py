@@ -1,6 +1,7 @@
 from __future__ import annotations
 from collections.abc import Iterable, Mapping
 import typing
+import weakref
 
 from .course import Course
 from .shift import Shift, ShiftType
@@ -12,9 +13,21 @@ class ScheduleError(Exception):
     pass
 
 class Schedule:
-    def __init__(self, shifts: Iterable[tuple[Course, Shift]]) -> None:
+    # NOTE: keyed by object identity, as a Schedule is only valid for the courses it references
+    __interned: typing.ClassVar[
+        weakref.WeakValueDictionary[frozenset[tuple[int, int]], Schedule]
+    ] = weakref.WeakValueDictionary()
+
+    def __init__(self, shifts: Iterable[tuple[Course, Shift]], validate: bool = True) -> None:
         self.__courses: dict[str, Course] = {}
         self.__shifts: dict[tuple[str, ShiftType], Shift] = {}
+        self.__validated = validate
+
+        if not validate:
+            for course, shift in shifts:
+                self.__courses[course.id] = course
+                self.__shifts[course.id, shift.type] = shift
+            return
 
         for course, shift in shifts:
             full_shift_type = course.id, shift.type
@@ -30,9 +43,10 @@ class Schedule:
             self.__shifts[course.id, shift.type] = shift
 
     def is_valid_for_student(self, student: Student) -> bool:
-        return all(
-            student.enrollments.get(course.id) is course for course in self.__courses.values()
-        )
+        return self.is_valid_for_enrollments(student.enrollments)
+
+    def is_valid_for_enrollments(self, enrollments: Mapping[str, Course]) -> bool:
+        return all(enrollments.get(course.id) is course for course in self.__courses.values())
 
     def is_complete_for_student(self, student: Student) -> bool:
         mandatory_shift_types = {
@@ -49,7 +63,7 @@ class Schedule:
         if not isinstance(other, Schedule):
             return False
 
-        return self.__shifts == other.shifts
+        return self is other or self.__shifts == other.shifts
 
     def __copy__(self) -> Schedule:
         return self # NOTE: Schedule and all its fields are immutable
@@ -60,3 +74,17 @@ class Schedule:
         )
 
         return f'Schedule(shifts={presentable_shifts!r})'
+
+    @staticmethod
+    def interned(shifts: Iterable[tuple[Course, Shift]], validate: bool = True) -> Schedule:
+        shifts = list(shifts)
+        key = frozenset((id(course), id(shift)) for course, shift in shifts)
+
+        # NOTE: schedules interned without validation are validated when requested with it
+        schedule = Schedule.__interned.get(key)
+        if schedule is None or len(key) != len(shifts) or (validate and not schedule.__validated):
+            schedule = Schedule(shifts, validate)
+            if len(key) == len(shifts):
+                Schedule.__interned[key] = schedule
+
+        return schedule
@@ -24,13 +24,18 @@ class Shift:
         type_: ShiftType,
         number: int,
         capacity: int,
-        timeslots: Iterable[Timeslot]) -> None:
+        timeslots: Iterable[Timeslot],
+        validate: bool = True) -> None:
 
         self.__type = type_
         self.__number = number
         self.__capacity = capacity
         self.__timeslots: set[Timeslot] = set()
 
+        if not validate:
+            self.__timeslots.update(timeslots)
+            return
+
         if number <= 0:
             raise ShiftError(f'Non-positive number {number} in shift {self.name}')
         if capacity <= 0:
@@ -80,6 +85,9 @@ class Shift:
         else:
             return self.__number < other.number
 
+    def __reduce__(self) -> tuple[object, tuple[ShiftType, int, int, list[Timeslot]]]:
+        return Shift, (self.__type, self.__number, self.__capacity, list(self.__timeslots))
+
     def __copy__(self) -> Shift:
         return self # NOTE: Shift and all its fields are immutable
 
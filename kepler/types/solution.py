@@ -1,62 +1,245 @@
 from __future__ import annotations
-from collections.abc import Mapping
+from array import array
+from collections.abc import Iterator, Mapping, Sequence, Set
+import hashlib
+import json
 import pprint
+import typing
 
+from .columnar import ColumnarSchedulingProblem
+from .course import Course
 from .problem import SchedulingProblem
 from .schedule import Schedule
+from .shift import Shift, ShiftType
+
+SchedulingProblemSolutionState: typing.TypeAlias = tuple[
+    SchedulingProblem | ColumnarSchedulingProblem,
+    list[str],
+    'array[int]',
+    'array[int]',
+    None | bytes
+]
+
+# A student's number, enrollments and mandatory shift types
+StudentEnrollments: typing.TypeAlias = \
+    tuple[str, Mapping[str, Course], Set[tuple[str, ShiftType]]]
 
 class SchedulingProblemSolutionError(Exception):
     pass
 
 class SchedulingProblemSolution:
-    def __init__(self, problem: SchedulingProblem, final_schedules: Mapping[str, Schedule]) -> None:
-        self.__problem = problem
+    def __init__(
+        self,
+        problem: SchedulingProblem | ColumnarSchedulingProblem,
+        final_schedules: Mapping[str, Schedule],
+        validate: bool = True) -> None:
+
+        # NOTE: the object model of a columnar problem is only materialized when it's needed
+        self.__problem: None | SchedulingProblem = None
+        self.__columnar_problem: None | ColumnarSchedulingProblem = None
+        if isinstance(problem, ColumnarSchedulingProblem):
+            self.__columnar_problem = problem
+        else:
+            self.__problem = problem
+
         self.__final_schedules: dict[str, Schedule] = dict(final_schedules)
+        self.__digest: None | bytes = None
+
+        if validate:
+            self.validate()
 
-        for student_number in final_schedules:
-            if student_number not in problem.students:
+    def validate(self) -> None:
+        if self.__problem is None:
+            problem = typing.cast(ColumnarSchedulingProblem, self.__columnar_problem)
+            student_numbers: Set[str] = set(problem.student_numbers)
+            students = self.__list_columnar_enrollments(problem)
+        else:
+            student_numbers = self.__problem.students.keys()
+            mandatory_shift_types = self.__problem.list_mandatory_shift_types_by_student()
+            students = (
+                (student.number, student.enrollments, mandatory_shift_types[student.number])
+                for student in self.__problem.students.values()
+            )
+
+        for student_number in self.__final_schedules:
+            if student_number not in student_numbers:
                 raise SchedulingProblemSolutionError(
                     f'Schedule for unknown student {student_number}'
                 )
 
-        for student in problem.students.values():
-            schedule = final_schedules.get(student.number)
+        # NOTE: schedules are interned, so validity is only checked once per distinct pair of
+        # schedule and set of enrollments (all enrollments reference the problem's courses)
+        valid_schedules: set[tuple[int, Set[tuple[str, ShiftType]]]] = set()
+
+        for student_number, enrollments, student_shift_types in students:
+            schedule = self.__final_schedules.get(student_number)
 
             if schedule is None:
                 raise SchedulingProblemSolutionError(
-                    f'Missing schedule for student {student.number}'
+                    f'Missing schedule for student {student_number}'
                 )
-            elif not schedule.is_valid_for_student(student):
+            elif (id(schedule), student_shift_types) in valid_schedules:
+                continue
+            elif not schedule.is_valid_for_enrollments(enrollments):
                 raise SchedulingProblemSolutionError(
-                    f'Invalid schedule for student {student.number}'
+                    f'Invalid schedule for student {student_number}'
                 )
-            elif not schedule.is_complete_for_student(student):
+            elif schedule.shifts.keys() != student_shift_types:
                 raise SchedulingProblemSolutionError(
-                    f'Incomplete schedule for student {student.number}'
+                    f'Incomplete schedule for student {student_number}'
                 )
 
+            valid_schedules.add((id(schedule), student_shift_types))
+
     @property
     def problem(self) -> SchedulingProblem:
+        # NOTE: the object model of columnar problems is built (and kept) on first access, which
+        # is as large as the problem itself. Validation, digests, pickling and repr don't need it.
+        if self.__problem is None:
+            self.__problem = typing.cast(ColumnarSchedulingProblem, self.__columnar_problem) \
+                .to_problem()
+
         return self.__problem
 
+    @property
+    def columnar_problem(self) -> None | ColumnarSchedulingProblem:
+        # The columnar problem this solution was built for, if any
+        return self.__columnar_problem
+
     @property
     def final_schedules(self) -> Mapping[str, Schedule]:
         return self.__final_schedules
 
+    @property
+    def digest(self) -> bytes:
+        if self.__digest is None:
+            self.__digest = self.__calculate_digest()
+
+        return self.__digest
+
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, SchedulingProblemSolution):
             return False
 
-        return self.__problem == other.problem and self.__final_schedules == other.final_schedules
+        return self is other or self.digest == other.digest
+
+    def __hash__(self) -> int:
+        return int.from_bytes(self.digest[:8])
+
+    def __getstate__(self) -> SchedulingProblemSolutionState:
+        # NOTE: schedules are serialized as CSR arrays of indices into the problem's shifts, and
+        # columnar problems are serialized as such
+        problem: SchedulingProblem | ColumnarSchedulingProblem
+        if self.__problem is None:
+            problem = typing.cast(ColumnarSchedulingProblem, self.__columnar_problem)
+        else:
+            problem = self.__problem
+
+        shift_indices = {
+            (course.id, shift.type, shift.number): i
+            for i, (course, shift) in enumerate(SchedulingProblemSolution.__list_shifts(problem))
+        }
+
+        schedule_offsets = array('q', [0])
+        schedule_shifts = array('i')
+        for schedule in self.__final_schedules.values():
+            schedule_shifts.extend(
+                shift_indices[course_id, shift.type, shift.number]
+                for (course_id, _), shift in schedule.shifts.items()
+            )
+            schedule_offsets.append(len(schedule_shifts))
+
+        return (
+            problem,
+            list(self.__final_schedules),
+            schedule_offsets,
+            schedule_shifts,
+            self.__digest
+        )
+
+    def __setstate__(self, state: SchedulingProblemSolutionState) -> None:
+        problem, numbers, schedule_offsets, schedule_shifts, digest = state
+
+        self.__problem = None
+        self.__columnar_problem = None
+        if isinstance(problem, ColumnarSchedulingProblem):
+            self.__columnar_problem = problem
+        else:
+            self.__problem = problem
+
+        self.__final_schedules = {}
+        self.__digest = digest
+
+        # NOTE: the state comes from a valid solution, so schedules are rebuilt without validation
+        shifts = SchedulingProblemSolution.__list_shifts(problem)
+        for i, number in enumerate(numbers):
+            self.__final_schedules[number] = Schedule.interned(
+                (shifts[j] for j in schedule_shifts[schedule_offsets[i]:schedule_offsets[i + 1]]),
+                validate=False
+            )
 
     def __copy__(self) -> SchedulingProblemSolution:
         return self # NOTE: SchedulingProblemSolution and all its fields are immutable
 
     def __repr__(self) -> str:
         schedules_formatted = pprint.pformat(self.__final_schedules, indent=0, sort_dicts=True)
+        problem = self.__columnar_problem if self.__problem is None else self.__problem
 
         return (
             'SchedulingProblemSolution('
-            f'problem={self.__problem!r}, '
+            f'problem={problem!r}, '
             f'final_schedules={schedules_formatted})'
         )
+
+    def __calculate_digest(self) -> bytes:
+        # NOTE: each record is encoded as a JSON array, which makes the encoding unambiguous
+        problem_digest = typing.cast(ColumnarSchedulingProblem, self.__columnar_problem).digest \
+            if self.__problem is None else self.__problem.digest
+        digest = hashlib.blake2b(problem_digest, digest_size=16)
+
+        for number, schedule in sorted(self.__final_schedules.items()):
+            shifts = [
+                [course_id, shift.name] for (course_id, _), shift in sorted(schedule.shifts.items())
+            ]
+
+            digest.update(json.dumps([number, shifts]).encode())
+
+        return digest.digest()
+
+    @staticmethod
+    def __list_shifts(
+        problem: SchedulingProblem | ColumnarSchedulingProblem) -> Sequence[tuple[Course, Shift]]:
+
+        if isinstance(problem, ColumnarSchedulingProblem):
+            return problem.shifts
+        else:
+            return problem.list_shifts()
+
+    @staticmethod
+    def __list_columnar_enrollments(
+        problem: ColumnarSchedulingProblem) -> Iterator[StudentEnrollments]:
+
+        # The enrollments and mandatory shift types of each student, which students with the same
+        # enrollments share
+        enrollments_by_courses: dict[
+            tuple[int, ...], tuple[dict[str, Course], frozenset[tuple[str, ShiftType]]]
+        ] = {}
+
+        offsets = problem.enrollment_offsets
+        for i, number in enumerate(problem.student_numbers):
+            course_indices = tuple(problem.enrollment_courses[offsets[i]:offsets[i + 1]])
+            student_enrollments = enrollments_by_courses.get(course_indices)
+
+            if student_enrollments is None:
+                courses = [problem.courses[course_index] for course_index in course_indices]
+                student_enrollments = (
+                    {course.id: course for course in courses},
+                    frozenset(
+                        (course.id, shift_type)
+                        for course in courses
+                        for shift_type in course.shifts
+                    )
+                )
+                enrollments_by_courses[course_indices] = student_enrollments
+
+            yield number, *student_enrollments
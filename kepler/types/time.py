@@ -1,12 +1,17 @@
 from __future__ import annotations
 import functools
 import re
+import typing
+import weakref
 
 class ScheduleTimeError(Exception):
     pass
 
 @functools.total_ordering
 class ScheduleTime:
+    __interned: typing.ClassVar[weakref.WeakValueDictionary[tuple[int, int], ScheduleTime]] = \
+        weakref.WeakValueDictionary()
+
     def __init__(self, hour: int, minute: int) -> None:
         self.__hour = hour
         self.__minute = minute
@@ -26,7 +31,7 @@ class ScheduleTime:
         if not isinstance(other, ScheduleTime):
             return False
 
-        return self.__hour == other.hour and self.__minute == other.minute
+        return self is other or (self.__hour == other.hour and self.__minute == other.minute)
 
     def __lt__(self, other: ScheduleTime) -> bool:
         if self.__hour != other.hour:
@@ -34,6 +39,9 @@ class ScheduleTime:
         else:
             return self.__minute < other.minute
 
+    def __reduce__(self) -> tuple[object, tuple[int, int]]:
+        return ScheduleTime.interned, (self.__hour, self.__minute)
+
     def __copy__(self) -> ScheduleTime:
         return self # NOTE: ScheduleTime and all its fields are immutable
 
@@ -54,4 +62,13 @@ class ScheduleTime:
 
         hour = int(match.group(1))
         minute = int(match.group(2))
-        return ScheduleTime(hour, minute)
+        return ScheduleTime.interned(hour, minute)
+
+    @staticmethod
+    def interned(hour: int, minute: int) -> ScheduleTime:
+        time = ScheduleTime.__interned.get((hour, minute))
+        if time is None:
+            time = ScheduleTime(hour, minute)
+            ScheduleTime.__interned[hour, minute] = time
+
+        return time
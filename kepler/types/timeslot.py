@@ -1,5 +1,7 @@
 from __future__ import annotations
 import functools
+import typing
+import weakref
 
 from .time import ScheduleTime
 from .weekday import Weekday
@@ -9,6 +11,10 @@ class TimeslotError(Exception):
 
 @functools.total_ordering
 class Timeslot:
+    __interned: typing.ClassVar[
+        weakref.WeakValueDictionary[tuple[Weekday, ScheduleTime, ScheduleTime], Timeslot]
+    ] = weakref.WeakValueDictionary()
+
     def __init__(self, day: Weekday, start: ScheduleTime, end: ScheduleTime) -> None:
         if end <= start:
             raise TimeslotError(f'Timeslot\'s start ({start!r}) must precede its end ({end!r})')
@@ -36,7 +42,9 @@ class Timeslot:
         if not isinstance(other, Timeslot):
             return False
 
-        return self.__day == other.day and self.__start == other.start and self.__end == other.end
+        return self is other or (
+            self.__day == other.day and self.__start == other.start and self.__end == other.end
+        )
 
     def __lt__(self, other: Timeslot) -> bool:
         if self.__day != other.day:
@@ -46,6 +54,9 @@ class Timeslot:
         else:
             return self.__end < other.end
 
+    def __reduce__(self) -> tuple[object, tuple[Weekday, ScheduleTime, ScheduleTime]]:
+        return Timeslot.interned, (self.__day, self.__start, self.__end)
+
     def __copy__(self) -> Timeslot:
         return self # NOTE: Timeslot and all its fields are immutable
 
@@ -54,3 +65,12 @@ class Timeslot:
 
     def __repr__(self) -> str:
         return f'Timeslot(day={self.__day!r}, start={self.__start!r}, end={self.__end!r})'
+
+    @staticmethod
+    def interned(day: Weekday, start: ScheduleTime, end: ScheduleTime) -> Timeslot:
+        timeslot = Timeslot.__interned.get((day, start, end))
+        if timeslot is None:
+            timeslot = Timeslot(day, start, end)
+            Timeslot.__interned[day, start, end] = timeslot
+
+        return timeslot
@@ -0,0 +1,351 @@
+import gzip
+import json
+import logging
+from multiprocessing.connection import Connection
+import pytest
+import time
+import typing
+
+from starlette.testclient import TestClient
+
+from kepler.api import API, SQLiteJobStore
+from kepler.api.jobs import Job, JobStatus
+from kepler.api.pool import WorkerPool
+from kepler.api.store import CatalogSubmission
+from kepler.types import SchedulingProblem
+
+COURSES_JSON: list[object] = [
+    {
+        'id': 'J301N1',
+        'year': 1,
+        'shifts': [
+            { 'type': 'T', 'number': 1, 'capacity': 100, 'timeslots': [] },
+            { 'type': 'PL', 'number': 1, 'capacity': 10, 'timeslots': [] },
+            { 'type': 'PL', 'number': 2, 'capacity': 10, 'timeslots': [] }
+        ]
+    }
+]
+
+PROGRESS = {'incumbent_objective': 10.0, 'best_bound': 5.0, 'gap': 0.5, 'elapsed_time': 1.0}
+
+def __solve_stub(connection: Connection, problem: SchedulingProblem, solver_threads: int) -> None:
+    # Stands in for the solver, answering with the problem's students. Problems with a "SLOW"
+    # student run until they're killed, and those with a "PROGRESS" student report some progress
+    # before answering.
+    connection.send(('status', JobStatus.RUNNING))
+    if 'SLOW' in problem.students:
+        time.sleep(60)
+    elif 'PROGRESS' in problem.students:
+        connection.send(('progress', PROGRESS))
+        time.sleep(1)
+
+    connection.send(('result', json.dumps({'schedules': sorted(problem.students)}).encode()))
+    connection.close()
+
+def __problem(*numbers: str) -> bytes:
+    students_json = [
+        { 'number': number, 'year': 1, 'enrollments': ['J301N1'] } for number in numbers
+    ]
+
+    return json.dumps({'courses': COURSES_JSON, 'students': students_json}).encode()
+
+def __batch(*variants: list[str]) -> bytes:
+    variants_json = [
+        {'students': [
+            { 'number': number, 'year': 1, 'enrollments': ['J301N1'] } for number in numbers
+        ]}
+        for numbers in variants
+    ]
+
+    return json.dumps({'courses': COURSES_JSON, 'variants': variants_json}).encode()
+
+def __wait_for_status(client: TestClient, jobid: str, status: JobStatus) -> None:
+    deadline = time.monotonic() + 30
+    while client.get(f'/api/v1/solution/{jobid}').json().get('status') != status.value:
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
+
+def __read_events(client: TestClient, jobid: str) -> list[tuple[str, object]]:
+    # The (event, data) pairs of the job's server-sent events, until the stream is closed
+    events: list[tuple[str, object]] = []
+
+    with client.stream('GET', f'/api/v1/solution/{jobid}/events') as response:
+        assert response.status_code == 200
+        assert response.headers['Content-Type'].startswith('text/event-stream')
+
+        event = None
+        for line in response.iter_lines():
+            if line.startswith('event: '):
+                event = line[len('event: '):]
+            elif line.startswith('data: '):
+                events.append((typing.cast(str, event), json.loads(line[len('data: '):])))
+
+    return events
+
+@pytest.fixture
+def api(monkeypatch: pytest.MonkeyPatch) -> API:
+    monkeypatch.setattr('kepler.api.pool.solve_problem', __solve_stub)
+    return API(workers=1, solver_threads=1)
+
+@pytest.fixture
+def attached(monkeypatch: pytest.MonkeyPatch) -> list[bool]:
+    # Whether each job handed to the pool was attached to the task of an identical problem
+    attached: list[bool] = []
+    submit = WorkerPool.submit
+
+    def submit_spy(pool: WorkerPool, job: Job, *args: typing.Any, **kwargs: typing.Any) -> bool:
+        attached.append(submit(pool, job, *args, **kwargs))
+        return attached[-1]
+
+    monkeypatch.setattr(WorkerPool, 'submit', submit_spy)
+    return attached
+
+@pytest.fixture
+def client(api: API) -> TestClient:
+    return TestClient(api._API__starlette) # type: ignore
+
+def test_solve(client: TestClient) -> None:
+    jobid = client.post('/api/v1/solve', content=__problem('A1', 'A2')).json()['jobid']
+
+    response = client.get(f'/api/v1/solution/{jobid}?wait=30')
+    assert response.status_code == 200
+    assert response.json() == {'schedules': ['A1', 'A2']}
+
+def test_solve_gzip(client: TestClient) -> None:
+    payload = gzip.compress(__problem('A1'))
+    jobid = client.post(
+        '/api/v1/solve', content=payload, headers={'Content-Encoding': 'gzip'}
+    ).json()['jobid']
+
+    assert client.get(f'/api/v1/solution/{jobid}?wait=30').json() == {'schedules': ['A1']}
+
+@pytest.mark.parametrize('payload,error', [
+    (b'{"courses": []', 'Failed to parse JSON string'),
+    (b'{"courses": [], "students": [{"number": "A1"}]}', 'Missing the following necessary keys')
+])
+def test_invalid_submission(client: TestClient, payload: bytes, error: str) -> None:
+    # Submissions are accepted before they're parsed
+    jobid = client.post('/api/v1/solve', content=payload).json()['jobid']
+
+    response = client.get(f'/api/v1/solution/{jobid}?wait=30')
+    assert response.status_code == 400
+    assert error in response.json()['error']
+
+def test_unsupported_encoding(client: TestClient) -> None:
+    response = client.post(
+        '/api/v1/solve', content=__problem('A1'), headers={'Content-Encoding': 'br'}
+    )
+
+    assert response.status_code == 415
+
+def test_unknown_job(client: TestClient) -> None:
+    response = client.get('/api/v1/solution/00000000-0000-0000-0000-000000000000')
+    assert response.status_code == 404
+
+def test_catalogs(client: TestClient) -> None:
+    response = client.put('/api/v1/catalogs/fall', content=json.dumps(COURSES_JSON).encode())
+    assert response.status_code == 201
+    assert response.json() == {'catalog_id': 'fall', 'courses': 1, 'shifts': 3}
+
+    problem = json.dumps({
+        'catalog_id': 'fall', 'students': [{ 'number': 'A1', 'year': 1, 'enrollments': ['J301N1'] }]
+    }).encode()
+    jobid = client.post('/api/v1/solve', content=problem).json()['jobid']
+    assert client.get(f'/api/v1/solution/{jobid}?wait=30').json() == {'schedules': ['A1']}
+
+    assert client.delete('/api/v1/catalogs/fall').status_code == 204
+    assert client.get('/api/v1/catalogs/fall').status_code == 404
+
+    jobid = client.post('/api/v1/solve', content=problem).json()['jobid']
+    response = client.get(f'/api/v1/solution/{jobid}?wait=30')
+    assert response.status_code == 400
+    assert response.json() == {'error': 'Unknown catalog "fall"'}
+
+def test_invalid_stored_catalog(
+    monkeypatch: pytest.MonkeyPatch,
+    caplog: pytest.LogCaptureFixture) -> None:
+
+    store = SQLiteJobStore()
+    store.put_catalog(CatalogSubmission('fall', json.dumps(COURSES_JSON).encode(), 'identity'))
+    store.put_catalog(CatalogSubmission('spring', b'[{"id": 1}]', 'identity'))
+
+    # Catalogs that can't be parsed again are dropped, rather than keeping the API from starting
+    monkeypatch.setattr('kepler.api.pool.solve_problem', __solve_stub)
+    with caplog.at_level(logging.ERROR):
+        client = TestClient(API(store=store)._API__starlette) # type: ignore
+
+    assert client.get('/api/v1/catalogs/fall').status_code == 200
+    assert client.get('/api/v1/catalogs/spring').status_code == 404
+    assert 'Dropped stored catalog spring' in caplog.text
+
+def test_cancel(client: TestClient) -> None:
+    jobid = client.post('/api/v1/solve', content=__problem('SLOW')).json()['jobid']
+    __wait_for_status(client, jobid, JobStatus.RUNNING)
+
+    response = client.delete(f'/api/v1/solution/{jobid}')
+    assert response.status_code == 200
+    assert response.json() == {'status': 'Cancelled'}
+    assert client.get(f'/api/v1/solution/{jobid}').status_code == 410
+
+    response = client.delete(f'/api/v1/solution/{jobid}')
+    assert response.status_code == 409
+    assert response.json() == {'error': 'Job already finished: Cancelled'}
+
+    # The worker is freed for the next job
+    jobid = client.post('/api/v1/solve', content=__problem('A1')).json()['jobid']
+    assert client.get(f'/api/v1/solution/{jobid}?wait=30').json() == {'schedules': ['A1']}
+
+def test_cancel_finished(client: TestClient) -> None:
+    jobid = client.post('/api/v1/solve', content=__problem('A1')).json()['jobid']
+    assert client.get(f'/api/v1/solution/{jobid}?wait=30').status_code == 200
+
+    response = client.delete(f'/api/v1/solution/{jobid}')
+    assert response.status_code == 409
+    assert response.json() == {'error': 'Job already finished: Done'}
+
+    response = client.delete('/api/v1/solution/00000000-0000-0000-0000-000000000000')
+    assert response.status_code == 404
+
+def test_wait(client: TestClient) -> None:
+    # Unfinished jobs are returned once the wait times out, and finished ones as soon as they finish
+    jobid = client.post('/api/v1/solve', content=__problem('SLOW')).json()['jobid']
+    __wait_for_status(client, jobid, JobStatus.RUNNING)
+
+    start = time.monotonic()
+    response = client.get(f'/api/v1/solution/{jobid}?wait=0.5')
+    assert time.monotonic() - start >= 0.5
+    assert response.json() == {'status': 'Running'}
+    client.delete(f'/api/v1/solution/{jobid}')
+
+    jobid = client.post('/api/v1/solve', content=__problem('A1')).json()['jobid']
+    start = time.monotonic()
+    assert client.get(f'/api/v1/solution/{jobid}?wait=120').json() == {'schedules': ['A1']}
+    assert time.monotonic() - start < 30
+
+@pytest.mark.parametrize('wait', ['-1', '121', 'soon'])
+def test_invalid_wait(client: TestClient, wait: str) -> None:
+    jobid = client.post('/api/v1/solve', content=__problem('A1')).json()['jobid']
+
+    response = client.get(f'/api/v1/solution/{jobid}?wait={wait}')
+    assert response.status_code == 400
+    assert response.json() == {
+        'error': f'Invalid wait time (expected 0 to 120 seconds): {wait}'
+    }
+
+def test_too_many_queued_jobs(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr('kepler.api.pool.solve_problem', __solve_stub)
+    client = TestClient(API(workers=1, max_queued_jobs=1)._API__starlette) # type: ignore
+
+    running_jobid = client.post('/api/v1/solve', content=__problem('SLOW')).json()['jobid']
+    __wait_for_status(client, running_jobid, JobStatus.RUNNING)
+    queued_jobid = client.post('/api/v1/solve', content=__problem('SLOW', 'A1')).json()['jobid']
+    __wait_for_status(client, queued_jobid, JobStatus.QUEUED)
+
+    # Without any solved job, clients are asked to retry after the default time
+    response = client.post('/api/v1/solve', content=__problem('A1'))
+    assert response.status_code == 429
+    assert response.headers['Retry-After'] == '30'
+    assert client.post('/api/v1/batch', content=b'{}').status_code == 429
+
+    client.delete(f'/api/v1/solution/{queued_jobid}')
+    assert client.post('/api/v1/solve', content=__problem('A1')).status_code == 200
+    client.delete(f'/api/v1/solution/{running_jobid}')
+
+def test_batch(client: TestClient) -> None:
+    batchid = client.post('/api/v1/batch', content=__batch(['A1'], ['SLOW'])).json()['batchid']
+
+    deadline = time.monotonic() + 30
+    while client.get(f'/api/v1/batch/{batchid}').json()['status'] != 'Running':
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
+
+    # Batches keep running until all of their variants finished
+    batch_json = client.get(f'/api/v1/batch/{batchid}?wait=0.5').json()
+    assert batch_json['status'] == 'Running'
+    assert batch_json['variant_statuses'] == {'Done': 1, 'Running': 1}
+    done_json, running_json = batch_json['variants']
+    assert done_json == {'jobid': done_json['jobid'], 'status': 'Done', 'schedules': ['A1']}
+    assert running_json == {'jobid': running_json['jobid'], 'status': 'Running'}
+
+    assert client.delete(f'/api/v1/solution/{running_json["jobid"]}').status_code == 200
+    batch_json = client.get(f'/api/v1/batch/{batchid}?wait=30').json()
+    assert batch_json['status'] == 'Done'
+    assert batch_json['variant_statuses'] == {'Done': 1, 'Cancelled': 1}
+    assert batch_json['variants'][0] == done_json
+    assert batch_json['variants'][1]['status'] == 'Cancelled'
+    assert 'error' in batch_json['variants'][1]
+
+def test_invalid_batch(client: TestClient) -> None:
+    payload = json.loads(__batch(['A1'], ['A2']))
+    payload['variants'][1]['students'][0]['enrollments'] = ['J999N9']
+    batchid = client.post('/api/v1/batch', content=json.dumps(payload).encode()).json()['batchid']
+
+    deadline = time.monotonic() + 30
+    while (response := client.get(f'/api/v1/batch/{batchid}')).status_code == 200:
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
+
+    assert response.status_code == 400
+    assert response.json() == {
+        'error': 'Invalid batch variant 1: Course J999N9 in enrollment was not found'
+    }
+
+def test_unknown_batch(client: TestClient) -> None:
+    assert client.get('/api/v1/batch/00000000-0000-0000-0000-000000000000').status_code == 404
+
+def test_events(client: TestClient) -> None:
+    jobid = client.post('/api/v1/solve', content=__problem('PROGRESS')).json()['jobid']
+    events = __read_events(client, jobid)
+
+    # The job's status as it changes, its progress, and finally its outcome, after which the stream
+    # is closed
+    assert events[0][0] == 'status'
+    assert ('progress', PROGRESS) in events
+    assert events[-2:] == [('status', {'status': 'Done'}), ('result', {'schedules': ['PROGRESS']})]
+
+def test_finished_events(client: TestClient) -> None:
+    # Finished jobs only have their outcome
+    jobid = client.post('/api/v1/solve', content=__problem('A1')).json()['jobid']
+    client.get(f'/api/v1/solution/{jobid}?wait=30')
+    assert __read_events(client, jobid) == [
+        ('status', {'status': 'Done'}), ('result', {'schedules': ['A1']})
+    ]
+
+    jobid = client.post('/api/v1/solve', content=__problem('SLOW')).json()['jobid']
+    client.delete(f'/api/v1/solution/{jobid}')
+    events = __read_events(client, jobid)
+    assert [event for event, _ in events] == ['status', 'error']
+    assert events[0] == ('status', {'status': 'Cancelled'})
+
+    response = client.get('/api/v1/solution/00000000-0000-0000-0000-000000000000/events')
+    assert response.status_code == 404
+
+def test_coalesced_jobs(client: TestClient, attached: list[bool]) -> None:
+    jobid1 = client.post('/api/v1/solve', content=__problem('SLOW')).json()['jobid']
+    __wait_for_status(client, jobid1, JobStatus.RUNNING)
+
+    # Identical submissions share the task still solving
+    jobid2 = client.post('/api/v1/solve', content=__problem('SLOW')).json()['jobid']
+    __wait_for_status(client, jobid2, JobStatus.RUNNING)
+    assert attached == [False, True]
+
+    # Which keeps running while any of its jobs wants it
+    assert client.delete(f'/api/v1/solution/{jobid1}').status_code == 200
+    assert client.get(f'/api/v1/solution/{jobid2}').json() == {'status': 'Running'}
+    assert client.get('/api/v1/status').json()['busy_workers'] == 1
+
+    # And is killed once all of them are cancelled, freeing the worker
+    assert client.delete(f'/api/v1/solution/{jobid2}').status_code == 200
+    jobid3 = client.post('/api/v1/solve', content=__problem('A1')).json()['jobid']
+    assert client.get(f'/api/v1/solution/{jobid3}?wait=30').json() == {'schedules': ['A1']}
+    assert attached == [False, True, False]
+
+def test_reused_result(client: TestClient, attached: list[bool]) -> None:
+    jobid1 = client.post('/api/v1/solve', content=__problem('A1')).json()['jobid']
+    assert client.get(f'/api/v1/solution/{jobid1}?wait=30').json() == {'schedules': ['A1']}
+
+    # Identical submissions are answered with the solved job's result, without solving them again
+    jobid2 = client.post('/api/v1/solve', content=__problem('A1')).json()['jobid']
+    assert jobid2 != jobid1
+    assert client.get(f'/api/v1/solution/{jobid2}?wait=30').json() == {'schedules': ['A1']}
+    assert attached == [False]
@@ -0,0 +1,161 @@
+from concurrent.futures import Future
+import functools
+import json
+from multiprocessing.connection import Connection
+import os
+import pytest
+import threading
+import time
+import typing
+
+from kepler.api.jobs import Job, JobPriority, JobStatus
+from kepler.api.pool import PoolTask, WorkerPool, WorkerPoolError
+from kepler.types import Schedule, SchedulingProblem, Student
+
+__lock = threading.Lock()
+
+def __solve_stub(connection: Connection, problem: SchedulingProblem, solver_threads: int) -> None:
+    # Stands in for the solver, answering with its process id. Problems with a "SLOW" student run
+    # until they're killed, and those with a "CRASH" student exit without answering. Those with a
+    # "LOCK" student take a lock held by the API process.
+    connection.send(('status', JobStatus.RUNNING))
+    if 'SLOW' in problem.students:
+        time.sleep(60)
+    elif 'CRASH' in problem.students:
+        os._exit(1)
+    elif 'LOCK' in problem.students:
+        with __lock:
+            pass
+
+    connection.send(('result', json.dumps({'pid': os.getpid()}).encode()))
+    connection.close()
+
+def __problem(*numbers: str) -> SchedulingProblem:
+    return SchedulingProblem([], [Student(number, 1, [], Schedule([])) for number in numbers])
+
+def __wait_for_status(job: Job, status: JobStatus) -> None:
+    deadline = time.monotonic() + 30
+    while job.status != status and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    assert job.status == status
+
+def __finished(finished: list[str], fingerprint: str, _: Future[bytes]) -> None:
+    finished.append(fingerprint)
+
+@pytest.fixture
+def pool(monkeypatch: pytest.MonkeyPatch) -> WorkerPool:
+    monkeypatch.setattr('kepler.api.pool.solve_problem', __solve_stub)
+    return WorkerPool(workers=2, solver_threads=1)
+
+def test_invalid_pool() -> None:
+    with pytest.raises(WorkerPoolError):
+        WorkerPool(workers=0, solver_threads=1)
+    with pytest.raises(WorkerPoolError):
+        WorkerPool(workers=1, solver_threads=0)
+
+def test_separate_workers(pool: WorkerPool) -> None:
+    slow_job = Job()
+    pool.submit(slow_job, __problem('SLOW'), 'slow')
+    __wait_for_status(slow_job, JobStatus.RUNNING)
+    assert pool.busy_workers == 1
+
+    # The other worker is still free
+    job = Job()
+    assert not pool.submit(job, __problem('A1'), 'a1')
+    assert json.loads(job.result.result(timeout=30))['pid'] != os.getpid()
+    assert pool.average_solve_time is not None
+
+    slow_job.cancel()
+    pool.cancel(slow_job)
+
+def test_shared_task(pool: WorkerPool) -> None:
+    job1 = Job()
+    job2 = Job()
+    assert not pool.submit(job1, __problem('SLOW'), 'slow')
+    assert pool.submit(job2, __problem('SLOW'), 'slow')
+    __wait_for_status(job2, JobStatus.RUNNING)
+
+    # The task keeps running while any of its jobs wants it
+    job1.cancel()
+    pool.cancel(job1)
+    assert pool.busy_workers == 1
+
+    job2.cancel()
+    pool.cancel(job2)
+    deadline = time.monotonic() + 30
+    while pool.busy_workers and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    assert pool.busy_workers == 0
+
+def test_crashed_worker(pool: WorkerPool) -> None:
+    job = Job()
+    pool.submit(job, __problem('CRASH'), 'crash')
+
+    with pytest.raises(WorkerPoolError):
+        job.result.result(timeout=30)
+
+def test_locks_held_while_starting(pool: WorkerPool) -> None:
+    # Workers aren't forked, so they don't inherit locks held by other threads
+    job = Job()
+    with __lock:
+        pool.submit(job, __problem('LOCK'), 'lock')
+        assert json.loads(job.result.result(timeout=30))['pid'] != os.getpid()
+
+def test_unpicklable_problem(pool: WorkerPool) -> None:
+    job = Job()
+    pool.submit(job, typing.cast(SchedulingProblem, threading.Lock()), 'unpicklable')
+
+    with pytest.raises(TypeError):
+        job.result.result(timeout=30)
+
+    # The worker is still available
+    assert pool.busy_workers == 0
+    job = Job()
+    pool.submit(job, __problem('A1'), 'a1')
+    job.result.result(timeout=30)
+
+def test_task_order() -> None:
+    tasks = [
+        PoolTask('b', __problem('B1'), JobPriority.BATCH, 0, 0),
+        PoolTask('n1', __problem('N1'), JobPriority.NORMAL, 5, 1),
+        PoolTask('n2', __problem('N2'), JobPriority.NORMAL, 5, 2),
+        PoolTask('n3', __problem('N3'), JobPriority.NORMAL, 1, 3),
+        PoolTask('i', __problem('I1'), JobPriority.INTERACTIVE, 10, 4)
+    ]
+
+    assert [task.fingerprint for task in sorted(tasks)] == ['i', 'n3', 'n1', 'n2', 'b']
+
+def test_queue_order(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr('kepler.api.pool.solve_problem', __solve_stub)
+    pool = WorkerPool(workers=1, solver_threads=1)
+
+    slow_job = Job()
+    pool.submit(slow_job, __problem('SLOW'), 'slow')
+    __wait_for_status(slow_job, JobStatus.RUNNING)
+
+    finished: list[str] = []
+    jobs: list[Job] = []
+    for fingerprint, priority, cost in [
+        ('b', JobPriority.BATCH, 0),
+        ('n1', JobPriority.NORMAL, 5),
+        ('n2', JobPriority.NORMAL, 1),
+        ('i', JobPriority.INTERACTIVE, 10),
+        ('b2', JobPriority.BATCH, 1)
+    ]:
+        job = Job()
+        job.result.add_done_callback(functools.partial(__finished, finished, fingerprint))
+        pool.submit(job, __problem(fingerprint), fingerprint, priority, cost)
+        jobs.append(job)
+
+    # Queued tasks take the highest priority of the jobs attached to them
+    assert pool.submit(Job(), __problem('b2'), 'b2', JobPriority.INTERACTIVE)
+    assert pool.queued_jobs == 5
+
+    slow_job.cancel()
+    pool.cancel(slow_job)
+    for job in jobs:
+        job.result.result(timeout=30)
+
+    assert finished == ['b2', 'i', 'n2', 'n1', 'b']
@@ -0,0 +1,216 @@
+import pathlib
+import pytest
+import uuid
+
+from kepler.api.jobs import JobStatus
+from kepler.api.store import (
+    BatchSubmission,
+    CatalogSubmission,
+    JobStore,
+    JobStoreError,
+    SQLiteJobStore,
+    Submission
+)
+
+class __Clock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+def __submission(payload: bytes = b'{}') -> Submission:
+    return Submission(uuid.uuid4(), payload, 'identity')
+
+def test_incomplete_store() -> None:
+    class PartialStore(JobStore):
+        def find_result(self, fingerprint: str) -> None | bytes:
+            return None
+
+    # Stores must implement all of JobStore's methods
+    with pytest.raises(TypeError):
+        PartialStore() # type: ignore
+
+def test_rereadable_result() -> None:
+    store = SQLiteJobStore()
+    submission = __submission()
+    store.add(submission)
+
+    stored_job = store.get(submission.jobid)
+    assert stored_job is not None and stored_job.status == JobStatus.PARSING
+
+    store.finish(submission.jobid, JobStatus.DONE, result=b'{"schedules": {}}')
+    for _ in range(2):
+        stored_job = store.get(submission.jobid)
+        assert stored_job is not None
+        assert stored_job.status == JobStatus.DONE
+        assert stored_job.result == b'{"schedules": {}}'
+
+    assert store.get(uuid.uuid4()) is None
+
+def test_error() -> None:
+    store = SQLiteJobStore()
+    submission = __submission()
+    store.add(submission)
+    store.finish(submission.jobid, JobStatus.INVALID, error='Failed to parse JSON string')
+
+    stored_job = store.get(submission.jobid)
+    assert stored_job is not None
+    assert stored_job.status == JobStatus.INVALID
+    assert stored_job.result is None
+    assert stored_job.error == 'Failed to parse JSON string'
+
+def test_finish_unfinished_status() -> None:
+    store = SQLiteJobStore()
+    submission = __submission()
+    store.add(submission)
+
+    with pytest.raises(JobStoreError):
+        store.finish(submission.jobid, JobStatus.RUNNING)
+
+def test_ttl_eviction() -> None:
+    clock = __Clock()
+    store = SQLiteJobStore(ttl=60, clock=clock)
+
+    old_submission, new_submission, unfinished_submission = \
+        __submission(), __submission(), __submission()
+    store.add(old_submission)
+    store.add(new_submission)
+    store.add(unfinished_submission)
+
+    store.finish(old_submission.jobid, JobStatus.DONE, result=b'{}')
+    clock.now += 30
+    store.finish(new_submission.jobid, JobStatus.DONE, result=b'{}')
+    clock.now += 30
+
+    # Expired jobs can't be read, even before they are evicted
+    assert store.get(old_submission.jobid) is None
+    store.evict()
+
+    assert store.get(old_submission.jobid) is None
+    assert store.get(new_submission.jobid) is not None
+    assert store.get(unfinished_submission.jobid) is not None
+
+def test_size_eviction() -> None:
+    clock = __Clock()
+    store = SQLiteJobStore(max_size=25, clock=clock)
+
+    submissions = [__submission() for _ in range(3)]
+    for submission in submissions:
+        store.add(submission)
+        store.finish(submission.jobid, JobStatus.DONE, result=b'0123456789')
+        clock.now += 1
+
+    store.evict()
+    assert store.get(submissions[0].jobid) is None
+    assert store.get(submissions[1].jobid) is not None
+    assert store.get(submissions[2].jobid) is not None
+
+def test_recovery(tmp_path: pathlib.Path) -> None:
+    path = str(tmp_path / 'jobs.sqlite')
+
+    store = SQLiteJobStore(path)
+    finished_submission = __submission(b'{"courses": [], "students": []}')
+    unfinished_submission = __submission(b'{"courses": [], "students": [{}]}')
+    store.add(finished_submission)
+    store.add(unfinished_submission)
+    store.finish(finished_submission.jobid, JobStatus.DONE, result=b'{}')
+    store.close()
+
+    store = SQLiteJobStore(path)
+    submissions = store.unfinished()
+    assert len(submissions) == 1
+    assert submissions[0].jobid == unfinished_submission.jobid
+    assert submissions[0].payload == unfinished_submission.payload
+    assert submissions[0].content_encoding == 'identity'
+
+    stored_job = store.get(finished_submission.jobid)
+    assert stored_job is not None and stored_job.result == b'{}'
+
+def test_invalid_parameters() -> None:
+    with pytest.raises(JobStoreError):
+        SQLiteJobStore(ttl=0)
+    with pytest.raises(JobStoreError):
+        SQLiteJobStore(max_size=-1)
+
+def test_find_result() -> None:
+    clock = __Clock()
+    store = SQLiteJobStore(ttl=60, clock=clock)
+
+    solved_submission, failed_submission = __submission(), __submission()
+    store.add(solved_submission)
+    store.add(failed_submission)
+    store.finish(failed_submission.jobid, JobStatus.FAILED, error='Solver error', fingerprint='f2')
+    store.finish(solved_submission.jobid, JobStatus.DONE, result=b'{}', fingerprint='f1')
+
+    assert store.find_result('f1') == b'{}'
+    assert store.find_result('f2') is None
+    assert store.find_result('f3') is None
+
+    clock.now += 60
+    assert store.find_result('f1') is None
+
+def test_batch() -> None:
+    store = SQLiteJobStore()
+    batchid, jobids = uuid.uuid4(), [uuid.uuid4(), uuid.uuid4()]
+    store.add_batch(BatchSubmission(batchid, b'{}', 'identity'))
+
+    stored_batch = store.get_batch(batchid)
+    assert stored_batch is not None
+    assert stored_batch.status == JobStatus.PARSING and stored_batch.jobids is None
+
+    store.start_batch(batchid, jobids)
+    stored_batch = store.get_batch(batchid)
+    assert stored_batch is not None and stored_batch.jobids == jobids
+
+    # The batch's jobs are restarted along with it
+    assert store.unfinished() == []
+    assert [submission.batchid for submission in store.unfinished_batches()] == [batchid]
+
+    store.finish(jobids[0], JobStatus.DONE, result=b'{}')
+    assert len(store.unfinished_batches()) == 1
+
+    store.finish(jobids[1], JobStatus.FAILED, error='Solver error')
+    stored_batch = store.get_batch(batchid)
+    assert stored_batch is not None and stored_batch.status == JobStatus.DONE
+    assert store.unfinished_batches() == []
+
+def test_failed_batch() -> None:
+    clock = __Clock()
+    store = SQLiteJobStore(ttl=60, clock=clock)
+    batchid = uuid.uuid4()
+    store.add_batch(BatchSubmission(batchid, b'{}', 'identity'))
+
+    with pytest.raises(JobStoreError):
+        store.fail_batch(batchid, JobStatus.RUNNING, 'Failed to parse JSON string')
+
+    store.fail_batch(batchid, JobStatus.INVALID, 'Failed to parse JSON string')
+    stored_batch = store.get_batch(batchid)
+    assert stored_batch is not None
+    assert stored_batch.status == JobStatus.INVALID
+    assert stored_batch.jobids is None
+    assert stored_batch.error == 'Failed to parse JSON string'
+    assert store.unfinished_batches() == []
+
+    clock.now += 60
+    store.evict()
+    assert store.get_batch(batchid) is None
+
+def test_catalogs(tmp_path: pathlib.Path) -> None:
+    path = str(tmp_path / 'jobs.sqlite')
+
+    store = SQLiteJobStore(path, ttl=60)
+    store.put_catalog(CatalogSubmission('fall', b'[]', 'identity'))
+    store.put_catalog(CatalogSubmission('spring', b'[]', 'identity'))
+    store.put_catalog(CatalogSubmission('fall', b'{"courses": []}', 'gzip'))
+    store.delete_catalog('spring')
+    store.evict()
+    store.close()
+
+    # Catalogs are kept until they are deleted, regardless of their age
+    store = SQLiteJobStore(path, ttl=60)
+    catalogs = store.list_catalogs()
+    assert len(catalogs) == 1
+    assert catalogs[0].catalog_id == 'fall'
+    assert catalogs[0].payload == b'{"courses": []}'
+    assert catalogs[0].content_encoding == 'gzip'
@@ -0,0 +1,176 @@
+import gzip
+import json
+from multiprocessing.connection import Connection
+import pathlib
+import pytest
+import threading
+import time
+import typing
+
+from kepler.api import worker
+from kepler.api.jobs import JobPriority
+from kepler.api.worker import (
+    initialize_parsing_worker,
+    parse_batch,
+    parse_catalog,
+    parse_submission
+)
+from kepler.io import JsonImporterError
+
+COURSES_JSON: list[object] = [
+    {
+        'id': 'J301N1',
+        'year': 1,
+        'shifts': [
+            { 'type': 'T', 'number': 1, 'capacity': 100, 'timeslots': [] },
+            { 'type': 'PL', 'number': 1, 'capacity': 10, 'timeslots': [] },
+            { 'type': 'PL', 'number': 2, 'capacity': 10, 'timeslots': [] }
+        ]
+    }
+]
+
+STUDENTS_JSON: list[object] = [
+    { 'number': f'A{i}', 'year': 1, 'enrollments': ['J301N1'] } for i in range(3)
+]
+
+class __Connection:
+    def __init__(self) -> None:
+        self.messages: list[tuple[str, dict[str, None | float]]] = []
+
+    def send(self, message: tuple[str, dict[str, None | float]]) -> None:
+        self.messages.append(message)
+
+    def wait_for_messages(self, count: int) -> None:
+        deadline = time.monotonic() + 10
+        while len(self.messages) < count:
+            assert time.monotonic() < deadline
+            time.sleep(0.01)
+
+def __encode(root_json: object, content_encoding: str) -> bytes:
+    payload = json.dumps(root_json).encode('utf-8')
+    return gzip.compress(payload) if content_encoding == 'gzip' else payload
+
+@pytest.mark.parametrize('content_encoding', ['identity', 'gzip'])
+def test_submission_priority(content_encoding: str) -> None:
+    # Options may come after the problem, which is still converted while it's read
+    payload = __encode(
+        {'students': STUDENTS_JSON, 'courses': COURSES_JSON, 'priority': 'interactive'},
+        content_encoding
+    )
+
+    submission = parse_submission(payload, content_encoding)
+    assert submission.priority == JobPriority.INTERACTIVE
+    assert list(submission.problem.students) == ['A0', 'A1', 'A2']
+    assert submission.cost == 9
+
+def test_submission_default_priority() -> None:
+    payload = __encode({'courses': COURSES_JSON, 'students': STUDENTS_JSON}, 'identity')
+    assert parse_submission(payload, 'identity').priority == JobPriority.NORMAL
+
+def test_submission_catalog() -> None:
+    catalog = parse_catalog(__encode(COURSES_JSON, 'identity'), 'identity')
+    initialize_parsing_worker({'fall': catalog})
+
+    payload = __encode({'students': STUDENTS_JSON, 'catalog_id': 'fall'}, 'identity')
+    assert parse_submission(payload, 'identity').problem.catalog is catalog
+
+@pytest.mark.parametrize('root_json,error', [
+    (
+        {'courses': COURSES_JSON},
+        'Missing the following necessary keys for the JSON\'s root: students'
+    ),
+    (
+        {'courses': COURSES_JSON, 'students': STUDENTS_JSON, 'priority': 'urgent'},
+        'Unknown priority "urgent". Expected one of: interactive, normal, batch'
+    ),
+    ({'catalog_id': 'spring', 'students': []}, 'Unknown catalog "spring"'),
+    ([], 'Failed to parse JSON string: Expecting \'{\': line 1 column 1 (char 0)')
+])
+def test_invalid_submission(root_json: object, error: str) -> None:
+    with pytest.raises(JsonImporterError) as einfo:
+        parse_submission(__encode(root_json, 'identity'), 'identity')
+
+    assert str(einfo.value) == error
+
+def test_batch() -> None:
+    payload = __encode({
+        'variants': [{'students': STUDENTS_JSON}, {'students': STUDENTS_JSON[:1]}],
+        'courses': COURSES_JSON,
+        'priority': 'batch'
+    }, 'gzip')
+
+    submissions = parse_batch(payload, 'gzip')
+    assert [len(submission.problem.students) for submission in submissions] == [3, 1]
+    assert all(submission.priority == JobPriority.BATCH for submission in submissions)
+    assert submissions[0].problem.catalog is submissions[1].problem.catalog
+
+@pytest.mark.parametrize('root_json,error', [
+    (
+        {'courses': COURSES_JSON},
+        'Batches must be objects with the following keys: courses, variants'
+    ),
+    ({'courses': COURSES_JSON, 'variants': []}, 'Batch variants must be a non-empty array'),
+    (
+        {'courses': COURSES_JSON, 'variants': [{'students': STUDENTS_JSON}, {}]},
+        'Invalid batch variant 1: Variants must be objects with students'
+    )
+])
+def test_invalid_batch(root_json: object, error: str) -> None:
+    with pytest.raises(JsonImporterError) as einfo:
+        parse_batch(__encode(root_json, 'identity'), 'identity')
+
+    assert str(einfo.value) == error
+
+def test_follow_solver_log(monkeypatch: pytest.MonkeyPatch, tmp_path: pathlib.Path) -> None:
+    monkeypatch.setattr('kepler.api.worker.SOLVER_LOG_POLLING_INTERVAL', 0.01)
+    connection = __Connection()
+    log_path = tmp_path / 'cbc.log'
+    finished = threading.Event()
+
+    # The log is followed once CBC creates it
+    follower = threading.Thread(
+        target=worker.__follow_solver_log,
+        args=(typing.cast(Connection, connection), str(log_path), finished)
+    )
+    follower.start()
+    time.sleep(0.05)
+
+    try:
+        with open(log_path, 'w', encoding='utf-8') as log:
+            log.write('Continuous objective value is 9000 - 0.01 seconds\n')
+            log.flush()
+            connection.wait_for_messages(1)
+
+            # Lines are only parsed once complete, even if read in parts
+            log.write('Cbc0012I Integer solution of 100')
+            log.flush()
+            time.sleep(0.05)
+            log.write('00 found by DiveCoefficient after 20 iterations and 0 nodes ')
+            log.write('(0.10 seconds)\n')
+            log.write('Cbc0038I Full problem 7 rows 8 columns, reduced to 0 rows 0 columns\n')
+            log.flush()
+            connection.wait_for_messages(2)
+
+            # The rest of the log is read once the solver finishes
+            log.write('Cbc0001I Search completed - best objective 9800, took 200 iterations ')
+            log.write('and 150 nodes (2.00 seconds)\n')
+    finally:
+        finished.set()
+        follower.join()
+
+    assert [kind for kind, _ in connection.messages] == ['progress'] * 3
+    assert [
+        (progress['incumbent_objective'], progress['best_bound'], progress['gap'])
+        for _, progress in connection.messages
+    ] == [(None, 9000.0, None), (10000.0, 9000.0, 0.1), (9800.0, 9800.0, 0.0)]
+
+def test_follow_missing_solver_log(tmp_path: pathlib.Path) -> None:
+    # CBC may finish (or fail) without writing its log
+    connection = __Connection()
+    finished = threading.Event()
+    finished.set()
+
+    worker.__follow_solver_log(
+        typing.cast(Connection, connection), str(tmp_path / 'cbc.log'), finished
+    )
+    assert connection.messages == []
@@ -0,0 +1,199 @@
+from array import array
+import pathlib
+import pytest
+
+from kepler.io.binary import (
+    BinaryFormatError,
+    BinaryProblemFile,
+    export_binary_problem_file,
+    export_binary_solution_file,
+    import_binary_columnar_problem_file,
+    import_binary_problem_file,
+    import_binary_solution_file
+)
+from kepler.io.exporter import export_json_problem_object
+from kepler.io.importer import import_json_problem_object
+from kepler.types import *
+
+def __build_problem() -> SchedulingProblem:
+    timeslot1 = Timeslot(Weekday.MONDAY, ScheduleTime(9, 0), ScheduleTime(11, 0))
+    timeslot2 = Timeslot(Weekday.FRIDAY, ScheduleTime(14, 30), ScheduleTime(24, 0))
+
+    shift1 = Shift(ShiftType.T, 1, 100, [timeslot2, timeslot1])
+    shift2 = Shift(ShiftType.PL, 1, 30, [timeslot1])
+    shift3 = Shift(ShiftType.PL, 2, 30, [])
+    course1 = Course('J305N1', 3, [shift3, shift2, shift1])
+
+    shift4 = Shift(ShiftType.TP, 1, 50, [])
+    course2 = Course('J305Ñ2', 2, [shift4])
+
+    student1 = Student('A100', 3, [course1], Schedule([(course1, shift2)]))
+    student2 = Student('J305N1', 2, [course2, course1], Schedule([]))
+    student3 = Student('A300', 1, [], Schedule([]))
+
+    return SchedulingProblem([course1, course2], [student1, student2, student3])
+
+def __build_solution() -> SchedulingProblemSolution:
+    problem = __build_problem()
+    course1 = problem.courses['J305N1']
+    course2 = problem.courses['J305Ñ2']
+
+    return SchedulingProblemSolution(problem, {
+        'J305N1': Schedule([
+            (course1, course1.shifts[ShiftType.T][1]),
+            (course1, course1.shifts[ShiftType.PL][2]),
+            (course2, course2.shifts[ShiftType.TP][1])
+        ]),
+        'A100': Schedule([
+            (course1, course1.shifts[ShiftType.T][1]),
+            (course1, course1.shifts[ShiftType.PL][1])
+        ]),
+        'A300': Schedule([])
+    })
+
+def test_problem_roundtrip(tmp_path: pathlib.Path) -> None:
+    problem = __build_problem()
+    path = str(tmp_path / 'problem.kbin')
+
+    export_binary_problem_file(path, problem)
+    assert import_binary_problem_file(path) == problem
+    assert list(import_binary_problem_file(path).students) == ['A100', 'J305N1', 'A300']
+
+def test_columnar_problem_roundtrip(tmp_path: pathlib.Path) -> None:
+    problem = ColumnarSchedulingProblem.from_problem(__build_problem())
+    path = str(tmp_path / 'problem.kbin')
+
+    export_binary_problem_file(path, problem)
+    imported_problem = import_binary_columnar_problem_file(path)
+
+    assert imported_problem.courses == problem.courses
+    assert imported_problem.student_numbers == problem.student_numbers
+    assert imported_problem.enrollment_courses == problem.enrollment_courses
+    assert imported_problem.schedule_shifts == problem.schedule_shifts
+
+def test_empty_problem_roundtrip(tmp_path: pathlib.Path) -> None:
+    path = str(tmp_path / 'problem.kbin')
+
+    export_binary_problem_file(path, SchedulingProblem([], []))
+    assert import_binary_problem_file(path) == SchedulingProblem([], [])
+
+def test_solution_roundtrip(tmp_path: pathlib.Path) -> None:
+    solution = __build_solution()
+    path = str(tmp_path / 'solution.kbin')
+
+    export_binary_solution_file(path, solution)
+    assert import_binary_solution_file(path) == solution
+
+    with BinaryProblemFile(path) as f:
+        assert f.is_solution
+        assert f.to_problem() == solution.problem
+
+def test_lazy_students(tmp_path: pathlib.Path) -> None:
+    problem = __build_problem()
+    path = str(tmp_path / 'problem.kbin')
+    export_binary_problem_file(path, problem)
+
+    with BinaryProblemFile(path) as f:
+        assert not f.is_solution
+        assert f.student_count == 3
+        assert list(f.courses) == list(problem.courses.values())
+
+        student = f.read_student(1)
+        assert student == problem.students['J305N1']
+        assert student.enrollments['J305N1'] is f.courses[0]
+        assert f.read_student(0) == problem.students['A100']
+
+        with pytest.raises(IndexError):
+            f.read_student(3)
+
+def test_problem_is_not_solution(tmp_path: pathlib.Path) -> None:
+    path = str(tmp_path / 'problem.kbin')
+    export_binary_problem_file(path, __build_problem())
+
+    with pytest.raises(BinaryFormatError):
+        import_binary_solution_file(path)
+
+def test_json_conversion(tmp_path: pathlib.Path) -> None:
+    problem = __build_problem()
+    path = str(tmp_path / 'problem.kbin')
+
+    problem_json = export_json_problem_object(problem)
+    export_binary_problem_file(path, import_json_problem_object(problem_json))
+    assert import_json_problem_object(
+        export_json_problem_object(import_binary_problem_file(path))
+    ) == problem
+
+@pytest.mark.parametrize('contents', [
+    b'',
+    b'KBIN',
+    b'JSON\x01\x00\x01\x00\x12\x00\x00\x00',
+    b'KBIN\x02\x00\x01\x00\x12\x00\x00\x00',
+    b'KBIN\x01\x00\x03\x00\x12\x00\x00\x00',
+    b'KBIN\x01\x00\x01\x00\x12\x00\x00\x00'
+])
+def test_invalid_file(tmp_path: pathlib.Path, contents: bytes) -> None:
+    path = tmp_path / 'problem.kbin'
+    path.write_bytes(contents)
+
+    with pytest.raises(BinaryFormatError):
+        import_binary_problem_file(str(path))
+
+def test_corrupted_section(tmp_path: pathlib.Path) -> None:
+    path = tmp_path / 'problem.kbin'
+    export_binary_problem_file(str(path), __build_problem())
+
+    # Point the last enrollment to an unknown course
+    contents = bytearray(path.read_bytes())
+    with BinaryProblemFile(str(path)) as f:
+        offset, count, _ = f._BinaryProblemFile__sections['enrollment_courses'] # type: ignore
+    contents[offset + (count - 1) * 4] = 0x7f
+    path.write_bytes(contents)
+
+    with pytest.raises(BinaryFormatError):
+        import_binary_problem_file(str(path))
+
+def __write_negative_index(path: pathlib.Path, table: str, index: int) -> None:
+    contents = bytearray(path.read_bytes())
+    with BinaryProblemFile(str(path)) as f:
+        offset, _, typecode = f._BinaryProblemFile__sections[table] # type: ignore
+
+    item_size = array(typecode).itemsize
+    contents[offset + index * item_size:offset + (index + 1) * item_size] = b'\xff' * item_size
+    path.write_bytes(contents)
+
+@pytest.mark.parametrize('table', [
+    'string_offsets', 'course_ids', 'shift_types', 'timeslot_days', 'course_shift_offsets'
+])
+def test_negative_catalog_index(tmp_path: pathlib.Path, table: str) -> None:
+    path = tmp_path / 'problem.kbin'
+    export_binary_problem_file(str(path), __build_problem())
+    __write_negative_index(path, table, 1)
+
+    with pytest.raises(BinaryFormatError):
+        import_binary_problem_file(str(path))
+
+@pytest.mark.parametrize('table', ['student_numbers', 'enrollment_courses', 'schedule_shifts'])
+def test_negative_student_index(tmp_path: pathlib.Path, table: str) -> None:
+    path = tmp_path / 'problem.kbin'
+    export_binary_problem_file(str(path), __build_problem())
+    __write_negative_index(path, table, 0)
+
+    with BinaryProblemFile(str(path)) as f:
+        with pytest.raises(BinaryFormatError):
+            f.read_student(0)
+
+    with pytest.raises(BinaryFormatError):
+        import_binary_problem_file(str(path))
+
+@pytest.mark.parametrize('table', ['solution_students', 'solution_offsets', 'solution_shifts'])
+def test_negative_solution_index(tmp_path: pathlib.Path, table: str) -> None:
+    path = tmp_path / 'solution.kbin'
+    export_binary_solution_file(str(path), __build_solution())
+    __write_negative_index(path, table, 1)
+
+    with pytest.raises(BinaryFormatError):
+        import_binary_solution_file(str(path))
+
+def test_missing_file(tmp_path: pathlib.Path) -> None:
+    with pytest.raises(BinaryFormatError):
+        import_binary_problem_file(str(tmp_path / 'missing.kbin'))
@@ -0,0 +1,67 @@
+import gzip
+import io
+import pathlib
+import pytest
+
+from kepler.io.compression import open_gzip_text_stream, open_text_file
+from kepler.io.exporter import export_json_problem_file, export_json_solution_file
+from kepler.io.importer import (
+    JsonImporterError,
+    import_json_columnar_problem_file,
+    import_json_problem_file
+)
+from kepler.types import *
+
+def __build_solution() -> SchedulingProblemSolution:
+    shift = Shift(ShiftType.T, 1, 120, [])
+    course = Course('J306N8', 3, [shift])
+    student = Student('A100', 3, [course], Schedule([]))
+
+    problem = SchedulingProblem([course], [student])
+    return SchedulingProblemSolution(problem, {'A100': Schedule([(course, shift)])})
+
+@pytest.mark.parametrize('name', ['file.json', 'file.json.gz'])
+def test_text_file_roundtrip(tmp_path: pathlib.Path, name: str) -> None:
+    path = str(tmp_path / name)
+    with open_text_file(path, 'w') as f:
+        f.write('{"á": 1}')
+
+    with open(path, mode='rb') as f:
+        assert (f.read(2) == b'\x1f\x8b') == name.endswith('.gz')
+    with open_text_file(path, 'r') as f:
+        assert f.read() == '{"á": 1}'
+
+def test_detect_by_magic(tmp_path: pathlib.Path) -> None:
+    path = tmp_path / 'file.json'
+    path.write_bytes(gzip.compress(b'[1, 2]'))
+
+    with open_text_file(str(path), 'r') as f:
+        assert f.read() == '[1, 2]'
+
+def test_gzip_text_stream() -> None:
+    stream = open_gzip_text_stream(io.BytesIO(gzip.compress('{"a": "ç"}'.encode('utf-8'))))
+    assert stream.read() == '{"a": "ç"}'
+
+@pytest.mark.parametrize('name', ['problem.json', 'problem.json.gz'])
+def test_problem_file(tmp_path: pathlib.Path, name: str) -> None:
+    problem = __build_solution().problem
+    path = str(tmp_path / name)
+
+    export_json_problem_file(path, problem)
+    assert import_json_problem_file(path) == problem
+    assert import_json_columnar_problem_file(path).to_problem() == problem
+
+def test_solution_file(tmp_path: pathlib.Path) -> None:
+    path = tmp_path / 'solution.json.gz'
+    export_json_solution_file(str(path), __build_solution())
+
+    assert gzip.decompress(path.read_bytes()) == \
+        b'{"A100": [{"course": "J306N8", "shift_type": "T", "shift_number": 1}]}'
+
+def test_truncated_problem_file(tmp_path: pathlib.Path) -> None:
+    path = tmp_path / 'problem.json.gz'
+    export_json_problem_file(str(path), __build_solution().problem)
+    path.write_bytes(path.read_bytes()[:-10])
+
+    with pytest.raises(JsonImporterError):
+        import_json_problem_file(str(path))
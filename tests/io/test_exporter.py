@@ -1,6 +1,12 @@
+import io
 import json
+import typing
 
-from kepler.io.exporter import export_json_solution_string
+from kepler.io.exporter import (
+    export_json_solution_object,
+    export_json_solution_stream,
+    export_json_solution_string
+)
 from kepler.types import *
 
 def test_success() -> None:
@@ -48,3 +54,48 @@ def test_success() -> None:
             }
         ]
     }
+
+def test_stream_deterministic() -> None:
+    shift1 = Shift(ShiftType.T, 1, 120, [])
+    shift2 = Shift(ShiftType.TP, 1, 40, [])
+    course1 = Course('J306N8', 3, [shift1, shift2])
+    course2 = Course('J306N1', 3, [shift1])
+
+    student1 = Student('A200', 3, [course1, course2], Schedule([]))
+    student2 = Student('A100', 3, [], Schedule([]))
+    problem = SchedulingProblem([course1, course2], [student1, student2])
+
+    schedule1 = Schedule([(course1, shift2), (course2, shift1), (course1, shift1)])
+    schedule2 = Schedule([(course1, shift1), (course1, shift2), (course2, shift1)])
+    solution1 = SchedulingProblemSolution(problem, {'A200': schedule1, 'A100': Schedule([])})
+    solution2 = SchedulingProblemSolution(problem, {'A100': Schedule([]), 'A200': schedule2})
+
+    stream = io.StringIO()
+    export_json_solution_stream(stream, solution1)
+    solution_json = stream.getvalue()
+
+    assert solution_json == export_json_solution_string(solution2)
+    assert solution_json == json.dumps(export_json_solution_object(solution2))
+    assert solution_json == (
+        '{"A100": [], "A200": ['
+        '{"course": "J306N1", "shift_type": "T", "shift_number": 1}, '
+        '{"course": "J306N8", "shift_type": "T", "shift_number": 1}, '
+        '{"course": "J306N8", "shift_type": "TP", "shift_number": 1}]}'
+    )
+
+def test_shared_schedules() -> None:
+    shift = Shift(ShiftType.T, 1, 120, [])
+    course = Course('J306N8', 3, [shift])
+    students = [Student(f'A{i}', 3, [course], Schedule([])) for i in range(3)]
+    problem = SchedulingProblem([course], students)
+
+    schedule1 = Schedule.interned([(course, shift)])
+    schedule2 = Schedule([(course, shift)])
+    solution = SchedulingProblemSolution(
+        problem, {'A0': schedule1, 'A1': schedule2, 'A2': schedule1}
+    )
+
+    solution_json = typing.cast(dict[str, object], export_json_solution_object(solution))
+    assert solution_json['A0'] == solution_json['A1'] == solution_json['A2']
+    assert solution_json['A0'] is not solution_json['A2']
+    assert json.loads(export_json_solution_string(solution)) == solution_json
@@ -1,6 +1,10 @@
 import pytest
 
-from kepler.io.importer import JsonImporterError, import_json_problem_string
+from kepler.io.importer import (
+    JsonImporterError,
+    import_json_columnar_problem_string,
+    import_json_problem_string
+)
 from kepler.types import *
 
 # Test for successful importation
@@ -57,6 +61,58 @@ def test_success() -> None:
     expected_problem = SchedulingProblem([course], [student])
     assert problem == expected_problem
 
+def test_success_columnar() -> None:
+    problem_json = '''
+        {
+            "courses": [
+                {
+                    "id": "C1",
+                    "year": 1,
+                    "shifts": [
+                        { "type": "T", "number": 1, "capacity": 100, "timeslots": [] },
+                        { "type": "T", "number": 2, "capacity": 100, "timeslots": [] }
+                    ]
+                }
+            ],
+            "students": [
+                {
+                    "number": "A100",
+                    "year": 1,
+                    "enrollments": [ "C1" ],
+                    "schedule": [ { "course": "C1", "shift_type": "T", "shift_number": 2 } ]
+                },
+                {
+                    "number": "A200",
+                    "year": 1,
+                    "enrollments": [ "C1" ]
+                }
+            ]
+        }
+        '''
+
+    problem = import_json_columnar_problem_string(problem_json)
+
+    assert problem.student_numbers == ['A100', 'A200']
+    assert list(problem.enrollment_courses) == [0, 0]
+    assert list(problem.schedule_offsets) == [0, 1, 1]
+    assert list(problem.schedule_shifts) == [1]
+    assert problem.to_problem() == import_json_problem_string(problem_json)
+
+def test_columnar_students_same_number() -> None:
+    with pytest.raises(JsonImporterError) as einfo:
+        import_json_columnar_problem_string('''
+            {
+                "courses": [],
+                "students": [
+                    { "number": "A100", "year": 1, "enrollments": [] },
+                    { "number": "A100", "year": 1, "enrollments": [] }
+                ]
+            }
+            ''')
+
+    assert str(einfo.value) == \
+        'Invalid scheduling problem: Students with the same number: A100'
+
 # Tests for schema errors
 
 def test_parse_error() -> None:
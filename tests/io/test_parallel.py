@@ -0,0 +1,103 @@
+import copy
+import io
+import json
+import pytest
+
+from kepler.io.importer import (
+    STUDENT_CHUNK_SIZE,
+    JsonImporterError,
+    import_json_problem_object,
+    import_json_problem_stream
+)
+from kepler.types import ShiftType
+
+def __build_problem_json(student_count: int) -> dict[str, list[dict[str, object]]]:
+    shifts_json: list[dict[str, object]] = [
+        { 'type': 'T', 'number': 1, 'capacity': 1000, 'timeslots': [] },
+        { 'type': 'PL', 'number': 1, 'capacity': 500, 'timeslots': [] },
+        { 'type': 'PL', 'number': 2, 'capacity': 500, 'timeslots': [] }
+    ]
+
+    students_json: list[dict[str, object]] = []
+    for i in range(student_count):
+        student_json: dict[str, object] = {
+            'number': f'A{i}',
+            'year': 1,
+            'enrollments': ['J301N1', 'J301N2'] if i % 2 else ['J301N2']
+        }
+
+        if i % 3 == 0:
+            student_json['schedule'] = [
+                { 'course': 'J301N2', 'shift_type': 'PL', 'shift_number': i % 2 + 1 }
+            ]
+
+        students_json.append(student_json)
+
+    return {
+        'courses': [
+            { 'id': 'J301N1', 'year': 1, 'shifts': [] },
+            { 'id': 'J301N2', 'year': 1, 'shifts': shifts_json }
+        ],
+        'students': students_json
+    }
+
+def test_parallel_object() -> None:
+    problem_json = __build_problem_json(2 * STUDENT_CHUNK_SIZE + 10)
+
+    problem = import_json_problem_object(problem_json, processes=2)
+    assert problem == import_json_problem_object(problem_json)
+    assert list(problem.students) == [f'A{i}' for i in range(2 * STUDENT_CHUNK_SIZE + 10)]
+
+    student = problem.students['A3']
+    assert student.enrollments['J301N2'] is problem.courses['J301N2']
+    assert student.previous_schedule.shifts['J301N2', ShiftType.PL] is \
+        problem.courses['J301N2'].shifts[ShiftType.PL][2]
+
+def test_parallel_stream() -> None:
+    problem_json = __build_problem_json(2 * STUDENT_CHUNK_SIZE + 10)
+    problem_string = json.dumps(problem_json)
+
+    problem = import_json_problem_stream(io.StringIO(problem_string), processes=2)
+    assert problem == import_json_problem_object(problem_json)
+
+def test_parallel_small_stream(monkeypatch: pytest.MonkeyPatch) -> None:
+    # Worker processes are not started for a single chunk of students
+    monkeypatch.setattr('kepler.io.importer.ProcessPoolExecutor', None)
+
+    problem_json = __build_problem_json(STUDENT_CHUNK_SIZE)
+    problem_string = json.dumps(problem_json)
+
+    problem = import_json_problem_stream(io.StringIO(problem_string), processes=2)
+    assert problem == import_json_problem_object(problem_json)
+
+@pytest.mark.parametrize('index,change', [
+    (STUDENT_CHUNK_SIZE + 5, {'enrollments': ['J301N3']}),
+    (STUDENT_CHUNK_SIZE * 2, {'year': 'first'}),
+    (3, {'schedule': [{ 'course': 'J301N2', 'shift_type': 'PL', 'shift_number': 3 }]}),
+    (STUDENT_CHUNK_SIZE + 1, {'number': 'A0'})
+])
+def test_parallel_same_errors(index: int, change: dict[str, object]) -> None:
+    problem_json = copy.deepcopy(__build_problem_json(2 * STUDENT_CHUNK_SIZE + 10))
+    problem_json['students'][index].update(change)
+    problem_json['students'][-1]['enrollments'] = ['J301N4']
+
+    with pytest.raises(JsonImporterError) as serial_einfo:
+        import_json_problem_object(problem_json)
+    with pytest.raises(JsonImporterError) as parallel_einfo:
+        import_json_problem_object(problem_json, processes=2)
+    with pytest.raises(JsonImporterError) as stream_einfo:
+        import_json_problem_stream(io.StringIO(json.dumps(problem_json)), processes=2)
+
+    assert str(parallel_einfo.value) == str(serial_einfo.value)
+    assert str(stream_einfo.value) == str(serial_einfo.value)
+
+def test_parallel_stream_truncated() -> None:
+    problem_json = __build_problem_json(2 * STUDENT_CHUNK_SIZE + 10)
+    problem_json['students'][STUDENT_CHUNK_SIZE - 1]['year'] = 0
+    problem_string = json.dumps(problem_json)[:-100]
+
+    with pytest.raises(JsonImporterError) as einfo:
+        import_json_problem_stream(io.StringIO(problem_string), processes=2)
+
+    number = f'A{STUDENT_CHUNK_SIZE - 1}'
+    assert str(einfo.value) == f'Invalid student {number}: Non-positive year 0 in student {number}'
@@ -0,0 +1,47 @@
+import pytest
+
+from kepler.io.schema import compile_bulk_validator
+
+def test_types() -> None:
+    validator = compile_bulk_validator(int)
+
+    assert validator([])
+    assert validator([1, 2, 3])
+    assert not validator([1, True])
+    assert not validator([1, 2.0])
+
+def test_union() -> None:
+    validator = compile_bulk_validator((type(None), [str]))
+
+    assert validator([None, [], ['a', 'b']])
+    assert not validator([None, [1]])
+    assert not validator(['a'])
+
+    with pytest.raises(ValueError):
+        compile_bulk_validator(([str], [int]))
+
+def test_arrays() -> None:
+    validator = compile_bulk_validator([[int]])
+
+    assert validator([[[]], [[1], [2, 3]]])
+    assert not validator([[[1], 2]])
+    assert not validator([[1]])
+
+def test_objects() -> None:
+    validator = compile_bulk_validator({
+        'number': str,
+        'enrollments': [str],
+        'schedule?': (type(None), [{'course': str, 'shift_number': int}])
+    })
+
+    assert validator([
+        {'number': 'A1', 'enrollments': []},
+        {'number': 'A2', 'enrollments': ['C1'], 'schedule': None, 'other': 1},
+        {'number': 'A3', 'enrollments': ['C1'], 'schedule': [{'course': 'C1', 'shift_number': 1}]}
+    ])
+
+    assert not validator([{'number': 'A1'}])
+    assert not validator([{'number': 1, 'enrollments': []}])
+    assert not validator([{'number': 'A1', 'enrollments': [1]}])
+    assert not validator([{'number': 'A1', 'enrollments': [], 'schedule': [{'course': 'C1'}]}])
+    assert not validator([['number', 'enrollments']])
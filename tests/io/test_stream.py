@@ -0,0 +1,140 @@
+import io
+import json
+import pytest
+
+from kepler.io.importer import (
+    JsonImporterError,
+    import_json_problem_stream,
+    import_json_problem_string
+)
+from kepler.io.stream import JsonStreamReader
+
+PROBLEM_JSON = '''
+    {
+        "version": [1, 2.5, true, null],
+        "courses": [
+            {
+                "id": "C1",
+                "year": 1,
+                "shifts": [
+                    {
+                        "type": "T",
+                        "number": 1,
+                        "capacity": 100,
+                        "timeslots": [ { "day": "monday", "start": "09:00", "end": "10:00" } ]
+                    },
+                    { "type": "PL", "number": 1, "capacity": 10, "timeslots": [] },
+                    { "type": "PL", "number": 2, "capacity": 10, "timeslots": [] }
+                ]
+            }
+        ],
+        "students": [
+            { "number": "A100", "year": 1, "enrollments": [ "C1" ] },
+            {
+                "number": "A200",
+                "year": 1,
+                "enrollments": [ "C1" ],
+                "schedule": [ { "course": "C1", "shift_type": "PL", "shift_number": 2 } ]
+            }
+        ]
+    }
+    '''
+
+@pytest.mark.parametrize('chunk_size', [1, 2, 7, 1 << 16])
+def test_reader_values(chunk_size: int) -> None:
+    reader = JsonStreamReader(io.StringIO(' 12 [1, "a\\"b", {"x": 1.5e3}] true  '), chunk_size)
+
+    assert reader.read_value() == 12
+    assert list(reader.read_array()) == [1, 'a"b', {'x': 1500.0}]
+    assert reader.read_value() is True
+    reader.expect_end()
+
+@pytest.mark.parametrize('chunk_size', [1, 3, 1 << 16])
+def test_reader_object(chunk_size: int) -> None:
+    reader = JsonStreamReader(io.StringIO('{"a": [1, 2], "b": {}, "c": []}'), chunk_size)
+
+    values: dict[str, object] = {}
+    for key in reader.read_object():
+        values[key] = reader.read_value()
+
+    assert values == {'a': [1, 2], 'b': {}, 'c': []}
+    reader.expect_end()
+
+def test_reader_empty_containers() -> None:
+    reader = JsonStreamReader(io.StringIO('{} []'))
+
+    assert list(reader.read_object()) == []
+    assert list(reader.read_array()) == []
+
+def test_reader_truncated() -> None:
+    reader = JsonStreamReader(io.StringIO('[1, 2'), 1)
+
+    with pytest.raises(json.JSONDecodeError):
+        list(reader.read_array())
+
+@pytest.mark.parametrize('chunk_size', [1, 2, 3])
+def test_reader_split_numbers(chunk_size: int) -> None:
+    reader = JsonStreamReader(io.StringIO('1.5e3 -2 [10.25, -1E-2] "\\u00e9" -Infinity'), chunk_size)
+
+    assert reader.read_value() == 1500.0
+    assert reader.read_value() == -2
+    assert reader.read_value() == [10.25, -0.01]
+    assert reader.read_value() == '\u00e9'
+    assert reader.read_value() == float('-inf')
+    reader.expect_end()
+
+def test_reader_malformed_before_end() -> None:
+    stream = io.StringIO('[1, x, ' + '2, ' * 100000 + '3]')
+    reader = JsonStreamReader(stream, 16)
+
+    with pytest.raises(json.JSONDecodeError):
+        list(reader.read_array())
+
+    # The error is raised without reading the rest of the document
+    assert stream.tell() <= 32
+
+def test_reader_extra_data() -> None:
+    reader = JsonStreamReader(io.StringIO('1 2'))
+    reader.read_value()
+
+    with pytest.raises(json.JSONDecodeError):
+        reader.expect_end()
+
+def test_reader_bad_key() -> None:
+    reader = JsonStreamReader(io.StringIO('{1: 2}'))
+
+    with pytest.raises(json.JSONDecodeError):
+        list(reader.read_object())
+
+def test_import_success() -> None:
+    problem = import_json_problem_stream(io.StringIO(PROBLEM_JSON))
+    assert problem == import_json_problem_string(PROBLEM_JSON)
+
+def test_import_students_before_courses() -> None:
+    problem_json = json.loads(PROBLEM_JSON)
+    reordered_json = json.dumps({
+        'students': problem_json['students'],
+        'courses': problem_json['courses']
+    })
+
+    problem = import_json_problem_stream(io.StringIO(reordered_json))
+    assert problem == import_json_problem_string(PROBLEM_JSON)
+
+@pytest.mark.parametrize('problem_json', [
+    '',
+    '[]',
+    '{}',
+    '{"courses": []}',
+    '{"courses": [], "students": {}}',
+    '{"courses": [], "students": [1]}',
+    '{"courses": [], "students": [{"number": "A1", "year": 1, "enrollments": ["C1"]}]}',
+    '{"courses": [], "students": []} 1'
+])
+def test_import_same_errors(problem_json: str) -> None:
+    with pytest.raises(JsonImporterError) as stream_einfo:
+        import_json_problem_stream(io.StringIO(problem_json))
+    with pytest.raises(JsonImporterError) as string_einfo:
+        import_json_problem_string(problem_json)
+
+    if 'Failed to parse' not in str(string_einfo.value):
+        assert str(stream_einfo.value) == str(string_einfo.value)
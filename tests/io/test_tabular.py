@@ -0,0 +1,175 @@
+import io
+import json
+import pathlib
+import pytest
+
+from kepler.io.importer import (
+    JsonImporterError,
+    import_csv_catalog_stream,
+    import_csv_problem_file,
+    import_csv_students_stream,
+    import_json_catalog_object,
+    import_json_catalog_stream,
+    import_json_problem_string,
+    import_json_students_object,
+    import_ndjson_problem_file,
+    import_ndjson_students_stream
+)
+from kepler.types import *
+
+CATALOG_JSON = '''
+    [
+        {
+            "id": "J301N1",
+            "year": 1,
+            "shifts": [
+                {
+                    "type": "T",
+                    "number": 1,
+                    "capacity": 100,
+                    "timeslots": [
+                        { "day": "monday", "start": "09:00", "end": "10:00" },
+                        { "day": "friday", "start": "14:00", "end": "15:30" }
+                    ]
+                },
+                { "type": "PL", "number": 1, "capacity": 10, "timeslots": [] },
+                { "type": "PL", "number": 2, "capacity": 10, "timeslots": [] }
+            ]
+        },
+        { "id": "J301N2", "year": 1, "shifts": [] }
+    ]
+    '''
+
+CATALOG_CSV = '''course,year,shift_type,shift_number,capacity,timeslots
+J301N1,1,T,1,100,monday 09:00-10:00; friday 14:00 - 15:30
+J301N1,1,PL,1,10,
+J301N2,1,,,,
+J301N1,1,PL,2,10,
+'''
+
+STUDENTS_NDJSON = (
+    '{"number": "A100", "year": 1, "enrollments": ["J301N1", "J301N2"]}\n'
+    '\n'
+    '{"number": "A200", "year": 1, "enrollments": ["J301N1"], "schedule": '
+    '[{"course": "J301N1", "shift_type": "PL", "shift_number": 2}]}\n'
+)
+
+STUDENTS_CSV = '''number,year,enrollments,schedule
+A100,1,J301N1; J301N2,
+A200,1,J301N1,J301N1:PL2
+'''
+
+PROBLEM_JSON = f'''
+    {{
+        "courses": {CATALOG_JSON},
+        "students": [
+            {{ "number": "A100", "year": 1, "enrollments": [ "J301N1", "J301N2" ] }},
+            {{
+                "number": "A200",
+                "year": 1,
+                "enrollments": [ "J301N1" ],
+                "schedule": [ {{ "course": "J301N1", "shift_type": "PL", "shift_number": 2 }} ]
+            }}
+        ]
+    }}
+    '''
+
+def __courses_dict(courses: list[Course]) -> dict[str, Course]:
+    return {course.id: course for course in courses}
+
+def test_catalogs() -> None:
+    json_courses = import_json_catalog_stream(io.StringIO(CATALOG_JSON))
+    csv_courses = import_csv_catalog_stream(io.StringIO(CATALOG_CSV))
+    object_courses = import_json_catalog_stream(io.StringIO(f'{{"courses": {CATALOG_JSON}}}'))
+
+    expected_courses = list(import_json_problem_string(PROBLEM_JSON).courses.values())
+    assert json_courses == expected_courses
+    assert csv_courses == expected_courses
+    assert object_courses == expected_courses
+
+def test_ndjson_students() -> None:
+    courses = __courses_dict(import_json_catalog_stream(io.StringIO(CATALOG_JSON)))
+    students = list(import_ndjson_students_stream(io.StringIO(STUDENTS_NDJSON), courses))
+
+    assert students == list(import_json_problem_string(PROBLEM_JSON).students.values())
+    assert students[0].enrollments['J301N1'] is courses['J301N1']
+
+def test_csv_students() -> None:
+    courses = __courses_dict(import_json_catalog_stream(io.StringIO(CATALOG_JSON)))
+    students = list(import_csv_students_stream(io.StringIO(STUDENTS_CSV), courses))
+
+    assert students == list(import_json_problem_string(PROBLEM_JSON).students.values())
+
+def test_json_students_object() -> None:
+    problem_json = json.loads(PROBLEM_JSON)
+    courses = __courses_dict(import_json_catalog_object(problem_json))
+    students = import_json_students_object(problem_json['students'], courses)
+
+    assert students == list(import_json_problem_string(PROBLEM_JSON).students.values())
+    assert students[0].enrollments['J301N1'] is courses['J301N1']
+
+def test_problem_files(tmp_path: pathlib.Path) -> None:
+    (tmp_path / 'catalog.json').write_text(CATALOG_JSON)
+    (tmp_path / 'catalog.csv').write_text(CATALOG_CSV)
+    (tmp_path / 'students.ndjson').write_text(STUDENTS_NDJSON)
+    (tmp_path / 'students.csv').write_text(STUDENTS_CSV)
+
+    problem = import_json_problem_string(PROBLEM_JSON)
+    assert import_ndjson_problem_file(
+        str(tmp_path / 'catalog.json'), str(tmp_path / 'students.ndjson')
+    ) == problem
+    assert import_csv_problem_file(
+        str(tmp_path / 'catalog.csv'), str(tmp_path / 'students.csv')
+    ) == problem
+
+@pytest.mark.parametrize('students_ndjson,students_csv', [
+    (
+        '{"number": "A300", "year": 1, "enrollments": ["J301N3"]}',
+        'number,year,enrollments\nA300,1,J301N3'
+    ),
+    (
+        '{"number": "A300", "year": 1, "enrollments": ["J301N1"], "schedule": '
+        '[{"course": "J301N1", "shift_type": "PL", "shift_number": 3}]}',
+        'number,year,enrollments,schedule\nA300,1,J301N1,J301N1:PL3'
+    ),
+    (
+        '{"number": "A300", "year": 0, "enrollments": []}',
+        'number,year,enrollments\nA300,0,'
+    )
+])
+def test_same_errors_as_json(students_ndjson: str, students_csv: str) -> None:
+    courses = __courses_dict(import_json_catalog_stream(io.StringIO(CATALOG_JSON)))
+
+    with pytest.raises(JsonImporterError) as ndjson_einfo:
+        list(import_ndjson_students_stream(io.StringIO(students_ndjson), courses))
+    with pytest.raises(JsonImporterError) as csv_einfo:
+        list(import_csv_students_stream(io.StringIO(students_csv), courses))
+
+    assert str(ndjson_einfo.value) == str(csv_einfo.value)
+
+@pytest.mark.parametrize('students_csv,message', [
+    ('number,enrollments\nA300,', 'Missing the following necessary columns in CSV stream: year'),
+    ('number,year,enrollments\nA300,x,', 'Expected number (integer) for student year in line 2, '
+                                         'got "x" instead'),
+    ('number,year,enrollments,schedule\nA300,1,J301N1,PL2', 'Invalid schedule shift "PL2" in '
+                                                            'line 2')
+])
+def test_csv_errors(students_csv: str, message: str) -> None:
+    courses = __courses_dict(import_json_catalog_stream(io.StringIO(CATALOG_JSON)))
+
+    with pytest.raises(JsonImporterError) as einfo:
+        list(import_csv_students_stream(io.StringIO(students_csv), courses))
+
+    assert str(einfo.value) == message
+
+def test_csv_catalog_different_years() -> None:
+    with pytest.raises(JsonImporterError) as einfo:
+        import_csv_catalog_stream(io.StringIO(CATALOG_CSV + 'J301N2,2,,,,\n'))
+
+    assert str(einfo.value) == 'Different years for course J301N2 in line 6'
+
+def test_ndjson_bad_line() -> None:
+    with pytest.raises(JsonImporterError) as einfo:
+        list(import_ndjson_students_stream(io.StringIO('\n{'), {}))
+
+    assert str(einfo.value).startswith('Failed to parse JSON in line 2 of stream')
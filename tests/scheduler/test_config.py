@@ -13,8 +13,7 @@ def __calculate_schedule_overlap_weight(
     course1 = Course('C1', course1_year, [shift])
     course2 = Course('C2', course2_year, [shift])
 
-    student = Student('A100', student_year, [course1, course2], Schedule([]))
-    return calculate_schedule_overlap_weight(student, course1, shift, course2, shift)
+    return calculate_schedule_overlap_weight(student_year, course1, shift, course2, shift)
 
 def test_calculate_schedule_overlap_weight_same_year() -> None:
     assert __calculate_schedule_overlap_weight(3, 3, 3) == 10000.0
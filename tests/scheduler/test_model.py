@@ -281,3 +281,42 @@ def test_no_solution_found() -> None:
 
     with pytest.raises(SchedulingProblemModelError):
         model.solve()
+
+def test_columnar_same_model() -> None:
+    timeslot = Timeslot(Weekday.MONDAY, ScheduleTime(9, 0), ScheduleTime(11, 0))
+    shift1 = Shift(ShiftType.T, 1, 10, [timeslot])
+    shift2 = Shift(ShiftType.T, 2, 10, [])
+    shift3 = Shift(ShiftType.TP, 1, 10, [timeslot])
+    shift4 = Shift(ShiftType.TP, 2, 10, [])
+    course1 = Course('J301N1', 1, [shift1, shift2, shift3, shift4])
+
+    shift5 = Shift(ShiftType.PL, 1, 1, [timeslot])
+    course2 = Course('J301N2', 1, [shift5])
+
+    student1 = Student('A100', 1, [course1, course2], Schedule([]))
+    student2 = Student('A200', 1, [course1], Schedule([(course1, shift3)]))
+
+    problem = SchedulingProblem([course1, course2], [student1, student2])
+    columnar_problem = ColumnarSchedulingProblem.from_problem(problem)
+
+    model = SchedulingProblemModel(problem)
+    columnar_model = SchedulingProblemModel(columnar_problem)
+
+    assert __decompose_model(columnar_model) == __decompose_model(model)
+
+def test_columnar_solve() -> None:
+    shift = Shift(ShiftType.TP, 1, 10, [])
+    course = Course('J301N1', 1, [shift])
+
+    student = Student('A100', 1, [course], Schedule([]))
+
+    problem = SchedulingProblem([course], [student])
+    columnar_problem = ColumnarSchedulingProblem.from_problem(problem)
+    model = SchedulingProblemModel(columnar_problem)
+
+    solution = model.solve()
+    assert solution.columnar_problem is columnar_problem
+    assert solution.problem == problem
+    assert solution.final_schedules == {
+        'A100': Schedule([(course, shift)])
+    }
@@ -0,0 +1,63 @@
+from kepler.scheduler.progress import SolverProgress
+
+def test_branch_and_bound() -> None:
+    progress = SolverProgress()
+    assert progress.incumbent_objective is None
+    assert progress.best_bound is None
+    assert progress.gap is None
+
+    assert progress.update('Continuous objective value is 9000 - 0.01 seconds')
+    assert progress.incumbent_objective is None
+    assert progress.best_bound == 9000.0
+    assert progress.gap is None
+
+    assert progress.update(
+        'Cbc0012I Integer solution of 10000 found by DiveCoefficient after 20 iterations and 0 '
+        'nodes (0.10 seconds)'
+    )
+    assert progress.incumbent_objective == 10000.0
+    assert progress.gap == 0.1
+
+    assert progress.update(
+        'Cbc0010I After 100 nodes, 12 on tree, 10000 best solution, best possible 9500 '
+        '(1.23 seconds)'
+    )
+    assert progress.best_bound == 9500.0
+    assert progress.gap == 0.05
+
+    assert not progress.update('Cbc0038I Full problem 7 rows 8 columns, reduced to 0 rows 0 columns')
+
+    assert progress.update(
+        'Cbc0001I Search completed - best objective 9800, took 200 iterations and 150 nodes '
+        '(2.00 seconds)'
+    )
+    assert progress.incumbent_objective == 9800.0
+    assert progress.best_bound == 9800.0
+    assert progress.gap == 0.0
+
+def test_no_solution_yet() -> None:
+    progress = SolverProgress()
+
+    assert progress.update(
+        'Cbc0010I After 100 nodes, 50 on tree, 1e+50 best solution, best possible 9500 '
+        '(1.23 seconds)'
+    )
+    assert progress.incumbent_objective is None
+    assert progress.best_bound == 9500.0
+
+def test_partial_search() -> None:
+    progress = SolverProgress()
+
+    assert progress.update(
+        'Cbc0005I Partial search - best objective 10500 (best possible 9500), took 1000 '
+        'iterations and 500 nodes (300.00 seconds)'
+    )
+    assert progress.incumbent_objective == 10500.0
+    assert progress.best_bound == 9500.0
+
+def test_final_objective() -> None:
+    progress = SolverProgress()
+
+    assert progress.update('Objective value:                10001.00000000')
+    assert progress.incumbent_objective == 10001.0
+    assert not progress.update('Objective value:                10001.00000000')
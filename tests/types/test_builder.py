@@ -0,0 +1,147 @@
+import pytest
+
+from kepler.types.builder import ProblemBuilder, ProblemBuilderError
+from kepler.types.course import Course
+from kepler.types.problem import SchedulingProblem
+from kepler.types.schedule import Schedule
+from kepler.types.shift import Shift, ShiftType
+from kepler.types.student import Student
+from kepler.types.time import ScheduleTime
+from kepler.types.timeslot import Timeslot
+from kepler.types.weekday import Weekday
+
+def __build_valid_builder() -> ProblemBuilder:
+    timeslot = Timeslot(Weekday.MONDAY, ScheduleTime(9, 0), ScheduleTime(10, 0))
+
+    builder = ProblemBuilder()
+    builder.add_course('J301N1', 1)
+    builder.add_course('J301N2', 1)
+    builder.add_shift('J301N1', ShiftType.T, 1, 100, [timeslot])
+    builder.add_shift('J301N1', ShiftType.PL, 1, 30, [])
+    builder.add_shift('J301N1', ShiftType.PL, 2, 30, [])
+    builder.add_student('A100', 1, ['J301N1', 'J301N2'], [('J301N1', ShiftType.PL, 2)])
+    builder.add_student('A200', 1, ['J301N1'])
+    return builder
+
+def test_build_empty() -> None:
+    assert ProblemBuilder().build() == SchedulingProblem([], [])
+
+def test_build_valid() -> None:
+    timeslot = Timeslot(Weekday.MONDAY, ScheduleTime(9, 0), ScheduleTime(10, 0))
+    shift1 = Shift(ShiftType.T, 1, 100, [timeslot])
+    shift2 = Shift(ShiftType.PL, 1, 30, [])
+    shift3 = Shift(ShiftType.PL, 2, 30, [])
+    course1 = Course('J301N1', 1, [shift1, shift2, shift3])
+    course2 = Course('J301N2', 1, [])
+
+    student1 = Student('A100', 1, [course1, course2], Schedule([(course1, shift3)]))
+    student2 = Student('A200', 1, [course1], Schedule([]))
+
+    problem = __build_valid_builder().build()
+    assert problem == SchedulingProblem([course1, course2], [student1, student2])
+
+    built_course1 = problem.courses['J301N1']
+    built_student1 = problem.students['A100']
+    assert built_student1.enrollments['J301N1'] is built_course1
+    assert built_student1.previous_schedule.shifts['J301N1', ShiftType.PL] is \
+        built_course1.shifts[ShiftType.PL][2]
+
+def test_build_repeated_courses() -> None:
+    builder = __build_valid_builder()
+    builder.add_course('J301N1', 1)
+
+    with pytest.raises(ProblemBuilderError) as einfo:
+        builder.build()
+
+    assert str(einfo.value) == 'Courses with the same id: J301N1'
+
+def test_build_course_non_positive_year() -> None:
+    builder = __build_valid_builder()
+    builder.add_course('J301N3', 0)
+
+    with pytest.raises(ProblemBuilderError) as einfo:
+        builder.build()
+
+    assert str(einfo.value) == 'Non-positive year 0 in course J301N3'
+
+def test_build_repeated_shifts() -> None:
+    builder = __build_valid_builder()
+    builder.add_shift('J301N1', ShiftType.PL, 2, 30, [])
+
+    with pytest.raises(ProblemBuilderError) as einfo:
+        builder.build()
+
+    assert str(einfo.value) == 'Shifts with the same name (PL2) in course J301N1'
+
+def test_build_shift_unknown_course() -> None:
+    builder = __build_valid_builder()
+    builder.add_shift('J301N3', ShiftType.PL, 1, 30, [])
+
+    with pytest.raises(ProblemBuilderError):
+        builder.build()
+
+def test_build_shift_non_positive_capacity() -> None:
+    builder = __build_valid_builder()
+    builder.add_shift('J301N2', ShiftType.PL, 1, 0, [])
+
+    with pytest.raises(ProblemBuilderError):
+        builder.build()
+
+def test_build_shift_overlapping_timeslots() -> None:
+    timeslot1 = Timeslot(Weekday.MONDAY, ScheduleTime(9, 0), ScheduleTime(11, 0))
+    timeslot2 = Timeslot(Weekday.MONDAY, ScheduleTime(10, 0), ScheduleTime(12, 0))
+    timeslot3 = Timeslot(Weekday.MONDAY, ScheduleTime(8, 0), ScheduleTime(9, 0))
+
+    builder = __build_valid_builder()
+    builder.add_shift('J301N2', ShiftType.PL, 1, 30, [timeslot2, timeslot3, timeslot1])
+
+    with pytest.raises(ProblemBuilderError):
+        builder.build()
+
+def test_build_repeated_students() -> None:
+    builder = __build_valid_builder()
+    builder.add_student('A100', 1, [])
+
+    with pytest.raises(ProblemBuilderError) as einfo:
+        builder.build()
+
+    assert str(einfo.value) == 'Students with the same number: A100'
+
+def test_build_unknown_enrollment() -> None:
+    builder = __build_valid_builder()
+    builder.add_student('A300', 1, ['J301N3'])
+
+    with pytest.raises(ProblemBuilderError):
+        builder.build()
+
+def test_build_repeated_enrollment() -> None:
+    builder = __build_valid_builder()
+    builder.add_student('A300', 1, ['J301N1', 'J301N1'])
+
+    with pytest.raises(ProblemBuilderError):
+        builder.build()
+
+def test_build_unknown_schedule_shift() -> None:
+    builder = __build_valid_builder()
+    builder.add_student('A300', 1, ['J301N1'], [('J301N1', ShiftType.PL, 3)])
+
+    with pytest.raises(ProblemBuilderError):
+        builder.build()
+
+def test_build_schedule_repeated_shift_type() -> None:
+    builder = __build_valid_builder()
+    builder.add_student(
+        'A300', 1, ['J301N1'], [('J301N1', ShiftType.PL, 1), ('J301N1', ShiftType.PL, 2)]
+    )
+
+    with pytest.raises(ProblemBuilderError):
+        builder.build()
+
+def test_build_schedule_not_enrolled() -> None:
+    builder = __build_valid_builder()
+    builder.add_student('A300', 1, ['J301N2'], [('J301N1', ShiftType.PL, 1)])
+
+    with pytest.raises(ProblemBuilderError) as einfo:
+        builder.build()
+
+    assert str(einfo.value) == 'Student A300\'s schedule is not valid for them'
@@ -0,0 +1,92 @@
+import copy
+import pickle
+import pytest
+
+from kepler.types.catalog import Catalog, CatalogError
+from kepler.types.course import Course
+from kepler.types.problem import SchedulingProblem
+from kepler.types.schedule import Schedule
+from kepler.types.shift import Shift, ShiftType
+from kepler.types.student import Student
+from kepler.types.time import ScheduleTime
+from kepler.types.timeslot import Timeslot
+from kepler.types.weekday import Weekday
+
+def __timeslot(day: Weekday, start: int, end: int) -> Timeslot:
+    return Timeslot(day, ScheduleTime(start, 0), ScheduleTime(end, 0))
+
+def __courses() -> list[Course]:
+    monday_morning = __timeslot(Weekday.MONDAY, 9, 11)
+    monday_late_morning = __timeslot(Weekday.MONDAY, 10, 12)
+    monday_noon = __timeslot(Weekday.MONDAY, 11, 13)
+    tuesday_morning = __timeslot(Weekday.TUESDAY, 9, 11)
+
+    course1 = Course('J301N1', 1, [
+        Shift(ShiftType.T, 1, 100, [monday_morning]),
+        Shift(ShiftType.PL, 1, 30, [monday_late_morning]),
+        Shift(ShiftType.PL, 2, 30, [monday_morning, tuesday_morning])
+    ])
+    course2 = Course('J301N2', 1, [
+        Shift(ShiftType.T, 1, 100, [monday_noon, tuesday_morning])
+    ])
+
+    return [course1, course2]
+
+def test_init_repeated_courses() -> None:
+    with pytest.raises(CatalogError):
+        Catalog([Course('J301N1', 1, []), Course('J301N1', 1, [])])
+
+def test_list_shifts() -> None:
+    courses = __courses()
+    catalog = Catalog(courses)
+
+    assert catalog.courses == {'J301N1': courses[0], 'J301N2': courses[1]}
+    assert [(course.id, shift.name) for course, shift in catalog.list_shifts()] == [
+        ('J301N1', 'T1'), ('J301N1', 'PL1'), ('J301N1', 'PL2'), ('J301N2', 'T1')
+    ]
+    assert catalog.index_shifts()[courses[1], courses[1].shifts[ShiftType.T][1]] == 3
+
+def test_list_conflicting_shifts() -> None:
+    catalog = Catalog(__courses())
+
+    # Shifts of the same course and type are alternatives, even when they overlap
+    assert catalog.list_conflicting_shifts() == [
+        {1, 2},
+        {0, 3},
+        {0, 3},
+        {1, 2}
+    ]
+
+def test_conflicting_shifts_match_overlaps() -> None:
+    catalog = Catalog(__courses())
+    shifts = catalog.list_shifts()
+
+    for i, (course1, shift1) in enumerate(shifts):
+        for j, (course2, shift2) in enumerate(shifts):
+            alternatives = course1.id == course2.id and shift1.type == shift2.type
+            expected = i != j and not alternatives and shift1.overlaps(shift2)
+            assert (j in catalog.list_conflicting_shifts()[i]) == expected
+
+def test_problem_catalog() -> None:
+    catalog = Catalog(__courses())
+    course = catalog.courses['J301N1']
+    student = Student('A100', 1, [course], Schedule([]))
+
+    problem = SchedulingProblem(catalog, [student])
+    assert problem.catalog is catalog
+    assert problem.courses == catalog.courses
+    assert problem.list_conflicting_shifts() is catalog.list_conflicting_shifts()
+
+def test_pickle() -> None:
+    catalog = Catalog(__courses())
+    catalog.list_conflicting_shifts()
+
+    unpickled_catalog = pickle.loads(pickle.dumps(catalog))
+    assert repr(unpickled_catalog) == repr(catalog)
+    assert unpickled_catalog.list_conflicting_shifts() == catalog.list_conflicting_shifts()
+
+def test_copy() -> None:
+    original_catalog = Catalog([])
+    copied_catalog = copy.copy(original_catalog)
+
+    assert copied_catalog is original_catalog
@@ -0,0 +1,171 @@
+import copy
+import pytest
+
+from kepler.types.columnar import ColumnarSchedulingProblem, ColumnarSchedulingProblemError
+from kepler.types.course import Course
+from kepler.types.problem import SchedulingProblem
+from kepler.types.schedule import Schedule
+from kepler.types.shift import Shift, ShiftType
+from kepler.types.student import Student
+
+def __build_problem() -> SchedulingProblem:
+    shift1 = Shift(ShiftType.T, 1, 100, [])
+    shift2 = Shift(ShiftType.PL, 1, 30, [])
+    shift3 = Shift(ShiftType.PL, 2, 30, [])
+    course1 = Course('J305N1', 3, [shift3, shift2, shift1])
+
+    shift4 = Shift(ShiftType.TP, 1, 50, [])
+    shift5 = Shift(ShiftType.TP, 2, 50, [])
+    course2 = Course('J305N2', 3, [shift4, shift5])
+
+    student1 = Student('A100', 3, [course1], Schedule([(course1, shift2)]))
+    student2 = Student('A200', 2, [course1, course2], Schedule([]))
+
+    return SchedulingProblem([course1, course2], [student1, student2])
+
+def test_init_empty() -> None:
+    problem = ColumnarSchedulingProblem([], [], [], [0], [], [0], [])
+
+    assert problem.courses == []
+    assert problem.shifts == []
+    assert problem.student_numbers == []
+
+def test_shift_table() -> None:
+    problem = ColumnarSchedulingProblem.from_problem(__build_problem())
+
+    assert [(course.id, shift.name) for course, shift in problem.shifts] == [
+        ('J305N1', 'T1'),
+        ('J305N1', 'PL1'),
+        ('J305N1', 'PL2'),
+        ('J305N2', 'TP1'),
+        ('J305N2', 'TP2')
+    ]
+    assert list(problem.shift_courses) == [0, 0, 0, 1, 1]
+    assert list(problem.shift_groups) == [0, 1, 1, 2, 2]
+    assert list(problem.group_offsets) == [0, 1, 3, 5]
+    assert list(problem.course_group_offsets) == [0, 2, 3]
+
+def test_index_shifts() -> None:
+    problem = __build_problem()
+
+    assert ColumnarSchedulingProblem.index_shifts(problem.courses.values()) == {
+        ('J305N1', ShiftType.T, 1): 0,
+        ('J305N1', ShiftType.PL, 1): 1,
+        ('J305N1', ShiftType.PL, 2): 2,
+        ('J305N2', ShiftType.TP, 1): 3,
+        ('J305N2', ShiftType.TP, 2): 4
+    }
+
+def test_from_problem() -> None:
+    problem = ColumnarSchedulingProblem.from_problem(__build_problem())
+
+    assert problem.student_numbers == ['A100', 'A200']
+    assert list(problem.student_years) == [3, 2]
+    assert list(problem.enrollment_offsets) == [0, 1, 3]
+    assert list(problem.enrollment_courses) == [0, 0, 1]
+    assert list(problem.schedule_offsets) == [0, 1, 1]
+    assert list(problem.schedule_shifts) == [1]
+
+def test_to_problem() -> None:
+    original_problem = __build_problem()
+    problem = ColumnarSchedulingProblem.from_problem(original_problem).to_problem()
+
+    assert problem == original_problem
+    assert problem.courses['J305N1'] is original_problem.courses['J305N1']
+
+    for number, student in problem.students.items():
+        original_student = original_problem.students[number]
+
+        assert student.year == original_student.year
+        assert student.enrollments == original_student.enrollments
+        assert student.previous_schedule == original_student.previous_schedule
+
+def test_digest() -> None:
+    original_problem = __build_problem()
+    courses = list(original_problem.courses.values())
+
+    # Students out of order, with their enrollments and schedules out of order too
+    problem = ColumnarSchedulingProblem(
+        courses, ['A200', 'A100'], [2, 3], [0, 2, 3], [1, 0, 0], [0, 2, 3], [4, 2, 1]
+    )
+    assert problem.digest == problem.to_problem().digest
+    assert problem.digest is problem.digest
+
+    assert ColumnarSchedulingProblem.from_problem(original_problem).digest == \
+        original_problem.digest
+
+def test_list_possible_shifts_adjacency() -> None:
+    problem = ColumnarSchedulingProblem.from_problem(__build_problem())
+    possible_offsets, possible_shifts, possible_assigned = problem.list_possible_shifts_adjacency()
+
+    assert list(possible_offsets) == [0, 2, 7]
+    assert list(possible_shifts) == [0, 1, 0, 1, 2, 3, 4]
+    assert list(possible_assigned) == [1, 1, 1, 0, 0, 0, 0]
+
+    assert problem.list_possible_shifts_adjacency()[0] is possible_offsets
+
+def test_init_repeated_courses() -> None:
+    course1 = Course('J301N1', 1, [])
+    course2 = Course('J301N1', 1, [])
+
+    with pytest.raises(ColumnarSchedulingProblemError):
+        ColumnarSchedulingProblem([course1, course2], [], [], [0], [], [0], [])
+
+def test_init_repeated_students() -> None:
+    with pytest.raises(ColumnarSchedulingProblemError):
+        ColumnarSchedulingProblem([], ['A100', 'A100'], [1, 1], [0, 0, 0], [], [0, 0, 0], [])
+
+def test_init_non_positive_year() -> None:
+    with pytest.raises(ColumnarSchedulingProblemError):
+        ColumnarSchedulingProblem([], ['A100'], [0], [0, 0], [], [0, 0], [])
+
+def test_init_different_lengths() -> None:
+    with pytest.raises(ColumnarSchedulingProblemError):
+        ColumnarSchedulingProblem([], ['A100'], [1, 2], [0, 0], [], [0, 0], [])
+
+def test_init_bad_offsets() -> None:
+    course = Course('J301N1', 1, [])
+
+    with pytest.raises(ColumnarSchedulingProblemError):
+        ColumnarSchedulingProblem([course], ['A100'], [1], [0, 2], [0], [0, 0], [])
+
+def test_init_unknown_course() -> None:
+    with pytest.raises(ColumnarSchedulingProblemError):
+        ColumnarSchedulingProblem([], ['A100'], [1], [0, 1], [0], [0, 0], [])
+
+def test_init_repeated_enrollment() -> None:
+    course = Course('J301N1', 1, [])
+
+    with pytest.raises(ColumnarSchedulingProblemError):
+        ColumnarSchedulingProblem([course], ['A100'], [1], [0, 2], [0, 0], [0, 0], [])
+
+def test_init_unknown_shift() -> None:
+    course = Course('J301N1', 1, [])
+
+    with pytest.raises(ColumnarSchedulingProblemError):
+        ColumnarSchedulingProblem([course], ['A100'], [1], [0, 1], [0], [0, 1], [0])
+
+def test_init_schedule_not_enrolled() -> None:
+    shift = Shift(ShiftType.T, 1, 100, [])
+    course = Course('J301N1', 1, [shift])
+
+    with pytest.raises(ColumnarSchedulingProblemError):
+        ColumnarSchedulingProblem([course], ['A100'], [1], [0, 0], [], [0, 1], [0])
+
+def test_init_schedule_repeated_shift_type() -> None:
+    shift1 = Shift(ShiftType.T, 1, 100, [])
+    shift2 = Shift(ShiftType.T, 2, 100, [])
+    course = Course('J301N1', 1, [shift1, shift2])
+
+    with pytest.raises(ColumnarSchedulingProblemError):
+        ColumnarSchedulingProblem([course], ['A100'], [1], [0, 1], [0], [0, 2], [0, 1])
+
+def test_copy() -> None:
+    original_problem = ColumnarSchedulingProblem([], [], [], [0], [], [0], [])
+    copied_problem = copy.copy(original_problem)
+
+    assert copied_problem is original_problem
+
+def test_repr() -> None:
+    problem = ColumnarSchedulingProblem.from_problem(__build_problem())
+    assert repr(problem) == 'ColumnarSchedulingProblem(courses=2, shifts=5, students=2)'
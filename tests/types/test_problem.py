@@ -1,4 +1,5 @@
 import copy
+import pickle
 import pytest
 
 from kepler.types.course import Course
@@ -6,6 +7,9 @@ from kepler.types.problem import SchedulingProblem, SchedulingProblemError
 from kepler.types.shift import Shift, ShiftType
 from kepler.types.schedule import Schedule
 from kepler.types.student import Student
+from kepler.types.time import ScheduleTime
+from kepler.types.timeslot import Timeslot
+from kepler.types.weekday import Weekday
 
 def test_init_empty() -> None:
     problem = SchedulingProblem([], [])
@@ -76,6 +80,87 @@ def test_list_possible_students_by_shift() -> None:
         ('J305N2', ShiftType.TP, 1): set(),
     }
 
+def test_list_possible_students_by_shift_cached() -> None:
+    shift = Shift(ShiftType.T, 1, 100, [])
+    course = Course('J305N1', 3, [shift])
+    student = Student('A100', 3, [course], Schedule([]))
+    problem = SchedulingProblem([course], [student])
+
+    assert problem.list_possible_students_by_shift() is problem.list_possible_students_by_shift()
+
+def test_list_assigned_students_by_shift() -> None:
+    shift1 = Shift(ShiftType.T, 1, 100, [])
+    shift2 = Shift(ShiftType.PL, 1, 30, [])
+    shift3 = Shift(ShiftType.PL, 2, 30, [])
+    course = Course('J305N1', 3, [shift1, shift2, shift3])
+
+    student1 = Student('A100', 3, [course], Schedule([(course, shift2)]))
+    student2 = Student('A200', 3, [course], Schedule([]))
+
+    problem = SchedulingProblem([course], [student1, student2])
+
+    assigned_students = problem.list_assigned_students_by_shift()
+    assert assigned_students == {
+        ('J305N1', ShiftType.T, 1): {student1, student2},
+        ('J305N1', ShiftType.PL, 1): {student1},
+        ('J305N1', ShiftType.PL, 2): set(),
+    }
+
+def test_list_unassignable_students_by_shift() -> None:
+    shift1 = Shift(ShiftType.T, 1, 100, [])
+    shift2 = Shift(ShiftType.PL, 1, 30, [])
+    shift3 = Shift(ShiftType.PL, 2, 30, [])
+    course = Course('J305N1', 3, [shift1, shift2, shift3])
+
+    student1 = Student('A100', 3, [course], Schedule([(course, shift2)]))
+    student2 = Student('A200', 3, [course], Schedule([]))
+
+    problem = SchedulingProblem([course], [student1, student2])
+
+    unassignable_students = problem.list_unassignable_students_by_shift()
+    assert unassignable_students == {
+        ('J305N1', ShiftType.T, 1): set(),
+        ('J305N1', ShiftType.PL, 1): set(),
+        ('J305N1', ShiftType.PL, 2): {student1},
+    }
+
+def test_list_students_by_course() -> None:
+    course1 = Course('J305N1', 3, [])
+    course2 = Course('J305N2', 3, [])
+    course3 = Course('J305N3', 3, [])
+
+    student1 = Student('A100', 3, [course1, course2], Schedule([]))
+    student2 = Student('A200', 3, [course1], Schedule([]))
+
+    problem = SchedulingProblem([course1, course2, course3], [student1, student2])
+
+    assert problem.list_students_by_course() == {
+        'J305N1': {student1, student2},
+        'J305N2': {student1},
+        'J305N3': set()
+    }
+    assert problem.list_students_by_course() is problem.list_students_by_course()
+
+def test_list_mandatory_shift_types_by_student() -> None:
+    shift1 = Shift(ShiftType.T, 1, 100, [])
+    shift2 = Shift(ShiftType.PL, 1, 30, [])
+    course1 = Course('J305N1', 3, [shift1, shift2])
+    course2 = Course('J305N2', 3, [shift1])
+
+    student1 = Student('A100', 3, [course1], Schedule([]))
+    student2 = Student('A200', 3, [course1, course2], Schedule([]))
+    student3 = Student('A300', 3, [course1], Schedule([]))
+
+    problem = SchedulingProblem([course1, course2], [student1, student2, student3])
+
+    mandatory_shift_types = problem.list_mandatory_shift_types_by_student()
+    assert mandatory_shift_types == {
+        'A100': {('J305N1', ShiftType.T), ('J305N1', ShiftType.PL)},
+        'A200': {('J305N1', ShiftType.T), ('J305N1', ShiftType.PL), ('J305N2', ShiftType.T)},
+        'A300': {('J305N1', ShiftType.T), ('J305N1', ShiftType.PL)}
+    }
+    assert mandatory_shift_types['A100'] is mandatory_shift_types['A300']
+
 def test_eq_none() -> None:
     assert SchedulingProblem([], []) != None
 
@@ -104,7 +189,7 @@ def test_eq_different_courses_same_keys() -> None:
     problem1 = SchedulingProblem([course1], [])
     problem2 = SchedulingProblem([course2], [])
 
-    assert problem1 == problem2 # NOTE: comparison does not check course contents
+    assert problem1 != problem2 # NOTE: comparison is structural
 
 def test_eq_different_students() -> None:
     student = Student('A100', 2, [], Schedule([]))
@@ -121,7 +206,76 @@ def test_eq_different_students_same_keys() -> None:
     problem1 = SchedulingProblem([], [student1])
     problem2 = SchedulingProblem([], [student2])
 
-    assert problem1 == problem2 # NOTE: comparison does not check student contents
+    assert problem1 != problem2 # NOTE: comparison is structural
+
+def test_eq_different_previous_schedules() -> None:
+    shift1 = Shift(ShiftType.T, 1, 100, [])
+    shift2 = Shift(ShiftType.T, 2, 100, [])
+    course = Course('J301N1', 1, [shift1, shift2])
+
+    student1 = Student('A100', 1, [course], Schedule([(course, shift1)]))
+    student2 = Student('A100', 1, [course], Schedule([(course, shift2)]))
+
+    problem1 = SchedulingProblem([course], [student1])
+    problem2 = SchedulingProblem([course], [student2])
+
+    assert problem1 != problem2
+
+def test_eq_equals_different_order() -> None:
+    course1 = Course('J301N1', 1, [])
+    course2 = Course('J301N2', 1, [])
+
+    problem1 = SchedulingProblem([course1, course2], [])
+    problem2 = SchedulingProblem([course2, course1], [])
+
+    assert problem1 == problem2
+
+def test_digest_cached() -> None:
+    problem = SchedulingProblem([], [])
+    assert problem.digest is problem.digest
+
+def test_hash_equals() -> None:
+    shift = Shift(ShiftType.T, 1, 100, [])
+
+    course1 = Course('J301N1', 1, [shift])
+    student1 = Student('A100', 1, [course1], Schedule([(course1, shift)]))
+    problem1 = SchedulingProblem([course1], [student1])
+
+    course2 = Course('J301N1', 1, [shift])
+    student2 = Student('A100', 1, [course2], Schedule([(course2, shift)]))
+    problem2 = SchedulingProblem([course2], [student2])
+
+    assert hash(problem1) == hash(problem2)
+    assert {problem1: True}[problem2]
+
+def test_hash_different() -> None:
+    problem1 = SchedulingProblem([Course('J301N1', 1, [])], [])
+    problem2 = SchedulingProblem([Course('J301N1', 2, [])], [])
+
+    assert hash(problem1) != hash(problem2)
+
+def test_pickle() -> None:
+    timeslot = Timeslot(Weekday.MONDAY, ScheduleTime(9, 0), ScheduleTime(10, 0))
+    shift1 = Shift(ShiftType.T, 1, 100, [timeslot])
+    shift2 = Shift(ShiftType.PL, 1, 30, [])
+    shift3 = Shift(ShiftType.PL, 2, 30, [timeslot])
+    course1 = Course('J305N1', 3, [shift1, shift2, shift3])
+    course2 = Course('J305N2', 3, [])
+
+    student1 = Student('A100', 3, [course1, course2], Schedule([(course1, shift3)]))
+    student2 = Student('A200', 2, [course1], Schedule([]))
+
+    problem = SchedulingProblem([course1, course2], [student1, student2])
+    unpickled_problem = pickle.loads(pickle.dumps(problem))
+
+    assert unpickled_problem == problem
+    assert repr(unpickled_problem) == repr(problem)
+
+    unpickled_course1 = unpickled_problem.courses['J305N1']
+    unpickled_student1 = unpickled_problem.students['A100']
+    assert unpickled_student1.enrollments['J305N1'] is unpickled_course1
+    assert unpickled_student1.previous_schedule.shifts['J305N1', ShiftType.PL] is \
+        unpickled_course1.shifts[ShiftType.PL][2]
 
 def test_copy() -> None:
     original_problem = SchedulingProblem([], [])
@@ -156,3 +156,56 @@ def test_repr() -> None:
 
     assert repr(schedule) == \
         f'Schedule(shifts=[({course2!r}, {shift!r}), ({course1!r}, {shift!r})])'
+
+def test_interned_same() -> None:
+    shift1 = Shift(ShiftType.T, 1, 100, [])
+    shift2 = Shift(ShiftType.PL, 1, 30, [])
+    course = Course('J301N1', 1, [shift1, shift2])
+
+    schedule = Schedule.interned([(course, shift1), (course, shift2)])
+
+    assert schedule == Schedule([(course, shift1), (course, shift2)])
+    assert Schedule.interned([(course, shift2), (course, shift1)]) is schedule
+
+def test_interned_different_courses_same_id() -> None:
+    shift = Shift(ShiftType.T, 1, 100, [])
+    course1 = Course('J301N1', 1, [shift])
+    course2 = Course('J301N1', 1, [shift])
+
+    schedule1 = Schedule.interned([(course1, shift)])
+    schedule2 = Schedule.interned([(course2, shift)])
+
+    assert schedule1 == schedule2
+    assert schedule1 is not schedule2
+
+def test_interned_repeated_shift() -> None:
+    shift = Shift(ShiftType.T, 1, 100, [])
+    course = Course('J301N1', 1, [shift])
+
+    schedule = Schedule.interned([(course, shift)])
+    assert schedule is not None
+
+    with pytest.raises(ScheduleError):
+        Schedule.interned([(course, shift), (course, shift)])
+
+def test_interned_invalid() -> None:
+    shift = Shift(ShiftType.T, 1, 100, [])
+    course = Course('J301N1', 1, [])
+
+    with pytest.raises(ScheduleError):
+        Schedule.interned([(course, shift)])
+
+def test_interned_unvalidated() -> None:
+    shift1 = Shift(ShiftType.T, 1, 100, [])
+    shift2 = Shift(ShiftType.T, 2, 100, [])
+    course = Course('J301N1', 1, [shift1, shift2])
+
+    # Schedules interned without validation aren't handed to callers that validate
+    Schedule.interned([(course, shift1), (course, shift2)], validate=False)
+    with pytest.raises(ScheduleError):
+        Schedule.interned([(course, shift1), (course, shift2)])
+
+    unvalidated_schedule = Schedule.interned([(course, shift1)], validate=False)
+    validated_schedule = Schedule.interned([(course, shift1)])
+    assert validated_schedule is not unvalidated_schedule
+    assert Schedule.interned([(course, shift1)], validate=False) is validated_schedule
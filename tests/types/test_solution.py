@@ -1,6 +1,8 @@
 import copy
+import pickle
 import pytest
 
+from kepler.types.columnar import ColumnarSchedulingProblem
 from kepler.types.course import Course
 from kepler.types.problem import SchedulingProblem
 from kepler.types.schedule import Schedule
@@ -68,6 +70,105 @@ def test_init_incomplete_schedule() -> None:
     with pytest.raises(SchedulingProblemSolutionError):
         SchedulingProblemSolution(problem, final_schedules)
 
+def test_init_without_validation() -> None:
+    student = Student('A100', 1, [], Schedule([]))
+    problem = SchedulingProblem([], [student])
+    solution = SchedulingProblemSolution(problem, {}, validate=False)
+
+    assert solution.final_schedules == {}
+
+    with pytest.raises(SchedulingProblemSolutionError):
+        solution.validate()
+
+def test_init_columnar_problem() -> None:
+    shift = Shift(ShiftType.T, 1, 120, [])
+    course = Course('J301N1', 1, [shift])
+    student = Student('A100', 1, [course], Schedule([]))
+    problem = SchedulingProblem([course], [student])
+    columnar_problem = ColumnarSchedulingProblem.from_problem(problem)
+
+    solution = SchedulingProblemSolution(
+        columnar_problem, {'A100': Schedule([(course, shift)])}, validate=False
+    )
+    assert solution.columnar_problem is columnar_problem
+
+    solution.validate()
+    assert solution.problem == problem
+    assert solution == SchedulingProblemSolution(problem, {'A100': Schedule([(course, shift)])})
+
+def test_columnar_problem_not_materialized(monkeypatch: pytest.MonkeyPatch) -> None:
+    shift1 = Shift(ShiftType.T, 1, 120, [])
+    shift2 = Shift(ShiftType.T, 2, 120, [])
+    course = Course('J301N1', 1, [shift1, shift2])
+    student1 = Student('A100', 1, [course], Schedule([]))
+    student2 = Student('A200', 1, [course], Schedule([(course, shift2)]))
+    problem = SchedulingProblem([course], [student1, student2])
+    final_schedules = {'A100': Schedule([(course, shift1)]), 'A200': Schedule([(course, shift2)])}
+
+    # Validation, digests, pickling and repr only read the columnar problem's arrays
+    monkeypatch.setattr(ColumnarSchedulingProblem, 'to_problem', None)
+    columnar_problem = ColumnarSchedulingProblem.from_problem(problem)
+    solution = SchedulingProblemSolution(columnar_problem, final_schedules)
+
+    assert solution == SchedulingProblemSolution(problem, final_schedules)
+    assert repr(solution).startswith(f'SchedulingProblemSolution(problem={columnar_problem!r}, ')
+
+    unpickled_solution = pickle.loads(pickle.dumps(solution))
+    assert unpickled_solution == solution
+    assert unpickled_solution.columnar_problem is not None
+    assert unpickled_solution.final_schedules['A200'].shifts['J301N1', ShiftType.T] is \
+        unpickled_solution.columnar_problem.courses[0].shifts[ShiftType.T][2]
+
+@pytest.mark.parametrize('final_schedules,error', [
+    ({'A100': Schedule([]), 'A300': Schedule([])}, 'Schedule for unknown student A300'),
+    ({'A100': Schedule([])}, 'Missing schedule for student A200'),
+    ({'A100': Schedule([]), 'A200': Schedule([])}, 'Incomplete schedule for student A200')
+])
+def test_validate_columnar_problem(final_schedules: dict[str, Schedule], error: str) -> None:
+    shift = Shift(ShiftType.T, 1, 120, [])
+    course = Course('J301N1', 1, [shift])
+    student1 = Student('A100', 1, [], Schedule([]))
+    student2 = Student('A200', 1, [course], Schedule([]))
+    problem = ColumnarSchedulingProblem.from_problem(
+        SchedulingProblem([course], [student1, student2])
+    )
+
+    with pytest.raises(SchedulingProblemSolutionError) as einfo:
+        SchedulingProblemSolution(problem, final_schedules)
+
+    assert str(einfo.value) == error
+
+def test_validate_columnar_problem_invalid_schedule() -> None:
+    shift = Shift(ShiftType.T, 1, 120, [])
+    course1 = Course('J301N1', 1, [shift])
+    course2 = Course('J301N2', 1, [shift])
+    student = Student('A100', 1, [course1], Schedule([]))
+    problem = ColumnarSchedulingProblem.from_problem(
+        SchedulingProblem([course1, course2], [student])
+    )
+
+    with pytest.raises(SchedulingProblemSolutionError) as einfo:
+        SchedulingProblemSolution(problem, {'A100': Schedule([(course2, shift)])})
+
+    assert str(einfo.value) == 'Invalid schedule for student A100'
+
+def test_validate_shared_schedule() -> None:
+    shift = Shift(ShiftType.T, 1, 120, [])
+    course1 = Course('J301N1', 1, [shift])
+    course2 = Course('J301N2', 1, [shift])
+
+    student1 = Student('A100', 1, [course1], Schedule([]))
+    student2 = Student('A200', 1, [course1, course2], Schedule([]))
+    problem = SchedulingProblem([course1, course2], [student1, student2])
+
+    schedule = Schedule([(course1, shift)])
+    solution = SchedulingProblemSolution(problem, {'A100': schedule, 'A200': schedule}, False)
+
+    with pytest.raises(SchedulingProblemSolutionError) as einfo:
+        solution.validate()
+
+    assert str(einfo.value) == 'Incomplete schedule for student A200'
+
 def test_eq_none() -> None:
     assert SchedulingProblemSolution(SchedulingProblem([], []), {}) != None
 
@@ -105,6 +206,55 @@ def test_eq_different_final_schedules() -> None:
 
     assert solution1 != solution2
 
+def test_hash_equals() -> None:
+    shift = Shift(ShiftType.T, 1, 120, [])
+    course = Course('J301N1', 1, [shift])
+    student = Student('A100', 1, [course], Schedule([]))
+
+    problem1 = SchedulingProblem([course], [student])
+    problem2 = SchedulingProblem([course], [student])
+
+    solution1 = SchedulingProblemSolution(problem1, {'A100': Schedule([(course, shift)])})
+    solution2 = SchedulingProblemSolution(problem2, {'A100': Schedule([(course, shift)])})
+
+    assert solution1 == solution2
+    assert hash(solution1) == hash(solution2)
+
+def test_hash_different_final_schedules() -> None:
+    shift1 = Shift(ShiftType.T, 1, 120, [])
+    shift2 = Shift(ShiftType.T, 2, 120, [])
+    course = Course('J301N1', 1, [shift1, shift2])
+
+    student = Student('A100', 1, [course], Schedule([]))
+    problem = SchedulingProblem([course], [student])
+
+    solution1 = SchedulingProblemSolution(problem, {'A100': Schedule([(course, shift1)])})
+    solution2 = SchedulingProblemSolution(problem, {'A100': Schedule([(course, shift2)])})
+
+    assert hash(solution1) != hash(solution2)
+
+def test_pickle() -> None:
+    shift1 = Shift(ShiftType.T, 1, 120, [])
+    shift2 = Shift(ShiftType.T, 2, 120, [])
+    course = Course('J301N1', 1, [shift1, shift2])
+
+    student1 = Student('A100', 1, [course], Schedule([]))
+    student2 = Student('A200', 1, [course], Schedule([]))
+    problem = SchedulingProblem([course], [student1, student2])
+
+    solution = SchedulingProblemSolution(problem, {
+        'A100': Schedule([(course, shift1)]),
+        'A200': Schedule([(course, shift2)])
+    })
+    unpickled_solution = pickle.loads(pickle.dumps(solution))
+
+    assert unpickled_solution == solution
+    assert repr(unpickled_solution) == repr(solution)
+
+    unpickled_course = unpickled_solution.problem.courses['J301N1']
+    assert unpickled_solution.final_schedules['A200'].shifts['J301N1', ShiftType.T] is \
+        unpickled_course.shifts[ShiftType.T][2]
+
 def test_copy() -> None:
     original_solution = SchedulingProblemSolution(SchedulingProblem([], []), {})
     copied_solution = copy.copy(original_solution)
@@ -1,4 +1,5 @@
 import copy
+import pickle
 import pytest
 
 from kepler.types.time import ScheduleTime, ScheduleTimeError
@@ -112,6 +113,13 @@ def test_hash_different_minute() -> None:
 
     assert hash(time1) != hash(time2)
 
+def test_pickle() -> None:
+    time = ScheduleTime(9, 5)
+    unpickled_time = pickle.loads(pickle.dumps(time))
+
+    assert unpickled_time == time
+    assert unpickled_time is ScheduleTime.interned(9, 5)
+
 def test_str() -> None:
     assert str(ScheduleTime(9, 5)) == '09:05'
 
@@ -128,3 +136,19 @@ def test_parse_invalid_structure() -> None:
 def test_parse_invalid_content() -> None:
     with pytest.raises(ScheduleTimeError):
         ScheduleTime.parse('24:01')
+
+def test_parse_interned() -> None:
+    assert ScheduleTime.parse('14:00') is ScheduleTime.parse('14:00')
+
+def test_interned_same() -> None:
+    time = ScheduleTime.interned(9, 30)
+
+    assert time == ScheduleTime(9, 30)
+    assert ScheduleTime.interned(9, 30) is time
+
+def test_interned_different() -> None:
+    assert ScheduleTime.interned(9, 30) is not ScheduleTime.interned(9, 31)
+
+def test_interned_invalid() -> None:
+    with pytest.raises(ScheduleTimeError):
+        ScheduleTime.interned(24, 1)
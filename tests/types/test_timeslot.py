@@ -1,4 +1,5 @@
 import copy
+import pickle
 import pytest
 
 from kepler.types.time import ScheduleTime
@@ -155,6 +156,13 @@ def test_hash_different_end() -> None:
 
     assert hash(timeslot1) != hash(timeslot2)
 
+def test_pickle() -> None:
+    timeslot = Timeslot(Weekday.THURSDAY, ScheduleTime(14, 0), ScheduleTime(16, 0))
+    unpickled_timeslot = pickle.loads(pickle.dumps(timeslot))
+
+    assert unpickled_timeslot == timeslot
+    assert unpickled_timeslot.start is ScheduleTime.interned(14, 0)
+
 def test_repr() -> None:
     timeslot = Timeslot(Weekday.THURSDAY, ScheduleTime(14, 0), ScheduleTime(16, 0))
 
@@ -164,3 +172,19 @@ def test_repr() -> None:
         'start=ScheduleTime(hour=14, minute=0), '
         'end=ScheduleTime(hour=16, minute=0))'
     )
+
+def test_interned_same() -> None:
+    timeslot = Timeslot.interned(Weekday.MONDAY, ScheduleTime(9, 0), ScheduleTime(10, 0))
+
+    assert timeslot == Timeslot(Weekday.MONDAY, ScheduleTime(9, 0), ScheduleTime(10, 0))
+    assert Timeslot.interned(Weekday.MONDAY, ScheduleTime(9, 0), ScheduleTime(10, 0)) is timeslot
+
+def test_interned_different() -> None:
+    timeslot1 = Timeslot.interned(Weekday.MONDAY, ScheduleTime(9, 0), ScheduleTime(10, 0))
+    timeslot2 = Timeslot.interned(Weekday.FRIDAY, ScheduleTime(9, 0), ScheduleTime(10, 0))
+
+    assert timeslot1 is not timeslot2
+
+def test_interned_invalid() -> None:
+    with pytest.raises(TimeslotError):
+        Timeslot.interned(Weekday.MONDAY, ScheduleTime(10, 0), ScheduleTime(9, 0))